@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark Script
+Measures how long `import main` takes and how long a freshly started
+server needs before it answers its first API request.
+
+Usage: python benchmark_startup.py [--runs 5] [--port 9100] [--path /api/meetings] [--top 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+
+
+def run_python(*args) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter in the project directory"""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+def measure_interpreter(runs: int) -> list:
+    """Bare interpreter start, the floor for everything else"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_python("-c", "pass")
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def measure_import(runs: int) -> list:
+    """Time spent in `import main`, each run in a new process"""
+    return [float(run_python("-c", IMPORT_SNIPPET).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+
+
+def slowest_imports(top: int) -> list:
+    """Modules imported directly by main.py, by cumulative import time"""
+    output = run_python("-X", "importtime", "-c", "import main").stderr
+    entries = []
+    main_depth = None
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        depth = len(name) - len(name.lstrip())
+        entries.append((depth, int(cumulative), name.strip()))
+        if name.strip() == "main":
+            main_depth = depth
+
+    # Children are printed before their parent, two spaces deeper
+    direct = [(us, module) for depth, us, module in entries if depth == (main_depth or 1) + 2]
+    return sorted(direct, reverse=True)[:top]
+
+
+def measure_first_response(runs: int, port: int, path: str, timeout: float, preload: bool) -> list:
+    """Seconds from launching uvicorn until the first 200 response.
+
+    WHISPER_PRELOAD is set explicitly so the result doesn't depend on the
+    caller's environment; preloading competes with the first request for CPU.
+    """
+    env = {**os.environ, "WHISPER_PRELOAD": "true" if preload else "false"}
+    url = f"http://127.0.0.1:{port}{path}"
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"Server exited with code {server.returncode}")
+                if time.perf_counter() - started > timeout:
+                    raise RuntimeError(f"No response from {url} within {timeout:.0f}s")
+                try:
+                    with urllib.request.urlopen(url, timeout=1) as response:
+                        if response.status == 200:
+                            break
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(0.01)
+            timings.append(time.perf_counter() - started)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    return timings
+
+
+def report(label: str, timings: list):
+    print(f"  {label:<30} median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"min {min(timings) * 1000:8.1f} ms   max {max(timings) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and time-to-first-response")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    parser.add_argument("--port", type=int, default=9100, help="Port for the benchmark server")
+    parser.add_argument("--path", default="/api/meetings", help="Endpoint requested as the first response")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for the server")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    print(f"🚀 Startup benchmark ({args.runs} runs, Python {sys.version.split()[0]})")
+    report("interpreter start", measure_interpreter(args.runs))
+    report("import main", measure_import(args.runs))
+    for preload in (False, True):
+        report(f"first response, preload {'on' if preload else 'off'}",
+               measure_first_response(args.runs, args.port, args.path, args.timeout, preload))
+
+    print(f"\n🐢 Slowest imports in main.py (cumulative)")
+    for us, module in slowest_imports(args.top):
+        print(f"  {us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
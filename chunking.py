@@ -0,0 +1,95 @@
+import re
+from typing import List, Optional
+
+# Rough English average for Llama-style tokenizers; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a piece of text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_sentences(text: str, max_tokens: Optional[int] = None) -> List[str]:
+    """Split text into sentences, breaking up any that exceed a sane length
+    (200 words, or max_tokens if that is less)"""
+    sentences = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        # Whisper output sometimes has no punctuation for minutes at a time
+        piece: List[str] = []
+        piece_chars = 0
+        for word in sentence.split():
+            too_long = max_tokens is not None and piece_chars + len(word) > max_tokens * CHARS_PER_TOKEN
+            if piece and (len(piece) == 200 or too_long):
+                sentences.append(' '.join(piece))
+                piece = []
+                piece_chars = 0
+            piece.append(word)
+            piece_chars += len(word) + 1
+        sentences.append(' '.join(piece))
+    return sentences
+
+
+def split_transcript(text: str, max_tokens: int, overlap_tokens: int = 0) -> List[str]:
+    """Split text into chunks of at most ~max_tokens at sentence boundaries.
+
+    Consecutive chunks share up to overlap_tokens of trailing sentences so
+    context that straddles a boundary is seen by both chunks.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text.strip()] if text.strip() else []
+
+    overlap_tokens = min(overlap_tokens, max_tokens // 2)
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+
+    # A sentence plus the overlap carried before it must still fit in a chunk
+    for sentence in split_sentences(text, max_tokens - overlap_tokens - 1):
+        sentence_tokens = estimate_tokens(sentence) + 1
+        if current and current_tokens + sentence_tokens > max_tokens:
+            chunks.append(' '.join(current))
+
+            # Carry the tail of this chunk into the next one
+            overlap: List[str] = []
+            overlap_size = 0
+            for previous in reversed(current):
+                previous_tokens = estimate_tokens(previous) + 1
+                if overlap_size + previous_tokens > overlap_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += previous_tokens
+            current = overlap
+            current_tokens = overlap_size
+
+        current.append(sentence)
+        current_tokens += sentence_tokens
+
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+
+def group_by_budget(parts: List[str], max_tokens: int) -> List[List[str]]:
+    """Group consecutive parts so each group fits in max_tokens"""
+    groups: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for part in parts:
+        part_tokens = estimate_tokens(part)
+        if current and current_tokens + part_tokens > max_tokens:
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(part)
+        current_tokens += part_tokens
+
+    if current:
+        groups.append(current)
+    return groups
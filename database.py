@@ -1,20 +1,168 @@
 import sqlite3
 import json
+import base64
+import threading
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Union
 import uuid
 
+# Applied to every pooled connection. WAL lets readers run alongside a
+# writer, and NORMAL sync is durable enough in WAL mode (only a power loss
+# can drop the last commits, never corrupt the file)
+CONNECTION_PRAGMAS = [
+    'journal_mode = WAL',
+    'synchronous = NORMAL',
+    'busy_timeout = 5000',
+    'foreign_keys = ON',
+    'mmap_size = 268435456',
+    'cache_size = -20000',
+    'temp_store = MEMORY'
+]
+
+# Compiled statements kept per connection (the queries here are fixed strings)
+STATEMENT_CACHE_SIZE = 256
+
+# Large text fields stored compressed in meeting_content instead of the
+# meetings rows, so scans and lists never read them. The transcript is last:
+# SQLite only follows a record's overflow pages as far as the column it needs
+CONTENT_FIELDS = ['executive_summary', 'discussion_notes', 'action_items', 'meeting_outline', 'transcript']
+
+# Meeting columns that update_meeting(s) may set directly
+MEETING_COLUMNS = ['title', 'agenda', 'scheduled_date', 'scheduled_time', 'status',
+                   'audio_file_path', 'word_count', 'duration_seconds']
+
+# Text shorter than this is stored as is; zlib saves nothing on it
+COMPRESS_MIN_BYTES = 256
+COMPRESSION_LEVEL = 6
+
+# Columns shown in meeting lists; transcripts and notes are left on disk
+MEETING_SUMMARY_COLUMNS = '''
+    id, title, agenda, scheduled_date, scheduled_time, created_at, updated_at,
+    status, word_count, duration_seconds,
+    EXISTS (
+        SELECT 1 FROM meeting_content c
+        WHERE c.meeting_id = meetings.id AND c.transcript IS NOT NULL
+    ) AS has_notes
+'''
+
+# Meeting fields in the full-text index, with their bm25 weights (a hit in
+# the title counts for more than one somewhere in a long transcript)
+SEARCH_COLUMNS = {
+    'title': 10.0,
+    'agenda': 4.0,
+    'participants': 4.0,
+    'executive_summary': 3.0,
+    'action_items': 3.0,
+    'meeting_outline': 2.0,
+    'transcript': 1.0
+}
+
 class MeetingDatabase:
     def __init__(self, db_path: str = "meetings.db"):
         self.db_path = db_path
+        self.fts_enabled = False
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's pooled connection, opened and tuned on first use.
+
+        A transaction left open by a call that failed half-way is rolled
+        back, so every method starts clean as it did with a fresh connection.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=5,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(f'PRAGMA {pragma}')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        elif conn.in_transaction:
+            conn.rollback()
+        return conn
+    
+    def close(self):
+        """Close every pooled connection (on shutdown)"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+    
     def init_database(self):
-        """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        """Bring the schema up to date and sync the search index"""
+        conn = self._connect()
+        applied = self._apply_migrations(conn)
+        
         cursor = conn.cursor()
+        self._init_search_index(cursor)
+        conn.commit()
+        
+        if applied:
+            # Give the space of moved text and rebuilt tables back to the file system
+            conn.execute('VACUUM')
+            report = self.storage_report()
+            if report['original_bytes']:
+                print(f"Compressed notes of {report['meetings_with_content']} meetings: "
+                      f"{report['original_bytes']:,} bytes stored in {report['stored_bytes']:,} "
+                      f"({report['saved_percent']}% saved; {report['net_saved_percent']}% counting the "
+                      f"search index), database now {report['database_bytes']:,} bytes")
+    
+    # SCHEMA MIGRATIONS
+    
+    def _migrations(self) -> List[Callable]:
+        """Schema migrations in order. PRAGMA user_version counts how many have
+        run; add new ones at the end and never change one that has shipped."""
+        return [
+            self._migrate_initial_schema,
+            self._migrate_content_out_of_row,
+            self._migrate_cascade_deletes,
+            self._migrate_hot_query_indexes,
+            self._migrate_transcript_segments,
+            self._migrate_stats_counters
+        ]
+    
+    def _apply_migrations(self, conn: sqlite3.Connection) -> int:
+        """Run the migrations this database has not had yet, each in its own
+        transaction together with its user_version bump"""
+        migrations = self._migrations()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version > len(migrations):
+            raise RuntimeError(f"{self.db_path} has schema version {version}, "
+                               f"newer than this version of the app supports ({len(migrations)})")
+        
+        # Migrations may rebuild tables, which needs foreign keys off; those
+        # that do check the keys themselves before committing
+        conn.execute('PRAGMA foreign_keys = OFF')
+        try:
+            for number, migration in enumerate(migrations[version:], version + 1):
+                cursor = conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                try:
+                    migration(cursor)
+                    cursor.execute(f'PRAGMA user_version = {number}')
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                print(f"Applied database migration {number}: {migration.__doc__.splitlines()[0]}")
+        finally:
+            conn.execute('PRAGMA foreign_keys = ON')
         
+        return len(migrations) - version
+    
+    def _migrate_initial_schema(self, cursor):
+        """Tables as they were before versioned migrations"""
         # Create meetings table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS meetings (
@@ -37,6 +185,15 @@ class MeetingDatabase:
             )
         ''')
         
+        # Transcript and notes of each meeting, compressed (see CONTENT_FIELDS)
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS meeting_content (
+                meeting_id TEXT PRIMARY KEY,
+                {', '.join(f'{field} BLOB' for field in CONTENT_FIELDS)},
+                FOREIGN KEY (meeting_id) REFERENCES meetings (id)
+            )
+        ''')
+        
         # Create participants table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS participants (
@@ -58,50 +215,500 @@ class MeetingDatabase:
                 FOREIGN KEY (meeting_id) REFERENCES meetings (id)
             )
         ''')
+
+        # Create jobs table for queued audio processing
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                meeting_id TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                stage TEXT,
+                progress INTEGER DEFAULT 0,
+                message TEXT,
+                audio_path TEXT,
+                file_extension TEXT,
+                options TEXT,
+                audio_hash TEXT,
+                result TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                FOREIGN KEY (meeting_id) REFERENCES meetings (id)
+            )
+        ''')
+
+        # Cache of transcripts by audio content, so re-uploads skip Whisper
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS transcript_cache (
+                audio_hash TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                decode_options TEXT NOT NULL,
+                transcript TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (audio_hash, model_name, decode_options)
+            )
+        ''')
+
+        # Newest-first listing and its keyset pagination walk this index
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_meetings_schedule
+            ON meetings (scheduled_date, scheduled_time, id)
+        ''')
+
+        # Columns added after the first release of a table
+        self._add_column_if_missing(cursor, 'jobs', 'options', 'TEXT')
+        self._add_column_if_missing(cursor, 'jobs', 'audio_hash', 'TEXT')
+    
+    def _migrate_content_out_of_row(self, cursor, batch_size: int = 100):
+        """Move transcripts and notes out of meetings rows into compressed meeting_content"""
+        inline = ' OR '.join(f'{field} IS NOT NULL' for field in CONTENT_FIELDS)
         
-        conn.commit()
-        conn.close()
+        while True:
+            cursor.execute(f'SELECT id, {", ".join(CONTENT_FIELDS)} FROM meetings WHERE {inline} LIMIT ?',
+                           (batch_size,))
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            
+            for meeting_id, *values in rows:
+                self._save_content(cursor, meeting_id, dict(zip(CONTENT_FIELDS, values)))
+            cursor.executemany(
+                f'UPDATE meetings SET {", ".join(f"{field} = NULL" for field in CONTENT_FIELDS)} WHERE id = ?',
+                [(row[0],) for row in rows]
+            )
+    
+    def _migrate_cascade_deletes(self, cursor):
+        """Delete participants, tags, content and jobs together with their meeting"""
+        cursor.execute('''
+            CREATE TABLE participants_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                meeting_id TEXT NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,
+                name TEXT NOT NULL,
+                email TEXT,
+                role TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE tags_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                meeting_id TEXT NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,
+                tag TEXT NOT NULL
+            )
+        ''')
+        cursor.execute(f'''
+            CREATE TABLE meeting_content_new (
+                meeting_id TEXT PRIMARY KEY REFERENCES meetings (id) ON DELETE CASCADE,
+                {', '.join(f'{field} BLOB' for field in CONTENT_FIELDS)}
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE jobs_new (
+                id TEXT PRIMARY KEY,
+                meeting_id TEXT NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,
+                status TEXT NOT NULL DEFAULT 'queued',
+                stage TEXT,
+                progress INTEGER DEFAULT 0,
+                message TEXT,
+                audio_path TEXT,
+                file_extension TEXT,
+                options TEXT,
+                audio_hash TEXT,
+                result TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            )
+        ''')
+        
+        # Rows of meetings deleted before the foreign keys were enforced are dropped
+        for table in ['participants', 'tags', 'meeting_content', 'jobs']:
+            cursor.execute(f'PRAGMA table_info({table}_new)')
+            columns = ', '.join(row[1] for row in cursor.fetchall())
+            cursor.execute(f'''
+                INSERT INTO {table}_new ({columns})
+                SELECT {columns} FROM {table}
+                WHERE meeting_id IN (SELECT id FROM meetings)
+            ''')
+            cursor.execute(f'DROP TABLE {table}')
+            cursor.execute(f'ALTER TABLE {table}_new RENAME TO {table}')
+        
+        cursor.execute('PRAGMA foreign_key_check')
+        if cursor.fetchone():
+            raise RuntimeError("Rows with broken foreign keys left after rebuilding tables")
+    
+    def _migrate_hot_query_indexes(self, cursor):
+        """Index child tables by meeting and the status-filtered meeting list"""
+        # Meeting lookups, deletes (and their cascades) and participant counts
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_participants_meeting ON participants (meeting_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tags_meeting ON tags (meeting_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_meeting ON jobs (meeting_id, created_at)')
+        # Status-filtered listing with keyset pagination, newest first
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_meetings_status_schedule
+            ON meetings (status, scheduled_date, scheduled_time, id)
+        ''')
+        # The job queue: oldest queued job first, and queue positions
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at)')
+    
+    def _migrate_transcript_segments(self, cursor):
+        """Store Whisper's timestamped segments per meeting and in the transcript cache"""
+        # Times in milliseconds; segments are clustered by meeting in spoken order
+        cursor.execute('''
+            CREATE TABLE transcript_segments (
+                meeting_id TEXT NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,
+                seq INTEGER NOT NULL,
+                start_ms INTEGER NOT NULL,
+                end_ms INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                avg_logprob REAL,
+                PRIMARY KEY (meeting_id, seq)
+            ) WITHOUT ROWID
+        ''')
+        # Finds the segment playing at a given time
+        cursor.execute('CREATE INDEX idx_segments_time ON transcript_segments (meeting_id, end_ms)')
+        
+        self._add_column_if_missing(cursor, 'transcript_cache', 'segments', 'BLOB')
+        self._add_column_if_missing(cursor, 'transcript_cache', 'duration_seconds', 'REAL')
+    
+    def _migrate_stats_counters(self, cursor):
+        """Dashboard counters kept up to date by triggers on meetings"""
+        cursor.execute('''
+            CREATE TABLE meeting_stats (
+                status TEXT PRIMARY KEY,
+                meetings INTEGER NOT NULL DEFAULT 0,
+                words INTEGER NOT NULL DEFAULT 0,
+                duration_seconds INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        # Meetings by the Monday of the week they are scheduled in
+        cursor.execute('''
+            CREATE TABLE meeting_weekly_stats (
+                week TEXT PRIMARY KEY,
+                meetings INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        def add(row: str, sign: str) -> str:
+            """Statements adding (sign '+') or removing ('-') one meetings row"""
+            week = f"date({row}.scheduled_date, 'weekday 0', '-6 days')"
+            drop_empty = f'DELETE FROM meeting_weekly_stats WHERE week = {week} AND meetings <= 0;' if sign == '-' else ''
+            return f'''
+                INSERT INTO meeting_stats (status, meetings, words, duration_seconds)
+                VALUES (IFNULL({row}.status, 'planned'), {sign}1, {sign}IFNULL({row}.word_count, 0),
+                        {sign}IFNULL({row}.duration_seconds, 0))
+                ON CONFLICT (status) DO UPDATE SET
+                    meetings = meetings + excluded.meetings,
+                    words = words + excluded.words,
+                    duration_seconds = duration_seconds + excluded.duration_seconds;
+                INSERT INTO meeting_weekly_stats (week, meetings)
+                SELECT week, {sign}1 FROM (SELECT {week} AS week) WHERE week IS NOT NULL
+                ON CONFLICT (week) DO UPDATE SET meetings = meetings + excluded.meetings;
+                {drop_empty}
+            '''
+        
+        cursor.execute(f'''
+            CREATE TRIGGER meeting_stats_insert AFTER INSERT ON meetings
+            BEGIN {add('NEW', '+')} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER meeting_stats_delete AFTER DELETE ON meetings
+            BEGIN {add('OLD', '-')} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER meeting_stats_update
+            AFTER UPDATE OF status, word_count, duration_seconds, scheduled_date ON meetings
+            WHEN OLD.status IS NOT NEW.status OR OLD.word_count IS NOT NEW.word_count
+                 OR OLD.duration_seconds IS NOT NEW.duration_seconds
+                 OR OLD.scheduled_date IS NOT NEW.scheduled_date
+            BEGIN {add('OLD', '-')} {add('NEW', '+')} END
+        ''')
+        
+        cursor.execute('''
+            INSERT INTO meeting_stats (status, meetings, words, duration_seconds)
+            SELECT IFNULL(status, 'planned'), COUNT(*), SUM(IFNULL(word_count, 0)),
+                   SUM(IFNULL(duration_seconds, 0))
+            FROM meetings GROUP BY 1
+        ''')
+        cursor.execute('''
+            INSERT INTO meeting_weekly_stats (week, meetings)
+            SELECT date(scheduled_date, 'weekday 0', '-6 days') AS week, COUNT(*)
+            FROM meetings WHERE week IS NOT NULL GROUP BY week
+        ''')
+    
+    @staticmethod
+    def _pack_content(text: Optional[str]) -> Union[str, bytes, None]:
+        """Stored form of a content field: zlib-compressed bytes, or short text as is"""
+        if not text:
+            return None
+        data = text.encode('utf-8')
+        if len(data) < COMPRESS_MIN_BYTES:
+            return text
+        return zlib.compress(data, COMPRESSION_LEVEL)
+    
+    @staticmethod
+    def _unpack_content(value: Union[str, bytes, None]) -> Optional[str]:
+        """Text of a stored content field"""
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode('utf-8')
+        return value
+    
+    @staticmethod
+    def _content_upsert(columns: List[str]) -> str:
+        """Statement writing the given content columns of one meeting"""
+        return f'''
+            INSERT INTO meeting_content (meeting_id, {', '.join(columns)})
+            VALUES (?, {', '.join('?' for _ in columns)})
+            ON CONFLICT (meeting_id) DO UPDATE SET
+                {', '.join(f'{column} = excluded.{column}' for column in columns)}
+        '''
+    
+    def _save_content(self, cursor, meeting_id: str, fields: Dict):
+        """Write some of a meeting's content fields, compressed"""
+        columns = [field for field in CONTENT_FIELDS if field in fields]
+        if not columns:
+            return
+        
+        cursor.execute(self._content_upsert(columns),
+                       [meeting_id] + [self._pack_content(fields[column]) for column in columns])
+    
+    def _load_content(self, cursor, meeting_id: str, fields: List[str] = None) -> Dict:
+        """Decompressed content fields of a meeting (None where not set)"""
+        fields = fields or CONTENT_FIELDS
+        cursor.execute(f'SELECT {", ".join(fields)} FROM meeting_content WHERE meeting_id = ?',
+                       (meeting_id,))
+        row = cursor.fetchone() or [None] * len(fields)
+        return {field: self._unpack_content(value) for field, value in zip(fields, row)}
+    
+    def storage_report(self) -> Dict:
+        """Size of the stored transcripts and notes against their uncompressed size.
+
+        saved_* covers the compression of meeting_content alone. The search
+        index keeps an uncompressed copy of the same text (plus titles,
+        agendas and participants) in its shadow tables; it is reported under
+        search_index and included in total_stored_bytes and net_saved_*.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        original_bytes = stored_bytes = 0
+        fields = {field: {"original_bytes": 0, "stored_bytes": 0} for field in CONTENT_FIELDS}
+        cursor.execute(f'SELECT {", ".join(CONTENT_FIELDS)} FROM meeting_content')
+        for row in cursor:
+            for field, value in zip(CONTENT_FIELDS, row):
+                if value is None:
+                    continue
+                stored = len(value) if isinstance(value, bytes) else len(value.encode('utf-8'))
+                original = len(self._unpack_content(value).encode('utf-8'))
+                fields[field]["stored_bytes"] += stored
+                fields[field]["original_bytes"] += original
+                stored_bytes += stored
+                original_bytes += original
+        
+        search_text_bytes = search_index_bytes = 0
+        if self.fts_enabled:
+            text_lengths = ' + '.join(f'COALESCE(LENGTH(CAST(c{column} AS BLOB)), 0)'
+                                      for column in range(len(SEARCH_COLUMNS)))
+            search_text_bytes = conn.execute(
+                f'SELECT COALESCE(SUM({text_lengths}), 0) FROM meetings_fts_content'
+            ).fetchone()[0]
+            search_index_bytes = conn.execute(
+                'SELECT COALESCE(SUM(LENGTH(block)), 0) FROM meetings_fts_data'
+            ).fetchone()[0] + conn.execute(
+                'SELECT COALESCE(SUM(LENGTH(sz)), 0) FROM meetings_fts_docsize'
+            ).fetchone()[0]
+        total_stored_bytes = stored_bytes + search_text_bytes + search_index_bytes
+        
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        cursor.execute('SELECT COUNT(*) FROM meeting_content')
+        
+        return {
+            "meetings_with_content": cursor.fetchone()[0],
+            "original_bytes": original_bytes,
+            "stored_bytes": stored_bytes,
+            "saved_bytes": original_bytes - stored_bytes,
+            "saved_percent": round(100 * (1 - stored_bytes / original_bytes), 1) if original_bytes else 0.0,
+            "fields": fields,
+            "search_index": {
+                "enabled": self.fts_enabled,
+                "text_bytes": search_text_bytes,
+                "index_bytes": search_index_bytes
+            },
+            "total_stored_bytes": total_stored_bytes,
+            "net_saved_bytes": original_bytes - total_stored_bytes,
+            "net_saved_percent": (round(100 * (1 - total_stored_bytes / original_bytes), 1)
+                                  if original_bytes else 0.0),
+            "database_bytes": page_size * page_count
+        }
+    
+    def _init_search_index(self, cursor):
+        """Create the FTS5 index (if SQLite has FTS5) and fill it for existing meetings.
+
+        meetings_fts_rows gives every meeting a stable integer rowid in the
+        index, so one meeting's entry can be replaced without a scan.
+        """
+        try:
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+                    {', '.join(SEARCH_COLUMNS)},
+                    tokenize = 'porter unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search unavailable ({e}); falling back to LIKE search")
+            return
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS meetings_fts_rows (
+                fts_rowid INTEGER PRIMARY KEY,
+                meeting_id TEXT NOT NULL UNIQUE
+            )
+        ''')
+        self.fts_enabled = True
+        
+        cursor.execute('SELECT COUNT(*) FROM meetings')
+        meeting_count = cursor.fetchone()[0]
+        cursor.execute('SELECT COUNT(*) FROM meetings_fts_rows')
+        if cursor.fetchone()[0] != meeting_count:
+            print(f"Building search index for {meeting_count} meetings...")
+            cursor.execute('DELETE FROM meetings_fts')
+            cursor.execute('DELETE FROM meetings_fts_rows')
+            cursor.execute('SELECT id FROM meetings')
+            for (meeting_id,) in cursor.fetchall():
+                self._index_meeting(cursor, meeting_id)
+    
+    def _index_meeting(self, cursor, meeting_id: str):
+        """Add or refresh a meeting's entry in the full-text index"""
+        if not self.fts_enabled:
+            return
+        
+        cursor.execute('INSERT OR IGNORE INTO meetings_fts_rows (meeting_id) VALUES (?)', (meeting_id,))
+        cursor.execute('SELECT fts_rowid FROM meetings_fts_rows WHERE meeting_id = ?', (meeting_id,))
+        row_id = cursor.fetchone()[0]
+        
+        cursor.execute('SELECT title, agenda FROM meetings WHERE id = ?', (meeting_id,))
+        document = dict(zip(['title', 'agenda'], cursor.fetchone()))
+        document.update(self._load_content(cursor, meeting_id, [field for field in SEARCH_COLUMNS
+                                                                if field in CONTENT_FIELDS]))
+        cursor.execute('SELECT name FROM participants WHERE meeting_id = ?', (meeting_id,))
+        document['participants'] = ' '.join(name for (name,) in cursor.fetchall() if name)
+        
+        cursor.execute('DELETE FROM meetings_fts WHERE rowid = ?', (row_id,))
+        cursor.execute(f'''
+            INSERT INTO meetings_fts (rowid, {', '.join(SEARCH_COLUMNS)})
+            VALUES (?, {', '.join('?' for _ in SEARCH_COLUMNS)})
+        ''', [row_id] + [document[field] for field in SEARCH_COLUMNS])
+    
+    def _index_new_meetings(self, cursor, documents: List[Dict]):
+        """Add just-created meetings to the full-text index in bulk.
+
+        documents hold the meeting id and its SEARCH_COLUMNS values.
+        """
+        if not self.fts_enabled or not documents:
+            return
+        
+        # Runs inside the caller's write transaction, so the ids are ours
+        cursor.execute('SELECT COALESCE(MAX(fts_rowid), 0) FROM meetings_fts_rows')
+        first_row_id = cursor.fetchone()[0] + 1
+        
+        rows = list(enumerate(documents, first_row_id))
+        cursor.executemany('INSERT INTO meetings_fts_rows (fts_rowid, meeting_id) VALUES (?, ?)',
+                           [(row_id, document['id']) for row_id, document in rows])
+        cursor.executemany(f'''
+            INSERT INTO meetings_fts (rowid, {', '.join(SEARCH_COLUMNS)})
+            VALUES (?, {', '.join('?' for _ in SEARCH_COLUMNS)})
+        ''', [[row_id] + [document.get(field) for field in SEARCH_COLUMNS] for row_id, document in rows])
+    
+    def _unindex_meeting(self, cursor, meeting_id: str):
+        """Remove a meeting from the full-text index"""
+        if not self.fts_enabled:
+            return
+        
+        cursor.execute('SELECT fts_rowid FROM meetings_fts_rows WHERE meeting_id = ?', (meeting_id,))
+        row = cursor.fetchone()
+        if row:
+            cursor.execute('DELETE FROM meetings_fts WHERE rowid = ?', (row[0],))
+            cursor.execute('DELETE FROM meetings_fts_rows WHERE fts_rowid = ?', (row[0],))
+    
+    def _add_column_if_missing(self, cursor, table: str, column: str, definition: str):
+        """Add a column to an existing table created by an older version"""
+        cursor.execute(f'PRAGMA table_info({table})')
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
     
     def create_meeting(self, title: str, agenda: str, scheduled_date: str, 
                       scheduled_time: str, participants: List[Dict] = None, 
                       tags: List[str] = None) -> str:
         """Create a new meeting"""
-        meeting_id = str(uuid.uuid4())
+        return self.create_meetings([{
+            'title': title,
+            'agenda': agenda,
+            'scheduled_date': scheduled_date,
+            'scheduled_time': scheduled_time,
+            'participants': participants,
+            'tags': tags
+        }])[0]
+    
+    def create_meetings(self, meetings: List[Dict]) -> List[str]:
+        """Create many meetings (dicts shaped like create_meeting's arguments)
+        in one transaction, all or nothing. Returns their ids in order."""
+        meeting_ids = [str(uuid.uuid4()) for _ in meetings]
         now = datetime.now().isoformat()
+        pairs = list(zip(meeting_ids, meetings))
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO meetings (id, title, agenda, scheduled_date, scheduled_time, 
-                                created_at, updated_at, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (meeting_id, title, agenda, scheduled_date, scheduled_time, now, now, 'planned'))
-        
-        # Add participants if provided
-        if participants:
-            for participant in participants:
-                cursor.execute('''
-                    INSERT INTO participants (meeting_id, name, email, role)
-                    VALUES (?, ?, ?, ?)
-                ''', (meeting_id, participant.get('name', ''), 
-                     participant.get('email', ''), participant.get('role', '')))
-        
-        # Add tags if provided
-        if tags:
-            for tag in tags:
-                cursor.execute('''
-                    INSERT INTO tags (meeting_id, tag)
-                    VALUES (?, ?)
-                ''', (meeting_id, tag))
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.executemany('''
+                INSERT INTO meetings (id, title, agenda, scheduled_date, scheduled_time, 
+                                    created_at, updated_at, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'planned')
+            ''', [(meeting_id, meeting['title'], meeting.get('agenda', ''), meeting['scheduled_date'],
+                   meeting['scheduled_time'], now, now) for meeting_id, meeting in pairs])
+            
+            cursor.executemany('''
+                INSERT INTO participants (meeting_id, name, email, role)
+                VALUES (?, ?, ?, ?)
+            ''', [(meeting_id, participant.get('name', ''), participant.get('email', ''),
+                   participant.get('role', ''))
+                  for meeting_id, meeting in pairs for participant in meeting.get('participants') or []])
+            
+            cursor.executemany('''
+                INSERT INTO tags (meeting_id, tag)
+                VALUES (?, ?)
+            ''', [(meeting_id, tag) for meeting_id, meeting in pairs for tag in meeting.get('tags') or []])
+            
+            self._index_new_meetings(cursor, [
+                {
+                    'id': meeting_id,
+                    'title': meeting['title'],
+                    'agenda': meeting.get('agenda', ''),
+                    'participants': ' '.join(participant.get('name', '')
+                                             for participant in meeting.get('participants') or [])
+                }
+                for meeting_id, meeting in pairs
+            ])
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         
-        conn.commit()
-        conn.close()
-        return meeting_id
+        return meeting_ids
     
-    def get_meeting(self, meeting_id: str) -> Optional[Dict]:
-        """Get a meeting by ID"""
-        conn = sqlite3.connect(self.db_path)
+    def get_meeting(self, meeting_id: str, include_content: bool = True) -> Optional[Dict]:
+        """Get a meeting by ID.
+
+        Transcript and notes are decompressed only with include_content;
+        without it they are None (enough to check a meeting exists).
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get meeting details
@@ -109,12 +716,13 @@ class MeetingDatabase:
         meeting = cursor.fetchone()
         
         if not meeting:
-            conn.close()
             return None
         
         # Convert to dictionary
         columns = [desc[0] for desc in cursor.description]
         meeting_dict = dict(zip(columns, meeting))
+        if include_content:
+            meeting_dict.update(self._load_content(cursor, meeting_id))
         
         # Get participants
         cursor.execute('SELECT name, email, role FROM participants WHERE meeting_id = ?', (meeting_id,))
@@ -126,124 +734,463 @@ class MeetingDatabase:
         tags = [tag[0] for tag in cursor.fetchall()]
         meeting_dict['tags'] = tags
         
-        conn.close()
         return meeting_dict
     
-    def update_meeting(self, meeting_id: str, **kwargs) -> bool:
-        """Update meeting details"""
-        if not kwargs:
+    def get_meeting_content(self, meeting_id: str, fields: List[str] = None) -> Dict:
+        """Decompressed transcript / note fields of a meeting (all of CONTENT_FIELDS by default)"""
+        return self._load_content(self._connect().cursor(), meeting_id, fields)
+    
+    def update_meeting(self, meeting_id: str, segments: Optional[List[Dict]] = None, **kwargs) -> bool:
+        """Update meeting details.
+
+        A new transcript replaces the meeting's timestamped segments with
+        segments, in the same transaction (without segments the old ones
+        are dropped, since they no longer match).
+        """
+        fields = {key: value for key, value in kwargs.items()
+                  if key in MEETING_COLUMNS or key in CONTENT_FIELDS}
+        if not fields:
             return False
+        if segments is not None:
+            fields['segments'] = segments
         
-        conn = sqlite3.connect(self.db_path)
+        return self.update_meetings([{'id': meeting_id, **fields}])[0]
+    
+    def update_meetings(self, updates: List[Dict]) -> List[bool]:
+        """Apply many updates in one transaction.
+
+        Each update is a dict with the meeting 'id', any MEETING_COLUMNS or
+        CONTENT_FIELDS, and optionally 'participants' (replacing the current
+        ones). An update with a 'transcript' also replaces the transcript
+        segments, with its 'segments' if it has them. Updates with the same
+        fields run as one executemany. Returns per update whether the meeting
+        existed.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
+        now = datetime.now().isoformat()
         
-        # Build update query
-        set_clauses = []
-        values = []
-        
-        for key, value in kwargs.items():
-            if key in ['title', 'agenda', 'scheduled_date', 'scheduled_time', 'status',
-                      'audio_file_path', 'transcript', 'executive_summary', 
-                      'discussion_notes', 'action_items', 'meeting_outline',
-                      'word_count', 'duration_seconds']:
-                set_clauses.append(f"{key} = ?")
-                values.append(value)
-        
-        if not set_clauses:
-            conn.close()
-            return False
-        
-        # Add updated_at
-        set_clauses.append("updated_at = ?")
-        values.append(datetime.now().isoformat())
-        values.append(meeting_id)
-        
-        query = f"UPDATE meetings SET {', '.join(set_clauses)} WHERE id = ?"
-        cursor.execute(query, values)
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            # Look the ids up inside the write lock, so none can be deleted before they are
+            # updated, in chunks that stay under SQLite's variable limit
+            meeting_ids = list({update['id'] for update in updates})
+            existing = set()
+            for start in range(0, len(meeting_ids), 500):
+                chunk = meeting_ids[start:start + 500]
+                cursor.execute(f'SELECT id FROM meetings WHERE id IN ({", ".join("?" for _ in chunk)})', chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+            found = [update['id'] in existing for update in updates]
+            
+            groups: Dict[tuple, List[Dict]] = {}
+            for update, exists in zip(updates, found):
+                if exists:
+                    fields = tuple(key for key in MEETING_COLUMNS + CONTENT_FIELDS if key in update)
+                    groups.setdefault(fields, []).append(update)
+            
+            for fields, group in groups.items():
+                columns = [field for field in fields if field in MEETING_COLUMNS]
+                cursor.executemany(
+                    f"UPDATE meetings SET {', '.join(f'{column} = ?' for column in columns + ['updated_at'])} "
+                    "WHERE id = ?",
+                    [[update[column] for column in columns] + [now, update['id']] for update in group]
+                )
+                
+                content = [field for field in fields if field in CONTENT_FIELDS]
+                if content:
+                    cursor.executemany(self._content_upsert(content), [
+                        [update['id']] + [self._pack_content(update[field]) for field in content]
+                        for update in group
+                    ])
+            
+            with_participants = [update for update, exists in zip(updates, found)
+                                 if exists and update.get('participants') is not None]
+            cursor.executemany('DELETE FROM participants WHERE meeting_id = ?',
+                               [(update['id'],) for update in with_participants])
+            cursor.executemany('''
+                INSERT INTO participants (meeting_id, name, email, role)
+                VALUES (?, ?, ?, ?)
+            ''', [(update['id'], participant.get('name', ''), participant.get('email', ''),
+                   participant.get('role', ''))
+                  for update in with_participants for participant in update['participants']
+                  if participant.get('name')])
+
+            # Segments of an old transcript would point into text that is gone
+            with_transcript = [update for update, exists in zip(updates, found)
+                               if exists and 'transcript' in update]
+            cursor.executemany('DELETE FROM transcript_segments WHERE meeting_id = ?',
+                               [(update['id'],) for update in with_transcript])
+            cursor.executemany('''
+                INSERT INTO transcript_segments (meeting_id, seq, start_ms, end_ms, text, avg_logprob)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [row for update in with_transcript
+                  for row in self._segment_rows(update['id'], update.get('segments') or [])])
+
+            reindex = {update['id'] for update, exists in zip(updates, found)
+                       if exists and SEARCH_COLUMNS.keys() & update.keys()}
+            for meeting_id in reindex:
+                self._index_meeting(cursor, meeting_id)
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
-        return success
+        return found
     
     def delete_meeting(self, meeting_id: str) -> bool:
         """Delete a meeting and all related data"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Delete related records first
-        cursor.execute('DELETE FROM participants WHERE meeting_id = ?', (meeting_id,))
-        cursor.execute('DELETE FROM tags WHERE meeting_id = ?', (meeting_id,))
+        # Participants, tags, content and jobs go with it (ON DELETE CASCADE)
+        self._unindex_meeting(cursor, meeting_id)
         cursor.execute('DELETE FROM meetings WHERE id = ?', (meeting_id,))
         
         conn.commit()
         success = cursor.rowcount > 0
-        conn.close()
         return success
     
-    def list_meetings(self, status: str = None, limit: int = 50, offset: int = 0) -> List[Dict]:
-        """List meetings with optional filtering"""
-        conn = sqlite3.connect(self.db_path)
+    @staticmethod
+    def _encode_cursor(meeting: Dict) -> str:
+        """Opaque cursor pointing just after a meeting in list order"""
+        key = [meeting['scheduled_date'], meeting['scheduled_time'], meeting['id']]
+        return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> List[str]:
+        """Sort key stored in a cursor; ValueError if it was not made by us"""
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        except Exception:
+            raise ValueError("Invalid cursor")
+        if not isinstance(key, list) or len(key) != 3 or not all(isinstance(part, str) for part in key):
+            raise ValueError("Invalid cursor")
+        return key
+    
+    def list_meetings(self, status: str = None, limit: int = 50, after: str = None,
+                      offset: int = 0) -> Dict:
+        """List meeting summaries, newest first, one page at a time.
+
+        Pages are keyset-paginated on (scheduled_date, scheduled_time, id):
+        pass the returned next_cursor as after to get the following page.
+        offset is still honoured for older clients when no cursor is given.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
-        query = 'SELECT * FROM meetings'
+        query = f'SELECT {MEETING_SUMMARY_COLUMNS} FROM meetings'
+        clauses = []
         params = []
         
         if status:
-            query += ' WHERE status = ?'
+            clauses.append('status = ?')
             params.append(status)
+        if after:
+            clauses.append('(scheduled_date, scheduled_time, id) < (?, ?, ?)')
+            params.extend(self._decode_cursor(after))
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
         
-        query += ' ORDER BY scheduled_date DESC, scheduled_time DESC LIMIT ? OFFSET ?'
-        params.extend([limit, offset])
+        # One extra row tells us whether there is a next page
+        query += ' ORDER BY scheduled_date DESC, scheduled_time DESC, id DESC LIMIT ?'
+        params.append(limit + 1)
+        if offset and not after:
+            query += ' OFFSET ?'
+            params.append(offset)
         
         cursor.execute(query, params)
-        meetings = cursor.fetchall()
-        
         columns = [desc[0] for desc in cursor.description]
-        meeting_list = []
+        meeting_list = [dict(zip(columns, meeting)) for meeting in cursor.fetchall()]
+        
+        has_more = len(meeting_list) > limit
+        meeting_list = meeting_list[:limit]
+        
+        for meeting in meeting_list:
+            meeting['has_notes'] = bool(meeting['has_notes'])
+        self._add_participant_counts(cursor, meeting_list)
+        
+        return {
+            "meetings": meeting_list,
+            "next_cursor": self._encode_cursor(meeting_list[-1]) if has_more else None
+        }
+    
+    def _add_participant_counts(self, cursor, meetings: List[Dict]):
+        """Set participant_count on a page of meetings with one grouped query"""
+        counts = {}
+        if meetings:
+            placeholders = ', '.join('?' for _ in meetings)
+            cursor.execute(f'''
+                SELECT meeting_id, COUNT(*) FROM participants
+                WHERE meeting_id IN ({placeholders})
+                GROUP BY meeting_id
+            ''', [meeting['id'] for meeting in meetings])
+            counts = dict(cursor.fetchall())
         
         for meeting in meetings:
-            meeting_dict = dict(zip(columns, meeting))
-            # Get participant count
-            cursor.execute('SELECT COUNT(*) FROM participants WHERE meeting_id = ?', (meeting_dict['id'],))
-            meeting_dict['participant_count'] = cursor.fetchone()[0]
-            meeting_list.append(meeting_dict)
-        
-        conn.close()
-        return meeting_list
-    
-    def search_meetings(self, query: str) -> List[Dict]:
-        """Search meetings by title, agenda, or participants"""
-        conn = sqlite3.connect(self.db_path)
+            meeting['participant_count'] = counts.get(meeting['id'], 0)
+    
+    def get_stats(self, weeks: int = 12) -> Dict:
+        """Dashboard numbers from the trigger-maintained counters.
+
+        Reads one row per status and per week, however many meetings
+        there are. meetings_per_week lists the latest weeks that have
+        meetings, oldest first.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT status, meetings, words, duration_seconds FROM meeting_stats WHERE meetings > 0')
+        rows = cursor.fetchall()
+        cursor.execute('SELECT week, meetings FROM meeting_weekly_stats ORDER BY week DESC LIMIT ?', (weeks,))
+        per_week = [{"week": week, "meetings": meetings} for week, meetings in reversed(cursor.fetchall())]
+        
+        duration = sum(row[3] for row in rows)
+        return {
+            "total_meetings": sum(row[1] for row in rows),
+            "by_status": {status: meetings for status, meetings, _, _ in rows},
+            "total_words": sum(row[2] for row in rows),
+            "total_duration_seconds": duration,
+            "total_hours": round(duration / 3600, 1),
+            "meetings_per_week": per_week
+        }
+    
+    def iter_meetings(self, status: str = None, date_from: str = None, date_to: str = None,
+                      batch_size: int = 200) -> Iterator[Dict]:
+        """Every meeting as get_meeting returns it, oldest first, for exports.
+
+        The rows come from a single SELECT on a connection of its own,
+        fetched a batch at a time, so memory stays flat however large the
+        database is. The read transaction gives the export a consistent
+        snapshot while writers carry on (WAL). date_from and date_to filter
+        on scheduled_date, both inclusive.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+        try:
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(f'PRAGMA {pragma}')
+            conn.execute('PRAGMA query_only = ON')
+            conn.execute('BEGIN')
+            
+            clauses = []
+            params = []
+            if status:
+                clauses.append('m.status = ?')
+                params.append(status)
+            if date_from:
+                clauses.append('m.scheduled_date >= ?')
+                params.append(date_from)
+            if date_to:
+                clauses.append('m.scheduled_date <= ?')
+                params.append(date_to)
+            where = f'WHERE {" AND ".join(clauses)}' if clauses else ''
+            
+            rows = conn.execute(f'''
+                SELECT m.*, {", ".join(f"c.{field} AS {field}" for field in CONTENT_FIELDS)}
+                FROM meetings m LEFT JOIN meeting_content c ON c.meeting_id = m.id
+                {where}
+                ORDER BY m.scheduled_date, m.scheduled_time, m.id
+            ''', params)
+            columns = [desc[0] for desc in rows.description]
+            lookup = conn.cursor()
+            
+            while True:
+                batch = rows.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    meeting = dict(zip(columns, row))
+                    for field in CONTENT_FIELDS:
+                        meeting[field] = self._unpack_content(meeting[field])
+                    
+                    lookup.execute('SELECT name, email, role FROM participants WHERE meeting_id = ?',
+                                   (meeting['id'],))
+                    meeting['participants'] = [{'name': p[0], 'email': p[1], 'role': p[2]}
+                                               for p in lookup.fetchall()]
+                    lookup.execute('SELECT tag FROM tags WHERE meeting_id = ?', (meeting['id'],))
+                    meeting['tags'] = [tag[0] for tag in lookup.fetchall()]
+                    yield meeting
+        finally:
+            conn.close()
+    
+    def count_meetings(self, status: str = None) -> int:
+        """Number of meetings, optionally with a given status"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        if status:
+            cursor.execute('SELECT COUNT(*) FROM meetings WHERE status = ?', (status,))
+        else:
+            cursor.execute('SELECT COUNT(*) FROM meetings')
+        
+        return cursor.fetchone()[0]
+    
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """Turn free text into an FTS5 query where every word must match as a prefix"""
+        terms = [term.replace('"', '') for term in text.split()]
+        return ' '.join(f'"{term}"*' for term in terms if term)
+    
+    def search_meetings(self, query: str, limit: int = 20, offset: int = 0) -> Dict:
+        """Full-text search over titles, agendas, participants, transcripts and notes.
+
+        Results are ranked by bm25 and carry a snippet of the best matching
+        field with the hits wrapped in <mark></mark> (the text itself is not
+        HTML-escaped).
+        """
+        if not self.fts_enabled:
+            return self._search_meetings_like(query, limit, offset)
+        
+        fts_query = self._fts_query(query)
+        if not fts_query:
+            return {"meetings": [], "total": 0}
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        weights = ', '.join(str(weight) for weight in SEARCH_COLUMNS.values())
+        cursor.execute(f'''
+            SELECT {MEETING_SUMMARY_COLUMNS}, hits.snippet, hits.score
+            FROM (
+                SELECT rowid, bm25(meetings_fts, {weights}) AS score,
+                       snippet(meetings_fts, -1, '<mark>', '</mark>', '…', 16) AS snippet
+                FROM meetings_fts WHERE meetings_fts MATCH ?
+                ORDER BY score LIMIT ? OFFSET ?
+            ) hits
+            JOIN meetings_fts_rows r ON r.fts_rowid = hits.rowid
+            JOIN meetings ON meetings.id = r.meeting_id
+            ORDER BY hits.score
+        ''', (fts_query, limit, offset))
+        columns = [desc[0] for desc in cursor.description]
+        meeting_list = [dict(zip(columns, meeting)) for meeting in cursor.fetchall()]
+        
+        for meeting in meeting_list:
+            meeting['has_notes'] = bool(meeting['has_notes'])
+            # bm25 is lower-is-better; flip it so a higher score is a better match
+            meeting['score'] = round(-meeting['score'], 4)
+        self._add_participant_counts(cursor, meeting_list)
+        
+        cursor.execute('SELECT COUNT(*) FROM meetings_fts WHERE meetings_fts MATCH ?', (fts_query,))
+        return {"meetings": meeting_list, "total": cursor.fetchone()[0]}
+    
+    def _search_meetings_like(self, query: str, limit: int, offset: int) -> Dict:
+        """Search title, agenda and participants with LIKE when SQLite lacks FTS5"""
+        conn = self._connect()
         cursor = conn.cursor()
         
         search_query = '''
-            SELECT DISTINCT m.* FROM meetings m
-            LEFT JOIN participants p ON m.id = p.meeting_id
-            WHERE m.title LIKE ? OR m.agenda LIKE ? OR p.name LIKE ?
-            ORDER BY m.scheduled_date DESC
+            FROM meetings
+            WHERE title LIKE ? OR agenda LIKE ? OR EXISTS (
+                SELECT 1 FROM participants p WHERE p.meeting_id = meetings.id AND p.name LIKE ?
+            )
         '''
-        
         search_term = f"%{query}%"
-        cursor.execute(search_query, (search_term, search_term, search_term))
-        meetings = cursor.fetchall()
+        params = (search_term, search_term, search_term)
         
+        cursor.execute(f'''
+            SELECT {MEETING_SUMMARY_COLUMNS} {search_query}
+            ORDER BY scheduled_date DESC LIMIT ? OFFSET ?
+        ''', params + (limit, offset))
         columns = [desc[0] for desc in cursor.description]
-        meeting_list = [dict(zip(columns, meeting)) for meeting in meetings]
+        meeting_list = [dict(zip(columns, meeting)) for meeting in cursor.fetchall()]
         
-        conn.close()
-        return meeting_list
+        for meeting in meeting_list:
+            meeting['has_notes'] = bool(meeting['has_notes'])
+        self._add_participant_counts(cursor, meeting_list)
+        
+        cursor.execute(f'SELECT COUNT(*) {search_query}', params)
+        return {"meetings": meeting_list, "total": cursor.fetchone()[0]}
+    
+    # TRANSCRIPT SEGMENTS
+    
+    @staticmethod
+    def _segment_rows(meeting_id: str, segments: List[Dict]) -> List[tuple]:
+        """transcript_segments rows for segments with start/end in seconds"""
+        return [
+            (meeting_id, seq, round(segment['start'] * 1000), round(segment['end'] * 1000),
+             segment['text'], segment.get('avg_logprob'))
+            for seq, segment in enumerate(sorted(segments, key=lambda segment: segment['start']))
+        ]
+    
+    @staticmethod
+    def _segment_dict(row) -> Dict:
+        """API form of a (start_ms, end_ms, text, avg_logprob) row"""
+        start_ms, end_ms, text, avg_logprob = row
+        return {"start": start_ms / 1000, "end": end_ms / 1000, "text": text, "avg_logprob": avg_logprob}
+    
+    def get_transcript_segments(self, meeting_id: str, start: float = 0, end: float = None,
+                                limit: int = 200) -> Dict:
+        """One page of a meeting's transcript: up to limit segments from the one
+        playing at start (seconds) on, stopping at end if given.
+
+        next_start is the start of the following segment (pass it as start to
+        get the next page), or None at the end of the range.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT seq FROM transcript_segments
+            WHERE meeting_id = ? AND end_ms > ?
+            ORDER BY end_ms LIMIT 1
+        ''', (meeting_id, round(start * 1000)))
+        row = cursor.fetchone()
+        if not row:
+            return {"segments": [], "next_start": None}
+        
+        query = '''
+            SELECT start_ms, end_ms, text, avg_logprob FROM transcript_segments
+            WHERE meeting_id = ? AND seq >= ?
+        '''
+        params = [meeting_id, row[0]]
+        if end is not None:
+            query += ' AND start_ms < ?'
+            params.append(round(end * 1000))
+        query += ' ORDER BY seq LIMIT ?'
+        params.append(limit + 1)
+        
+        cursor.execute(query, params)
+        segments = [self._segment_dict(segment) for segment in cursor.fetchall()]
+        
+        return {
+            "segments": segments[:limit],
+            "next_start": segments[limit]["start"] if len(segments) > limit else None
+        }
+    
+    def find_transcript_segments(self, meeting_id: str, query: str, limit: int = 50) -> List[Dict]:
+        """Segments of one meeting containing every word of query, in spoken order"""
+        terms = query.split()
+        if not terms:
+            return []
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        matches = ' AND '.join("text LIKE ? ESCAPE '!'" for _ in terms)
+        cursor.execute(f'''
+            SELECT start_ms, end_ms, text, avg_logprob FROM transcript_segments
+            WHERE meeting_id = ? AND {matches}
+            ORDER BY seq LIMIT ?
+        ''', [meeting_id] + [f"%{self._escape_like(term)}%" for term in terms] + [limit])
+        
+        return [self._segment_dict(segment) for segment in cursor.fetchall()]
+    
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        """Match % and _ literally in a LIKE pattern"""
+        return text.replace('!', '!!').replace('%', '!%').replace('_', '!_')
     
     def update_meeting_participants(self, meeting_id: str, participants: List[Dict]) -> bool:
         """Update participants for a meeting - FIXED VERSION"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
-            # First verify the meeting exists
-            cursor.execute('SELECT id FROM meetings WHERE id = ?', (meeting_id,))
-            if not cursor.fetchone():
-                conn.close()
+            # Bumping updated_at also verifies the meeting exists and
+            # invalidates cached exports, which include the participants
+            cursor.execute('UPDATE meetings SET updated_at = ? WHERE id = ?',
+                           (datetime.now().isoformat(), meeting_id))
+            if cursor.rowcount == 0:
                 return False
             
             # Delete existing participants
@@ -260,6 +1207,8 @@ class MeetingDatabase:
                         participant.get('email', ''), 
                         participant.get('role', '')))
             
+            self._index_meeting(cursor, meeting_id)
+            
             conn.commit()
             print(f"Successfully updated {len(participants)} participants for meeting {meeting_id}")
             return True
@@ -268,5 +1217,205 @@ class MeetingDatabase:
             print(f"Error updating participants: {e}")
             conn.rollback()
             return False
-        finally:
-            conn.close()
\ No newline at end of file
+
+    # JOB QUEUE
+
+    def create_job(self, meeting_id: str, audio_path: str, file_extension: str,
+                   options: Dict = None, audio_hash: str = None, held: bool = False) -> str:
+        """Queue an audio processing job for a meeting.
+
+        A held job is created as running (so no worker claims it) until the
+        caller puts it on the queue, e.g. after a batch transcription.
+        """
+        job_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        if held:
+            status, stage, message, started_at = 'running', 'transcribing', 'Waiting for batch transcription', now
+        else:
+            status, stage, message, started_at = 'queued', 'queued', 'Waiting for a worker', None
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO jobs (id, meeting_id, status, stage, progress, message,
+                            audio_path, file_extension, options, audio_hash,
+                            created_at, updated_at, started_at)
+            VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (job_id, meeting_id, status, stage, message, audio_path, file_extension,
+              json.dumps(options or {}), audio_hash, now, now, started_at))
+        
+        conn.commit()
+        return job_id
+    
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Get a job by ID, with its result decoded"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+        job = cursor.fetchone()
+        
+        if not job:
+            return None
+        
+        columns = [desc[0] for desc in cursor.description]
+        job_dict = dict(zip(columns, job))
+        if job_dict['result']:
+            job_dict['result'] = json.loads(job_dict['result'])
+        job_dict['options'] = json.loads(job_dict['options'] or '{}')
+        
+        # Position in the queue is only meaningful while waiting
+        if job_dict['status'] == 'queued':
+            cursor.execute('''
+                SELECT COUNT(*) FROM jobs
+                WHERE status = 'queued' AND created_at < ?
+            ''', (job_dict['created_at'],))
+            job_dict['queue_position'] = cursor.fetchone()[0] + 1
+        
+        return job_dict
+    
+    def update_job(self, job_id: str, **kwargs) -> bool:
+        """Update job status, progress or result"""
+        set_clauses = []
+        values = []
+        
+        for key, value in kwargs.items():
+            if key in ['status', 'stage', 'progress', 'message', 'audio_path',
+                      'result', 'error', 'started_at', 'finished_at']:
+                if key == 'result' and value is not None:
+                    value = json.dumps(value, ensure_ascii=False)
+                set_clauses.append(f"{key} = ?")
+                values.append(value)
+        
+        if not set_clauses:
+            return False
+        
+        set_clauses.append("updated_at = ?")
+        values.append(datetime.now().isoformat())
+        values.append(job_id)
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute(f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id = ?", values)
+        
+        conn.commit()
+        success = cursor.rowcount > 0
+        return success
+    
+    def claim_next_job(self) -> Optional[Dict]:
+        """Atomically take the oldest queued job and mark it as running"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        try:
+            # BEGIN IMMEDIATE takes the write lock up front so two workers
+            # can never claim the same job
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('''
+                SELECT id FROM jobs WHERE status = 'queued'
+                ORDER BY created_at LIMIT 1
+            ''')
+            row = cursor.fetchone()
+            if not row:
+                conn.commit()
+                return None
+            
+            now = datetime.now().isoformat()
+            cursor.execute('''
+                UPDATE jobs SET status = 'running', stage = 'starting', message = ?,
+                                started_at = ?, updated_at = ?
+                WHERE id = ?
+            ''', ('Processing started', now, now, row[0]))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        return self.get_job(row[0])
+    
+    def requeue_running_jobs(self) -> int:
+        """Put jobs interrupted by a server restart back on the queue"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            UPDATE jobs SET status = 'queued', stage = 'queued', progress = 0,
+                            message = 'Re-queued after server restart', updated_at = ?
+            WHERE status = 'running'
+        ''', (datetime.now().isoformat(),))
+        
+        conn.commit()
+        count = cursor.rowcount
+        return count
+    
+    def list_jobs(self, meeting_id: str = None, status: str = None, limit: int = 50) -> List[Dict]:
+        """List jobs, newest first, without their results"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        query = '''
+            SELECT id, meeting_id, status, stage, progress, message, error,
+                   created_at, updated_at, started_at, finished_at
+            FROM jobs
+        '''
+        clauses = []
+        params = []
+        
+        if meeting_id:
+            clauses.append('meeting_id = ?')
+            params.append(meeting_id)
+        if status:
+            clauses.append('status = ?')
+            params.append(status)
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        
+        query += ' ORDER BY created_at DESC LIMIT ?'
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        columns = [desc[0] for desc in cursor.description]
+        jobs = [dict(zip(columns, job)) for job in cursor.fetchall()]
+        
+        return jobs
+
+    # TRANSCRIPT CACHE
+
+    def get_cached_transcript(self, audio_hash: str, model_name: str, decode_options: Dict) -> Optional[Dict]:
+        """Get the transcription of previously processed audio with the same content
+        (text, segments and duration; entries from older versions have no segments)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT transcript, segments, duration_seconds FROM transcript_cache
+            WHERE audio_hash = ? AND model_name = ? AND decode_options = ?
+        ''', (audio_hash, model_name, json.dumps(decode_options, sort_keys=True)))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        transcript, segments, duration = row
+        return {
+            "text": transcript,
+            "segments": json.loads(self._unpack_content(segments) or '[]'),
+            "duration": duration
+        }
+    
+    def save_cached_transcript(self, audio_hash: str, model_name: str, decode_options: Dict,
+                               transcription: Dict):
+        """Remember the transcription of an audio file by its content hash"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO transcript_cache
+                (audio_hash, model_name, decode_options, transcript, segments, duration_seconds, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (audio_hash, model_name, json.dumps(decode_options, sort_keys=True),
+              transcription["text"], self._pack_content(json.dumps(transcription.get("segments") or [])),
+              transcription.get("duration"), datetime.now().isoformat()))
+        
+        conn.commit()
@@ -60,6 +60,9 @@ def check_database():
         tables = cursor.fetchall()
         print(f"  📋 Tables: {[t[0] for t in tables]}")
         
+        cursor.execute("PRAGMA user_version")
+        print(f"  🏷️  Schema version: {cursor.fetchone()[0]}")
+        
         # Check meetings count
         cursor.execute("SELECT COUNT(*) FROM meetings")
         count = cursor.fetchone()[0]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Meeting Export Script
+Writes every meeting, or those with a given status / scheduled date range,
+to an NDJSON file or a zip of TXT and JSON notes. Meetings are read from
+the database one batch at a time, so memory use does not grow with its size.
+
+Usage: python export_meetings.py meetings.zip [--format zip] [--status completed]
+                                 [--from 2024-01-01] [--to 2024-12-31] [--db meetings.db]
+       python export_meetings.py - --format ndjson | gzip > meetings.ndjson.gz
+"""
+
+import argparse
+import contextlib
+import sys
+import time
+from datetime import datetime
+
+from database import MeetingDatabase
+from exports import iter_ndjson, iter_zip
+
+
+def date_arg(value: str) -> str:
+    """argparse type for YYYY-MM-DD dates"""
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a date (YYYY-MM-DD): {value}")
+    return value
+
+
+class CountingIterator:
+    """Pass meetings through while counting them"""
+
+    def __init__(self, meetings):
+        self.meetings = meetings
+        self.count = 0
+
+    def __iter__(self):
+        for meeting in self.meetings:
+            self.count += 1
+            yield meeting
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export meetings as NDJSON or a zip of TXT/JSON notes")
+    parser.add_argument("output", help="Output file, or - for stdout")
+    parser.add_argument("--format", choices=["ndjson", "zip"],
+                        help="Archive format (default: from the file extension, else ndjson)")
+    parser.add_argument("--status", help="Only meetings with this status")
+    parser.add_argument("--from", dest="date_from", type=date_arg, help="Scheduled on or after this date")
+    parser.add_argument("--to", dest="date_to", type=date_arg, help="Scheduled on or before this date")
+    parser.add_argument("--db", default="meetings.db", help="Database file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("zip" if args.output.lower().endswith(".zip") else "ndjson")
+    # Keep migration messages out of an archive written to stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        db = MeetingDatabase(args.db)
+    meetings = CountingIterator(db.iter_meetings(status=args.status, date_from=args.date_from,
+                                                 date_to=args.date_to))
+    chunks = iter_zip(meetings) if fmt == "zip" else iter_ndjson(meetings)
+
+    started = time.perf_counter()
+    written = 0
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+        db.close()
+
+    print(f"✅ Exported {meetings.count} meetings ({written / 1024 / 1024:.1f} MB, {fmt}) "
+          f"in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
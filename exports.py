@@ -0,0 +1,287 @@
+import gzip
+import hashlib
+import json
+import re
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Optional
+from urllib.parse import quote
+
+from fastapi import Request, Response
+
+# Bodies smaller than this are sent uncompressed; gzip gains nothing on them
+GZIP_MIN_BYTES = 1024
+
+
+def render_meeting_txt(meeting: Dict) -> str:
+    """Plain-text notes of a processed meeting"""
+    return f"""PROFESSIONAL MEETING NOTES
+═══════════════════════════════════════════════════════════════
+
+Meeting: {meeting['title']}
+Date: {meeting['scheduled_date']} at {meeting['scheduled_time']}
+Generated: {meeting['updated_at']}
+Word Count: {meeting['word_count']} words
+
+═══════════════════════════════════════════════════════════════
+AGENDA
+═══════════════════════════════════════════════════════════════
+{meeting['agenda'] or 'No agenda specified'}
+
+═══════════════════════════════════════════════════════════════
+EXECUTIVE SUMMARY
+═══════════════════════════════════════════════════════════════
+{meeting['executive_summary'] or 'No summary available'}
+
+═══════════════════════════════════════════════════════════════
+ACTION ITEMS & COMMITMENTS
+═══════════════════════════════════════════════════════════════
+{meeting['action_items'] or 'No action items identified'}
+
+═══════════════════════════════════════════════════════════════
+COMPLETE MEETING OUTLINE
+═══════════════════════════════════════════════════════════════
+{meeting['meeting_outline'] or 'No outline available'}
+
+═══════════════════════════════════════════════════════════════
+FULL TRANSCRIPT
+═══════════════════════════════════════════════════════════════
+{meeting['transcript'] or 'No transcript available'}
+
+═══════════════════════════════════════════════════════════════
+Generated by Local Meeting Notes AI
+Privacy-First | Completely Local Processing
+═══════════════════════════════════════════════════════════════
+"""
+
+
+def render_session_txt(session_id: str, data: Dict) -> str:
+    """Plain-text notes of an old file-based session (output/meeting_notes_{id}.json)"""
+    return f"""MEETING NOTES
+Session: {session_id}
+Generated: {data.get('generated_at', 'Unknown')}
+Word Count: {data.get('word_count', 0)} words
+
+===============================================
+EXECUTIVE SUMMARY
+===============================================
+{data.get('executive_summary', 'No summary available')}
+
+===============================================
+ACTION ITEMS
+===============================================
+{data.get('action_items', 'No action items identified')}
+
+===============================================
+MEETING OUTLINE
+===============================================
+{data.get('meeting_outline', 'No outline available')}
+
+===============================================
+FULL TRANSCRIPT
+===============================================
+{data.get('transcript', 'No transcript available')}
+
+===============================================
+Generated by Local Meeting Notes AI
+===============================================
+"""
+
+
+class ExportCache:
+    """In-memory LRU of rendered exports, plain and gzipped, bounded by size.
+
+    Keys include the version of the source (e.g. the meeting's updated_at),
+    so an edit simply makes the old entry unreachable until it is evicted.
+    Safe to share between the threads the download routes run in.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Dict[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, bytes]]:
+        """Cached encodings of an export, or None"""
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return variants
+
+    def put(self, key: Hashable, body: bytes) -> Dict[str, bytes]:
+        """Store an export (and its gzip encoding, if worth it)"""
+        variants = {"identity": body}
+        if len(body) >= GZIP_MIN_BYTES:
+            variants["gzip"] = gzip.compress(body, compresslevel=6)
+
+        entry_size = sum(len(data) for data in variants.values())
+        if entry_size > self.max_bytes:
+            return variants
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= sum(len(data) for data in old.values())
+            self._entries[key] = variants
+            self.size += entry_size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= sum(len(data) for data in evicted.values())
+        return variants
+
+    def stats(self) -> Dict:
+        """Entry count, size and hit/miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+def make_etag(*parts) -> str:
+    """Weak validator for an export; the same for its plain and gzipped encodings"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Stored ISO timestamp (local time) as an aware UTC datetime, to the second"""
+    return datetime.fromisoformat(value).astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Whether the client's cached copy is current (If-None-Match wins over If-Modified-Since)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether Accept-Encoding allows gzip (and does not give it q=0)"""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def content_disposition(filename: str) -> str:
+    """Attachment header that survives non-ASCII meeting titles"""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """ETag / Last-Modified headers that make clients revalidate every time"""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def export_response(request: Request, cache: ExportCache, key: Hashable, render: Callable[[], bytes],
+                    media_type: str, etag: str, last_modified: Optional[datetime] = None,
+                    filename: Optional[str] = None) -> Response:
+    """Serve an export from memory with HTTP validation.
+
+    A matching If-None-Match / If-Modified-Since gets a 304 without
+    rendering anything; otherwise the cached rendering is used, or
+    render() is called once and its result cached. The body is gzipped
+    when the client accepts it.
+    """
+    headers = {**validator_headers(etag, last_modified), "Vary": "Accept-Encoding"}
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    variants = cache.get(key)
+    if variants is None:
+        variants = cache.put(key, render())
+
+    if filename:
+        headers["Content-Disposition"] = content_disposition(filename)
+    if "gzip" in variants and accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=variants["gzip"], media_type=media_type, headers=headers)
+    return Response(content=variants["identity"], media_type=media_type, headers=headers)
+
+
+def archive_name(meeting: Dict) -> str:
+    """File name (without extension) of a meeting inside an archive"""
+    title = re.sub(r'[^\w\-]+', '_', meeting.get('title') or '').strip('_')[:60] or 'meeting'
+    return f"{meeting.get('scheduled_date') or 'undated'}_{title}_{meeting['id'][:8]}"
+
+
+def iter_ndjson(meetings: Iterable[Dict]) -> Iterator[bytes]:
+    """One JSON document per line, one meeting at a time"""
+    for meeting in meetings:
+        yield json.dumps(meeting, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class _ZipSink:
+    """Write-only file for ZipFile that hands its output back in pieces.
+
+    It has no tell/seek, so zipfile writes entries with data descriptors
+    and never goes back into what has already been sent.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip(meetings: Iterable[Dict], formats: Iterable[str] = ("txt", "json")) -> Iterator[bytes]:
+    """A zip with a TXT and/or JSON rendering per meeting, produced as it is read.
+
+    Only the current meeting is held in memory; zipfile itself keeps one
+    small directory entry per file for the central directory at the end.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for meeting in meetings:
+            name = archive_name(meeting)
+            modified = datetime.fromisoformat(meeting['updated_at']).timetuple()[:6]
+            for fmt in formats:
+                info = zipfile.ZipInfo(f"{name}.{fmt}", date_time=modified)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                if fmt == "json":
+                    archive.writestr(info, json.dumps(meeting, ensure_ascii=False, indent=2))
+                else:
+                    archive.writestr(info, render_meeting_txt(meeting))
+            yield sink.drain()
+    yield sink.drain()
@@ -9,7 +9,7 @@ import { Meeting } from '../types';
 
 export const HomePage: React.FC = () => {
   const navigate = useNavigate();
-  const { meetings, loading, error, stats, loadMeetings, searchMeetings, filterMeetings, sortMeetings, deleteMeeting } = useMeetings();
+  const { meetings, loading, error, stats, total, hasMore, loadMeetings, loadMore, searchMeetings, filterMeetings, sortMeetings, deleteMeeting } = useMeetings();
   
   const [showNewMeetingModal, setShowNewMeetingModal] = useState(false);
   const [editingMeeting, setEditingMeeting] = useState<Meeting | null>(null);
@@ -151,6 +151,7 @@ export const HomePage: React.FC = () => {
             <h2>Recent Meetings</h2>
             <span className="meeting-count">
               {meetings.length} meeting{meetings.length !== 1 ? 's' : ''}
+              {hasMore && ` of ${total}`}
             </span>
           </div>
 
@@ -179,6 +180,14 @@ export const HomePage: React.FC = () => {
               ))}
             </div>
           )}
+
+          {hasMore && (
+            <div className="load-more">
+              <button className="btn btn-secondary" onClick={loadMore}>
+                Load more meetings
+              </button>
+            </div>
+          )}
         </section>
       </main>
 
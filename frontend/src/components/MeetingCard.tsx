@@ -24,7 +24,10 @@ export const MeetingCard: React.FC<MeetingCardProps> = ({ meeting, onClick, onEd
   const statusClass = `status-${meeting.status}`;
   const statusText = meeting.status.charAt(0).toUpperCase() + meeting.status.slice(1).replace('-', ' ');
 
-  const hasNotes = meeting.transcript && meeting.transcript.trim().length > 0;
+  // Search hits come back as plain text with <mark></mark> around the matches
+  const snippetParts = meeting.snippet ? meeting.snippet.split(/<mark>|<\/mark>/) : [];
+
+  const hasNotes = meeting.has_notes ?? (meeting.transcript && meeting.transcript.trim().length > 0);
   const notesIcon = hasNotes ? '📝' : '⏳';
   const notesText = hasNotes ? 'Has notes' : 'No recording yet';
 
@@ -64,6 +67,12 @@ export const MeetingCard: React.FC<MeetingCardProps> = ({ meeting, onClick, onEd
         {meeting.agenda && (
           <div className="meeting-agenda">{meeting.agenda}</div>
         )}
+
+        {snippetParts.length > 0 && (
+          <div className="meeting-snippet">
+            {snippetParts.map((part, index) => (index % 2 === 1 ? <mark key={index}>{part}</mark> : part))}
+          </div>
+        )}
       </div>
 
       <div className="meeting-meta">
@@ -20,6 +20,7 @@ export const MeetingPage: React.FC = () => {
     processing,
     processStep,
     processMessage,
+    liveNotes,
     loadMeeting,
     updateMeeting,
     processAudio,
@@ -122,6 +123,7 @@ export const MeetingPage: React.FC = () => {
           <ProcessingSection
             step={processStep}
             message={processMessage}
+            liveNotes={liveNotes}
           />
         )}
 
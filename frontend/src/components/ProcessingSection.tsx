@@ -1,11 +1,19 @@
 import React from 'react';
+import { LiveNotes } from '../types';
 
 interface ProcessingSectionProps {
   step: number;
   message: string;
+  liveNotes?: LiveNotes;
 }
 
-export const ProcessingSection: React.FC<ProcessingSectionProps> = ({ step, message }) => {
+const liveSections = [
+  { key: 'executive_summary', title: '📝 Executive Summary' },
+  { key: 'action_items', title: '✅ Action Items' },
+  { key: 'meeting_outline', title: '📋 Meeting Outline' },
+];
+
+export const ProcessingSection: React.FC<ProcessingSectionProps> = ({ step, message, liveNotes = {} }) => {
   const steps = [
     { number: 1, text: 'Uploading', title: 'Uploading file...', msg: 'Preparing your audio file for processing', icon: '📤' },
     { number: 2, text: 'Converting', title: 'Converting audio...', msg: 'Optimizing audio format for transcription', icon: '🔄' },
@@ -62,6 +70,20 @@ export const ProcessingSection: React.FC<ProcessingSectionProps> = ({ step, mess
             </div>
           ))}
         </div>
+
+        {/* Notes streamed from the server while they are being generated */}
+        {liveSections.some(section => liveNotes[section.key]) && (
+          <div className="live-notes">
+            {liveSections
+              .filter(section => liveNotes[section.key])
+              .map(section => (
+                <div key={section.key} className="live-note-card">
+                  <h4>{section.title}</h4>
+                  <pre className="live-note-text">{liveNotes[section.key]}</pre>
+                </div>
+              ))}
+          </div>
+        )}
       </div>
     </section>
   );
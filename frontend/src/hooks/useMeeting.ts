@@ -1,7 +1,20 @@
 import { useState, useEffect, useCallback } from 'react';
-import { Meeting, MeetingUpdate, AudioProcessingResult } from '../types';
+import { Meeting, MeetingUpdate, AudioProcessingResult, LiveNotes } from '../types';
 import { apiService } from '../services/api';
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+// Map server-side job stages onto the steps shown in ProcessingSection
+const STAGE_STEPS: Record<string, number> = {
+  queued: 1,
+  starting: 1,
+  converting: 2,
+  transcribing: 3,
+  generating: 4,
+  saving: 5,
+  done: 5,
+};
+
 export const useMeeting = (meetingId: string) => {
   const [meeting, setMeeting] = useState<Meeting | null>(null);
   const [loading, setLoading] = useState(true);
@@ -9,6 +22,7 @@ export const useMeeting = (meetingId: string) => {
   const [processing, setProcessing] = useState(false);
   const [processStep, setProcessStep] = useState(1);
   const [processMessage, setProcessMessage] = useState('');
+  const [liveNotes, setLiveNotes] = useState<LiveNotes>({});
 
   const loadMeeting = useCallback(async () => {
     try {
@@ -46,36 +60,70 @@ export const useMeeting = (meetingId: string) => {
   }, [meetingId, meeting]);
 
   const processAudio = useCallback(async (file: File) => {
-    let timeouts: number[] = [];
-    
+    const showStage = (job: { status?: string; stage: string; message: string; queue_position?: number }) => {
+      setProcessStep(STAGE_STEPS[job.stage] || 1);
+      setProcessMessage(
+        job.status === 'queued' && job.queue_position
+          ? `Waiting in queue (position ${job.queue_position})...`
+          : job.message
+      );
+    };
+
+    // Follow the job over server-sent events, rendering notes as they are
+    // generated. Resolves null if the stream drops so we can fall back to polling.
+    const streamJob = (jobId: string) => new Promise<AudioProcessingResult | null>((resolve, reject) => {
+      const source = new EventSource(apiService.getJobEventsUrl(jobId));
+      const listen = (event: string, handler: (data: any) => void) => {
+        source.addEventListener(event, (e) => handler(JSON.parse((e as MessageEvent).data)));
+      };
+
+      listen('status', showStage);
+      listen('stage', showStage);
+      listen('snapshot', (data) => setLiveNotes(data.sections));
+      listen('token', (data) => {
+        setLiveNotes(prev => ({ ...prev, [data.section]: (prev[data.section] || '') + data.text }));
+      });
+      listen('done', (data) => {
+        source.close();
+        resolve(data.result);
+      });
+      listen('failed', (data) => {
+        source.close();
+        reject(new Error(data.error || 'Processing failed'));
+      });
+      source.onerror = () => {
+        source.close();
+        resolve(null);
+      };
+    });
+
+    // Poll the job until a worker has finished it
+    const pollJob = async (jobId: string) => {
+      let job = await apiService.getJob(jobId);
+      while (job.status === 'queued' || job.status === 'running') {
+        showStage(job);
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        job = await apiService.getJob(jobId);
+      }
+
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Processing failed');
+      }
+
+      return apiService.getJobResult(jobId);
+    };
+
     try {
       setProcessing(true);
       setProcessStep(1);
       setProcessMessage('Uploading file...');
+      setLiveNotes({});
 
-      // Set up progress steps with proper cleanup
-      const progressSteps = [
-        { step: 2, delay: 1000, message: 'Converting audio...' },
-        { step: 3, delay: 3000, message: 'Transcribing speech...' },
-        { step: 4, delay: 8000, message: 'Analyzing content...' },
-        { step: 5, delay: 12000, message: 'Generating notes...' },
-      ];
-
-      // Schedule progress updates
-      progressSteps.forEach(({ step, delay, message }) => {
-        const timeout = setTimeout(() => {
-          setProcessStep(step);
-          setProcessMessage(message);
-        }, delay);
-        timeouts.push(timeout);
-      });
+      // Upload the audio; the server queues it and answers immediately
+      const { job_id } = await apiService.processAudio(meetingId, file);
+
+      const result = (await streamJob(job_id)) ?? (await pollJob(job_id));
 
-      // Process the audio
-      const result = await apiService.processAudio(meetingId, file);
-      
-      // Clear any remaining timeouts
-      timeouts.forEach(timeout => clearTimeout(timeout));
-      
       // Final step
       setProcessStep(5);
       setProcessMessage('Complete!');
@@ -89,8 +137,6 @@ export const useMeeting = (meetingId: string) => {
 
       return result;
     } catch (err) {
-      // Clear timeouts on error
-      timeouts.forEach(timeout => clearTimeout(timeout));
       setError(err instanceof Error ? err.message : 'Processing failed');
       throw err;
     } finally {
@@ -127,6 +173,7 @@ export const useMeeting = (meetingId: string) => {
     processing,
     processStep,
     processMessage,
+    liveNotes,
     loadMeeting,
     updateMeeting,
     processAudio,
@@ -7,6 +7,8 @@ export const useMeetings = () => {
   const [filteredMeetings, setFilteredMeetings] = useState<Meeting[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [stats, setStats] = useState<MeetingStats>({
     totalMeetings: 0,
     plannedMeetings: 0,
@@ -14,6 +16,17 @@ export const useMeetings = () => {
     totalHours: 0,
   });
 
+  // Counted by the server over every meeting, not just the loaded page
+  const loadStats = useCallback(async () => {
+    const result = await apiService.getStats();
+    setStats({
+      totalMeetings: result.total_meetings,
+      plannedMeetings: result.by_status.planned || 0,
+      completedMeetings: result.by_status.completed || 0,
+      totalHours: result.total_hours,
+    });
+  }, []);
+
   const loadMeetings = useCallback(async () => {
     try {
       setLoading(true);
@@ -21,27 +34,30 @@ export const useMeetings = () => {
       const result = await apiService.getMeetings();
       setMeetings(result.meetings);
       setFilteredMeetings(result.meetings);
-      updateStats(result.meetings);
+      setTotal(result.total);
+      setNextCursor(result.next_cursor);
+      await loadStats();
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to load meetings');
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [loadStats]);
 
-  const updateStats = (meetingsList: Meeting[]) => {
-    const totalMeetings = meetingsList.length;
-    const plannedMeetings = meetingsList.filter(m => m.status === 'planned').length;
-    const completedMeetings = meetingsList.filter(m => m.status === 'completed').length;
-    const totalHours = completedMeetings; // Rough estimate
+  const loadMore = useCallback(async () => {
+    if (!nextCursor) return;
 
-    setStats({
-      totalMeetings,
-      plannedMeetings,
-      completedMeetings,
-      totalHours,
-    });
-  };
+    try {
+      const result = await apiService.getMeetings(undefined, 50, nextCursor);
+      const allMeetings = [...meetings, ...result.meetings];
+      setMeetings(allMeetings);
+      setFilteredMeetings(allMeetings);
+      setTotal(result.total);
+      setNextCursor(result.next_cursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to load meetings');
+    }
+  }, [meetings, nextCursor]);
 
   const searchMeetings = useCallback(async (query: string) => {
     if (!query.trim()) {
@@ -103,7 +119,10 @@ export const useMeetings = () => {
     loading,
     error,
     stats,
+    total,
+    hasMore: nextCursor !== null,
     loadMeetings,
+    loadMore,
     searchMeetings,
     filterMeetings,
     sortMeetings,
@@ -1,4 +1,4 @@
-import { Meeting, MeetingCreate, MeetingUpdate, AudioProcessingResult } from '../types';
+import { Meeting, MeetingCreate, MeetingList, DashboardStats, MeetingSearchResult, MeetingUpdate, TranscriptPage, TranscriptSearchResult, AudioProcessingResult, ProcessingJob, ProcessingJobQueued } from '../types';
 
 class ApiService {
   private baseUrl = '/api';
@@ -64,19 +64,28 @@ class ApiService {
   }
 
   // Meeting endpoints
-  async getMeetings(status?: string, limit = 50, offset = 0): Promise<{ meetings: Meeting[]; total: number }> {
+  async getMeetings(status?: string, limit = 50, cursor?: string): Promise<MeetingList> {
     const params = new URLSearchParams();
     if (status) params.append('status', status);
     params.append('limit', limit.toString());
-    params.append('offset', offset.toString());
+    if (cursor) params.append('cursor', cursor);
     
     return this.get(`/meetings?${params.toString()}`);
   }
 
+  async getStats(weeks = 12): Promise<DashboardStats> {
+    return this.get(`/stats?weeks=${weeks}`);
+  }
+
   async getMeeting(id: string): Promise<Meeting> {
     return this.get(`/meetings/${id}`);
   }
 
+  // Only the given fields (e.g. ['metadata'] or ['executive_summary']), plus the id
+  async getMeetingFields(id: string, fields: string[]): Promise<Partial<Meeting>> {
+    return this.get(`/meetings/${id}?fields=${encodeURIComponent(fields.join(','))}`);
+  }
+
   async createMeeting(meeting: MeetingCreate): Promise<{ meeting_id: string; status: string }> {
     return this.post('/meetings', meeting);
   }
@@ -89,14 +98,36 @@ class ApiService {
     return this.delete(`/meetings/${id}`);
   }
 
-  async searchMeetings(query: string): Promise<{ meetings: Meeting[]; total: number }> {
-    return this.get(`/meetings/search/${encodeURIComponent(query)}`);
+  async searchMeetings(query: string, limit = 50, offset = 0): Promise<MeetingSearchResult> {
+    return this.get(`/meetings/search/${encodeURIComponent(query)}?limit=${limit}&offset=${offset}`);
+  }
+
+  async getTranscriptSegments(meetingId: string, start = 0, end?: number, limit = 200): Promise<TranscriptPage> {
+    const params = new URLSearchParams({ start: String(start), limit: String(limit) });
+    if (end !== undefined) params.set('end', String(end));
+    return this.get(`/meetings/${meetingId}/transcript?${params}`);
+  }
+
+  async searchTranscript(meetingId: string, query: string, limit = 50): Promise<TranscriptSearchResult> {
+    return this.get(`/meetings/${meetingId}/transcript/search?q=${encodeURIComponent(query)}&limit=${limit}`);
   }
 
-  async processAudio(meetingId: string, file: File): Promise<AudioProcessingResult> {
+  async processAudio(meetingId: string, file: File): Promise<ProcessingJobQueued> {
     return this.uploadFile(`/meetings/${meetingId}/process-audio`, file);
   }
 
+  async getJob(jobId: string): Promise<ProcessingJob> {
+    return this.get(`/jobs/${jobId}`);
+  }
+
+  async getJobResult(jobId: string): Promise<AudioProcessingResult> {
+    return this.get(`/jobs/${jobId}/result`);
+  }
+
+  getJobEventsUrl(jobId: string): string {
+    return `${this.baseUrl}/jobs/${jobId}/events`;
+  }
+
   async downloadMeetingNotes(meetingId: string, format = 'txt'): Promise<Blob> {
     const response = await fetch(`${this.baseUrl}/meetings/${meetingId}/download?format=${format}`);
     if (!response.ok) {
@@ -17,6 +17,42 @@ export interface Meeting {
   participants: Participant[];
   tags: string[];
   participant_count?: number;
+  has_notes?: boolean;
+  snippet?: string;
+  score?: number;
+}
+
+export interface TranscriptSegment {
+  start: number;
+  end: number;
+  text: string;
+  avg_logprob: number | null;
+}
+
+export interface TranscriptPage {
+  meeting_id: string;
+  duration_seconds: number;
+  segments: TranscriptSegment[];
+  next_start: number | null;
+}
+
+export interface TranscriptSearchResult {
+  meeting_id: string;
+  query: string;
+  matches: TranscriptSegment[];
+}
+
+export interface MeetingSearchResult {
+  meetings: Meeting[];
+  total: number;
+  limit: number;
+  offset: number;
+}
+
+export interface MeetingList {
+  meetings: Meeting[];
+  total: number;
+  next_cursor: string | null;
 }
 
 export interface Participant {
@@ -59,6 +95,41 @@ export interface AudioProcessingResult {
   meeting_title: string;
 }
 
+export interface ProcessingJobQueued {
+  job_id: string;
+  meeting_id: string;
+  status: string;
+  status_url: string;
+  result_url: string;
+}
+
+export interface ProcessingJob {
+  id: string;
+  meeting_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  stage: string;
+  progress: number;
+  message: string;
+  error?: string;
+  queue_position?: number;
+  created_at: string;
+  updated_at: string;
+  started_at?: string;
+  finished_at?: string;
+}
+
+// Note sections streamed while a job is generating, keyed by section name
+export type LiveNotes = Record<string, string>;
+
+export interface DashboardStats {
+  total_meetings: number;
+  by_status: Record<string, number>;
+  total_words: number;
+  total_duration_seconds: number;
+  total_hours: number;
+  meetings_per_week: { week: string; meetings: number }[];
+}
+
 export interface MeetingStats {
   totalMeetings: number;
   plannedMeetings: number;
@@ -0,0 +1,48 @@
+import asyncio
+import json
+from typing import Dict, List
+
+
+def format_sse(event: str, data: Dict) -> str:
+    """Encode one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class JobEventBroker:
+    """In-process fan-out of job progress and LLM tokens to SSE subscribers"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # Text streamed so far per section, so late subscribers can catch up
+        self._partial_sections: Dict[str, Dict[str, str]] = {}
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Start receiving events for a job"""
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        """Stop receiving events for a job"""
+        queues = self._subscribers.get(job_id, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._subscribers.pop(job_id, None)
+
+    def partial_sections(self, job_id: str) -> Dict[str, str]:
+        """Sections streamed so far for a running job"""
+        return dict(self._partial_sections.get(job_id, {}))
+
+    def publish(self, job_id: str, event: str, data: Dict):
+        """Send an event to everyone watching a job"""
+        if event == "token":
+            sections = self._partial_sections.setdefault(job_id, {})
+            sections[data["section"]] = sections.get(data["section"], "") + data["text"]
+        elif event == "section":
+            self._partial_sections.setdefault(job_id, {})[data["section"]] = data["text"]
+        elif event in ("done", "failed"):
+            self._partial_sections.pop(job_id, None)
+
+        for queue in self._subscribers.get(job_id, []):
+            queue.put_nowait((event, data))
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class LLMResponseCache:
+    """Content-addressed cache of LLM responses with size-bounded LRU eviction"""
+
+    def __init__(self, db_path: str = "llm_cache.db", max_bytes: int = 100 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.init_database()
+
+    def init_database(self):
+        """Initialize the cache table"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                last_used_at TEXT NOT NULL,
+                hit_count INTEGER DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used
+            ON llm_responses (last_used_at)
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, options: Dict = None, format=None) -> str:
+        """Hash everything that influences the response"""
+        material = json.dumps(
+            {"model": model, "prompt": prompt, "options": options or {}, "format": format},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response and mark it as recently used"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT response FROM llm_responses WHERE key = ?', (key,))
+        row = cursor.fetchone()
+
+        if row:
+            cursor.execute('''
+                UPDATE llm_responses SET last_used_at = ?, hit_count = hit_count + 1
+                WHERE key = ?
+            ''', (datetime.now().isoformat(), key))
+            conn.commit()
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        conn.close()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response, evicting least recently used entries past max_bytes"""
+        now = datetime.now().isoformat()
+        size_bytes = len(response.encode('utf-8'))
+        if size_bytes > self.max_bytes:
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO llm_responses
+                (key, model, response, size_bytes, created_at, last_used_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+        ''', (key, model, response, size_bytes, now, now))
+
+        cursor.execute('SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses')
+        total_bytes = cursor.fetchone()[0]
+
+        if total_bytes > self.max_bytes:
+            # Walk entries from least recently used until we are under budget
+            cursor.execute('''
+                SELECT key, size_bytes FROM llm_responses
+                WHERE key != ? ORDER BY last_used_at
+            ''', (key,))
+            evict = []
+            for old_key, old_size in cursor.fetchall():
+                if total_bytes <= self.max_bytes:
+                    break
+                evict.append((old_key,))
+                total_bytes -= old_size
+            cursor.executemany('DELETE FROM llm_responses WHERE key = ?', evict)
+            self.evictions += len(evict)
+
+        conn.commit()
+        conn.close()
+
+    def clear(self) -> int:
+        """Remove every cached response"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('DELETE FROM llm_responses')
+
+        conn.commit()
+        count = cursor.rowcount
+        conn.close()
+        return count
+
+    def stats(self) -> Dict:
+        """Hit/miss counters since startup plus current cache size"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses')
+        entries, size_bytes = cursor.fetchone()
+
+        conn.close()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class LLMTimeoutError(TimeoutError):
+    """Ollama did not answer within the client timeout"""
+
+
+class OllamaClient:
+    """Async Ollama client sharing one pooled HTTP connection across requests"""
+
+    def __init__(self, url: str, max_concurrency: int = 3, timeout: float = 120):
+        self.url = url
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Create the pooled client on first use (inside the running event loop)"""
+        # httpx is imported here so the API starts without paying for it
+        import httpx
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=10),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def generate(self, model: str, prompt: str, options: Dict = None,
+                       format: Union[str, Dict, None] = None) -> str:
+        """Run a non-streaming generate request, waiting for a free slot first"""
+        client = self._get_client()
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": options or {}
+        }
+        if format is not None:
+            payload["format"] = format
+
+        async with self._semaphore:
+            try:
+                response = await client.post(self.url, json=payload)
+            except Exception as e:
+                raise self._translate(e)
+            response.raise_for_status()
+
+        result = response.json()
+        return result.get("response", "").strip()
+
+    async def generate_stream(self, model: str, prompt: str, options: Dict = None,
+                              format: Union[str, Dict, None] = None) -> AsyncIterator[str]:
+        """Run a streaming generate request and yield response tokens as they arrive"""
+        client = self._get_client()
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "options": options or {}
+        }
+        if format is not None:
+            payload["format"] = format
+
+        async with self._semaphore:
+            try:
+                async with client.stream("POST", self.url, json=payload) as response:
+                    response.raise_for_status()
+                    # Ollama streams one JSON object per line
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            raise RuntimeError(chunk["error"])
+                        if chunk.get("response"):
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+            except Exception as e:
+                raise self._translate(e)
+
+    @staticmethod
+    def _translate(error: Exception) -> Exception:
+        """Surface httpx timeouts as LLMTimeoutError so callers need not import httpx"""
+        import httpx
+
+        if isinstance(error, httpx.TimeoutException):
+            return LLMTimeoutError(str(error) or "Ollama request timed out")
+        return error
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,27 +1,33 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
-import whisper
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, StreamingResponse
 import asyncio
 import tempfile
 import os
 import json
-import subprocess
-import requests
+import hashlib
+import time
 from pathlib import Path
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 import shutil
-from typing import List, Optional
-from pydantic import BaseModel
-import anthropic
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Import our database
-from database import MeetingDatabase
+from database import MeetingDatabase, CONTENT_FIELDS
+from llm_client import OllamaClient, LLMTimeoutError
+from llm_cache import LLMResponseCache
+from transcription import WhisperModelRegistry, AudioDecodeError, TranscriptionQueueFull, WINDOW_SECONDS
+from chunking import estimate_tokens, split_transcript, group_by_budget
+from job_events import JobEventBroker, format_sse
+from exports import (ExportCache, content_disposition, export_response, is_not_modified, iter_ndjson,
+                     iter_zip, make_etag, parse_timestamp, render_meeting_txt, render_session_txt,
+                     validator_headers)
 
 # Initialize FastAPI app
 app = FastAPI(title="Local Meeting Notes Generator")
@@ -34,9 +40,115 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 db = MeetingDatabase()
 
 # Global variables
-whisper_model = None
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
+# Number of section prompts sent to Ollama at the same time. Raise together
+# with OLLAMA_NUM_PARALLEL on the Ollama server; 1 runs them one by one.
+OLLAMA_MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY", "3"))
+
+# Identical prompts are answered from a SQLite cache next to meetings.db
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "100"))
+
+# Whisper runs in separate worker processes, each holding its own model
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", "1"))
+# Transcriptions that may wait for a free worker; callers beyond that are turned away
+WHISPER_QUEUE_SIZE = int(os.getenv("WHISPER_QUEUE_SIZE", "4"))
+
+# Extra models an upload may ask for with ?model= (WHISPER_MODEL is always allowed).
+# Models load on first use; WHISPER_MODEL is loaded in the background at startup
+# unless WHISPER_PRELOAD is off, and idle models are unloaded to free RAM
+WHISPER_MODELS = [name.strip() for name in os.getenv("WHISPER_MODELS", "").split(",") if name.strip()]
+WHISPER_PRELOAD = os.getenv("WHISPER_PRELOAD", "true").lower() in ("1", "true", "yes")
+WHISPER_IDLE_TIMEOUT = float(os.getenv("WHISPER_IDLE_TIMEOUT", "1800"))
+
+# Silence is trimmed and speech is cut into segments at pauses, which are
+# transcribed in parallel across the worker processes
+WHISPER_VAD = os.getenv("WHISPER_VAD", "true").lower() in ("1", "true", "yes")
+WHISPER_SEGMENT_SECONDS = float(os.getenv("WHISPER_SEGMENT_SECONDS", "180"))
+
+# Bulk imports decode several files together and send their 30 second
+# windows through Whisper in batches of WHISPER_BATCH_SIZE
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "8"))
+BULK_FILES_PER_BATCH = int(os.getenv("BULK_FILES_PER_BATCH", "4"))
+
+# Meetings accepted by one bulk create/update request (one transaction)
+BULK_MEETINGS_MAX = int(os.getenv("BULK_MEETINGS_MAX", "10000"))
+
+# Rendered downloads are kept in memory, keyed by meeting id + updated_at
+EXPORT_CACHE_MB = int(os.getenv("EXPORT_CACHE_MB", "32"))
+
+# Options passed to whisper's transcribe(); part of the transcript cache key
+WHISPER_DECODE_OPTIONS = {}
+if os.getenv("WHISPER_LANGUAGE"):
+    WHISPER_DECODE_OPTIONS["language"] = os.getenv("WHISPER_LANGUAGE")
+
+def transcript_cache_options(batched: bool = False) -> Dict:
+    """Transcript cache key settings: the decode options plus how the audio was cut up.
+
+    Bulk imports decode fixed windows without timestamps or temperature
+    fallback, so their transcripts are kept apart from single uploads, and
+    changing WHISPER_VAD or WHISPER_SEGMENT_SECONDS transcribes again.
+    """
+    if batched:
+        decoder = {"decode_mode": "batched_windows", "vad": WHISPER_VAD, "window_seconds": WINDOW_SECONDS}
+    elif WHISPER_VAD:
+        decoder = {"decode_mode": "speech_segments", "vad": True, "segment_seconds": WHISPER_SEGMENT_SECONDS}
+    else:
+        decoder = {"decode_mode": "full", "vad": False}
+    return {**WHISPER_DECODE_OPTIONS, **decoder}
+
+# Uploads are streamed to disk in fixed-size pieces, so memory per upload
+# stays at one chunk regardless of file size
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_KB", "1024")) * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "500")) * 1024 * 1024
+
+# Server directory that bulk directory imports may read from (disabled when unset)
+BULK_IMPORT_DIR = os.getenv("BULK_IMPORT_DIR")
+
+# Context window requested from Ollama for every prompt (its own default is
+# much smaller, and it silently drops the start of prompts that overflow it)
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "8192"))
+# Part of the context kept free for the model's answer (also its length limit)
+NOTES_OUTPUT_TOKENS = int(os.getenv("NOTES_OUTPUT_TOKENS", "2048"))
+
+# Transcripts longer than one chunk are summarized map-reduce style so every
+# prompt fits in the model context. The chunk size is whatever remains of
+# OLLAMA_NUM_CTX after the prompt template and NOTES_OUTPUT_TOKENS;
+# NOTES_CHUNK_TOKENS can only lower it.
+NOTES_CHUNK_TOKENS = int(os.getenv("NOTES_CHUNK_TOKENS") or "0")
+NOTES_CHUNK_OVERLAP_TOKENS = int(os.getenv("NOTES_CHUNK_OVERLAP_TOKENS", "200"))
+
+# "sections" sends one prompt per section; "single_pass" asks for all three
+# as one JSON object and falls back to "sections" if the output is invalid
+NOTES_GENERATION_MODES = {"sections", "single_pass"}
+NOTES_GENERATION_MODE = os.getenv("NOTES_GENERATION_MODE", "sections")
+if NOTES_GENERATION_MODE not in NOTES_GENERATION_MODES:
+    raise ValueError(f"Unsupported NOTES_GENERATION_MODE '{NOTES_GENERATION_MODE}'. "
+                     f"Available: {', '.join(sorted(NOTES_GENERATION_MODES))}")
+
+NOTES_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executive_summary": {"type": "string"},
+        "action_items": {"type": "string"},
+        "meeting_outline": {"type": "string"}
+    },
+    "required": ["executive_summary", "action_items", "meeting_outline"]
+}
+
+# Job queue settings
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2"))
+# Created on startup: asyncio primitives must belong to the server's event loop
+job_available: Optional[asyncio.Event] = None
+job_worker_tasks = []
+maintenance_tasks = []
+job_events = JobEventBroker()
+bulk_tasks = set()
+export_cache = ExportCache(EXPORT_CACHE_MB * 1024 * 1024)
+
 # Pydantic models for API
 class MeetingCreate(BaseModel):
     title: str
@@ -53,73 +165,262 @@ class MeetingUpdate(BaseModel):
     scheduled_time: Optional[str] = None
     status: Optional[str] = None
 
+class BulkMeetings(BaseModel):
+    # Items are validated one by one so a bad item (even a non-object) only fails itself
+    meetings: List[Any]
+
+class BulkParticipant(BaseModel):
+    name: str = Field(min_length=1)
+    email: Optional[str] = ""
+    role: Optional[str] = ""
+
+class BulkMeetingCreate(MeetingCreate):
+    participants: List[BulkParticipant] = []
+
+class BulkMeetingUpdate(MeetingUpdate):
+    id: str = Field(min_length=1)
+    executive_summary: Optional[str] = None
+    action_items: Optional[str] = None
+    meeting_outline: Optional[str] = None
+    transcript: Optional[str] = None
+    participants: Optional[List[BulkParticipant]] = None
+
+def participant_rows(participants: List[BulkParticipant]) -> List[dict]:
+    """Validated participants as the dicts the database expects"""
+    return [{"name": p.name, "email": p.email or "", "role": p.role or ""} for p in participants]
+
+class BulkDirectoryImport(BaseModel):
+    directory: str = ""
+    meetings: Dict[str, str] = {}
+    mode: Optional[str] = None
+    model: Optional[str] = None
+    use_cache: bool = True
+
+def notes_json_error(response: str) -> Optional[str]:
+    """Why a single-pass response does not match NOTES_JSON_SCHEMA, or None if it does"""
+    try:
+        sections = json.loads(response)
+    except json.JSONDecodeError as e:
+        return f"response is not valid JSON: {e}"
+
+    if not isinstance(sections, dict):
+        return "response is not a JSON object"
+
+    for key in NOTES_JSON_SCHEMA["required"]:
+        value = sections.get(key)
+        if not isinstance(value, str) or not value.strip():
+            return f"response is missing section '{key}'"
+    return None
+
 class MeetingNotesProcessor:
     def __init__(self):
-        self.load_whisper_model()
+        self.llm_client = OllamaClient(OLLAMA_URL, max_concurrency=OLLAMA_MAX_CONCURRENCY)
+        self.llm_cache = LLMResponseCache(
+            str(Path(db.db_path).with_name("llm_cache.db")),
+            max_bytes=LLM_CACHE_MAX_MB * 1024 * 1024
+        )
+        self.whisper_models = WhisperModelRegistry(
+            default_model=WHISPER_MODEL,
+            models=WHISPER_MODELS,
+            idle_timeout=WHISPER_IDLE_TIMEOUT,
+            pool_size=WHISPER_WORKERS,
+            queue_size=WHISPER_QUEUE_SIZE,
+            vad=WHISPER_VAD,
+            max_segment_seconds=WHISPER_SEGMENT_SECONDS
+        )
+        self.chunk_tokens = self.chunk_token_budget()
     
-    def load_whisper_model(self):
-        """Load Whisper model on startup"""
-        global whisper_model
-        try:
-            print("Loading Whisper model...")
-            whisper_model = whisper.load_model("base")
-            print("Whisper model loaded successfully!")
-        except Exception as e:
-            print(f"Error loading Whisper model: {e}")
-            raise
+    def prompt_template_tokens(self) -> int:
+        """Tokens of the largest prompt template, without the transcript or notes in it"""
+        templates = list(self.build_section_prompts("").values()) + [
+            self.build_single_pass_prompt(""),
+            self.build_chunk_prompt("", 999, 999),
+            self.build_merge_prompt([""], 999)
+        ]
+        return max(estimate_tokens(template) for template in templates)
+    
+    def chunk_token_budget(self) -> int:
+        """Transcript tokens that fit in one prompt next to its template and the answer"""
+        budget = OLLAMA_NUM_CTX - self.prompt_template_tokens() - NOTES_OUTPUT_TOKENS
+        if NOTES_CHUNK_TOKENS > 0:
+            budget = min(budget, NOTES_CHUNK_TOKENS)
+        if budget <= 2 * NOTES_CHUNK_OVERLAP_TOKENS:
+            raise ValueError(f"OLLAMA_NUM_CTX={OLLAMA_NUM_CTX} leaves only {budget} tokens per transcript chunk "
+                             f"after the prompt template and NOTES_OUTPUT_TOKENS={NOTES_OUTPUT_TOKENS}")
+        return budget
     
     def check_ollama_connection(self):
         """Check if Ollama is running"""
+        import requests
+        
         try:
             response = requests.get("http://localhost:11434/api/tags", timeout=5)
             return response.status_code == 200
         except:
             return False
     
-    async def transcribe_audio(self, audio_path: str) -> str:
-        """Transcribe audio using Whisper"""
+    async def transcribe_audio(self, audio_path: str, model: Optional[str] = None) -> Dict:
+        """Transcribe audio using Whisper (WHISPER_MODEL unless another model is given).
+
+        Returns the text, the timestamped segments and the duration in seconds.
+        """
         try:
             print(f"Transcribing audio: {audio_path}")
-            result = whisper_model.transcribe(audio_path)
-            return result["text"].strip()
+            pool = self.whisper_models.get(model)
+            return await pool.transcribe(audio_path, **WHISPER_DECODE_OPTIONS)
+        except TranscriptionQueueFull:
+            # Not a failure of this recording: the caller can retry it later
+            raise
+        except AudioDecodeError as e:
+            print(f"FFmpeg error: {e}")
+            raise HTTPException(status_code=500, detail=f"Audio conversion failed: {str(e)}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
     
-    async def query_ollama(self, prompt: str, model: str = "llama3.2") -> str:
-        """Query local Ollama LLM"""
+    async def query_ollama(self, prompt: str, model: str = "llama3.2", format=None,
+                           use_cache: bool = True, on_token: Callable[[str], None] = None,
+                           validate: Callable[[str], bool] = None) -> str:
+        """Query local Ollama LLM (format: "json" or a JSON schema for structured output).
+
+        With on_token the response is streamed and each token is passed to it
+        as soon as Ollama produces it. With validate, only responses it accepts
+        are cached (or served from the cache), so a rejected answer is asked
+        for again next time instead of being replayed.
+        """
         try:
-            payload = {
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "top_k": 40
-                }
+            options = {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "top_k": 40,
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": NOTES_OUTPUT_TOKENS
             }
             
+            use_cache = use_cache and LLM_CACHE_ENABLED
+            if use_cache:
+                cache_key = self.llm_cache.make_key(model, prompt, options, format)
+                cached = await asyncio.to_thread(self.llm_cache.get, cache_key)
+                if cached is not None and (validate is None or validate(cached)):
+                    print(f"LLM cache hit for model: {model}")
+                    if on_token:
+                        on_token(cached)
+                    return cached
+            
             print(f"Querying Ollama with model: {model}")
-            response = requests.post(OLLAMA_URL, json=payload, timeout=120)
-            response.raise_for_status()
+            if on_token:
+                tokens = []
+                async for token in self.llm_client.generate_stream(model, prompt, options, format=format):
+                    tokens.append(token)
+                    on_token(token)
+                response = "".join(tokens).strip()
+            else:
+                response = await self.llm_client.generate(model, prompt, options, format=format)
             
-            result = response.json()
-            return result.get("response", "").strip()
+            if use_cache and response and (validate is None or validate(response)):
+                await asyncio.to_thread(self.llm_cache.put, cache_key, model, response)
+            return response
             
-        except requests.exceptions.Timeout:
+        except LLMTimeoutError:
             raise HTTPException(status_code=504, detail="LLM request timed out")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"LLM processing failed: {str(e)}")
 
-    async def process_meeting_transcript(self, transcript: str) -> dict:
-        """Process transcript with only 3 sections: Summary, Action Items, Outline"""
+    def build_chunk_prompt(self, chunk: str, part: int, total_parts: int) -> str:
+        """Prompt of the map step for one part of a long transcript"""
+        return f"""
+        You are an expert meeting secretary. Below is part {part} of {total_parts} of a long meeting transcript. Extract detailed notes from THIS PART ONLY, based ONLY on what was explicitly said.
+
+        TRANSCRIPT PART {part}/{total_parts}: {chunk}
+
+        Write the notes under these headings:
+
+        **Topics Discussed (in order):**
+        - Each topic with its key points, problems raised and solutions proposed
+
+        **Decisions:**
+        - Decisions made, deferred or still pending, with reasoning if mentioned
+
+        **Action Items & Commitments:**
+        - Task → Owner → Deadline (if mentioned), with exact quotes for commitments
+
+        **Key Information:**
+        - Data, metrics, updates, announcements, names of participants and their roles
+
+        RULES:
+        - Use bullet points and keep names, numbers and dates exactly as spoken
+        - Do not infer anything that was not said
+        - If a heading has no content in this part, write "None"
+        """
+
+    async def summarize_chunk(self, chunk: str, part: int, total_parts: int,
+                              use_cache: bool = True) -> str:
+        """Map step: extract notes from one part of a long transcript"""
+        return await self.query_ollama(self.build_chunk_prompt(chunk, part, total_parts), use_cache=use_cache)
+
+    def build_merge_prompt(self, notes: List[str], first_part: int) -> str:
+        """Prompt of the collapse step for the notes of consecutive parts"""
+        joined = "\n\n".join(
+            f"--- NOTES FOR PART {first_part + i} ---\n{note}" for i, note in enumerate(notes)
+        )
+        return f"""
+        You are an expert meeting secretary. Merge these notes from consecutive parts of one meeting into a single set of notes, keeping the chronological order.
+
+        {joined}
+
+        Keep the same headings (Topics Discussed, Decisions, Action Items & Commitments, Key Information).
+        Remove duplicates caused by overlapping parts, but keep every distinct action item, owner, deadline, decision, name and number.
+        """
+
+    async def merge_chunk_notes(self, notes: List[str], first_part: int,
+                                use_cache: bool = True) -> str:
+        """Collapse step: merge notes of consecutive parts into one set of notes"""
+        return await self.query_ollama(self.build_merge_prompt(notes, first_part), use_cache=use_cache)
+
+    async def prepare_transcript_context(self, transcript: str, use_cache: bool = True) -> tuple:
+        """Return the text the section prompts are built from, and the number of chunks.
+
+        Short transcripts are used verbatim. Long ones are split into
+        overlapping chunks that are summarized in parallel (map), then the
+        chunk notes are merged until they fit one prompt (reduce).
+        """
+        chunks = split_transcript(transcript, self.chunk_tokens, NOTES_CHUNK_OVERLAP_TOKENS)
+        if len(chunks) <= 1:
+            return transcript, 1
+        
+        print(f"Long transcript (~{estimate_tokens(transcript)} tokens): summarizing {len(chunks)} chunks...")
+        notes = await asyncio.gather(*[
+            self.summarize_chunk(chunk, i + 1, len(chunks), use_cache=use_cache)
+            for i, chunk in enumerate(chunks)
+        ])
+        
+        # Merge neighbouring notes until everything fits in a single prompt
+        while len(notes) > 1 and estimate_tokens("\n\n".join(notes)) > self.chunk_tokens:
+            groups = group_by_budget(notes, self.chunk_tokens)
+            if len(groups) == len(notes):
+                # Every note fills a chunk on its own; merge pairwise to make progress
+                groups = [notes[i:i + 2] for i in range(0, len(notes), 2)]
+            print(f"Merging {len(notes)} chunk notes into {len(groups)}...")
+            first_parts = []
+            part = 1
+            for group in groups:
+                first_parts.append(part)
+                part += len(group)
+            notes = await asyncio.gather(*[
+                self.merge_chunk_notes(group, first_part, use_cache=use_cache)
+                for group, first_part in zip(groups, first_parts)
+            ])
+        
+        context = "(Condensed notes of a long meeting, in chronological order)\n\n" + "\n\n".join(notes)
+        return context, len(chunks)
+
+    def build_section_prompts(self, transcript_context: str) -> dict:
+        """Build the prompts for the 3 sections: Summary, Action Items, Outline"""
 
         # 1. EXECUTIVE SUMMARY
-        print("Generating executive summary...")
         summary_prompt = f"""
         You are an experienced meeting analyst. Analyze this meeting transcript and create a precise, comprehensive executive summary based ONLY on what was explicitly discussed.
 
-        TRANSCRIPT: {transcript}
+        TRANSCRIPT: {transcript_context}
 
         Create a structured summary with these sections:
 
@@ -157,15 +458,11 @@ class MeetingNotesProcessor:
         - Focus on business value and actionable insights
         """
 
-
-        summary = await self.query_ollama(summary_prompt)
-
         # 2. ACTION ITEMS - Comprehensive but factual
-        print("Identifying action items...")
         action_items_prompt = f"""
        You are an expert project manager. Extract ALL action items, tasks, commitments, and follow-ups from this meeting transcript. Be thorough but only include explicitly mentioned items.
 
-        TRANSCRIPT: {transcript}
+        TRANSCRIPT: {transcript_context}
 
         Organize the action items into these categories:
 
@@ -213,14 +510,11 @@ class MeetingNotesProcessor:
         - Pay attention to phrases like "I'll", "we need to", "someone should", "let's"
         """
 
-        action_items = await self.query_ollama(action_items_prompt)
-
         # 3. COMPLETE MEETING OUTLINE - Detailed structure
-        print("Creating comprehensive meeting outline...")
         outline_prompt = f"""
        You are an expert meeting secretary. Create a detailed, structured outline that captures the complete flow and content of this meeting based ONLY on what actually occurred in the transcript.
 
-        TRANSCRIPT: {transcript}
+        TRANSCRIPT: {transcript_context}
 
         Create a comprehensive outline following this structure:
 
@@ -299,16 +593,126 @@ class MeetingNotesProcessor:
         - Use clear hierarchical structure with proper indentation
         """
 
-        outline = await self.query_ollama(outline_prompt)
+        return {
+            "executive_summary": summary_prompt,
+            "action_items": action_items_prompt,
+            "meeting_outline": outline_prompt
+        }
+
+    async def generate_sections(self, transcript_context: str, use_cache: bool = True,
+                                on_token: Callable[[str, str], None] = None) -> dict:
+        """Generate each section with its own prompt (on_token receives section, token)"""
+        prompts = self.build_section_prompts(transcript_context)
+
+        def section_tokens(section: str):
+            if on_token is None:
+                return None
+            return lambda token: on_token(section, token)
+
+        # The sections are independent, so request them concurrently; the
+        # client's concurrency cap decides how many actually run at once
+        print("Generating executive summary, action items and meeting outline...")
+        summary, action_items, outline = await asyncio.gather(
+            self.query_ollama(prompts["executive_summary"], use_cache=use_cache, on_token=section_tokens("executive_summary")),
+            self.query_ollama(prompts["action_items"], use_cache=use_cache, on_token=section_tokens("action_items")),
+            self.query_ollama(prompts["meeting_outline"], use_cache=use_cache, on_token=section_tokens("meeting_outline"))
+        )
 
         return {
-            "transcript": transcript,
             "executive_summary": summary,
             "action_items": action_items,
-            "meeting_outline": outline,
+            "meeting_outline": outline
+        }
+
+    def build_single_pass_prompt(self, transcript_context: str) -> str:
+        """Prompt asking for all three sections as one JSON object"""
+        return f"""
+        You are an experienced meeting analyst, project manager and meeting secretary. Analyze this meeting transcript and write three sections of meeting notes based ONLY on what was explicitly discussed.
+
+        TRANSCRIPT: {transcript_context}
+
+        Respond with a JSON object with exactly these keys. Each value is a single string of Markdown text:
+
+        "executive_summary": Sections **Meeting Context & Purpose:**, **Key Decisions Made:**, **Critical Discussion Points:**, **Outcomes & Agreements:** and **Notable Information:**, each with concise bullet points. Write "None discussed" for empty sections.
+
+        "action_items": Sections **🎯 IMMEDIATE ACTION ITEMS**, **📋 FOLLOW-UP TASKS**, **⏰ DEADLINES & TIME-SENSITIVE ITEMS**, **🤝 COMMITMENTS & PROMISES**, **❓ PENDING DECISIONS** and **📞 MEETINGS & COMMUNICATION**. Use "• [TASK] → Assigned to: [PERSON] → Due: [DEADLINE]" style bullets, include the person's name whenever mentioned and write "None identified" for empty sections.
+
+        "meeting_outline": A hierarchical outline with **📋 MEETING OVERVIEW**, **👥 PARTICIPANTS & ROLES**, **🚀 MEETING OPENING**, **💬 MAIN DISCUSSION FLOW** (one entry per topic in chronological order with key points, issues, proposed solutions and outcome), **🎯 DECISIONS & RESOLUTIONS**, **📊 KEY INFORMATION SHARED**, **🚦 MEETING CONCLUSION** and **📈 MEETING OUTCOMES**.
+
+        RULES:
+        - Only include information explicitly mentioned; do not infer or suggest
+        - Use exact quotes for commitments and important statements
+        - Output only the JSON object
+        """
+
+    async def generate_sections_single_pass(self, transcript_context: str,
+                                            use_cache: bool = True) -> Optional[dict]:
+        """Generate all sections in one JSON-formatted call.
+
+        Returns None when the response does not match NOTES_JSON_SCHEMA, so
+        the caller can fall back to one prompt per section.
+        """
+        print("Generating all sections in a single pass...")
+        response = await self.query_ollama(self.build_single_pass_prompt(transcript_context),
+                                           format=NOTES_JSON_SCHEMA, use_cache=use_cache,
+                                           validate=lambda text: notes_json_error(text) is None)
+
+        error = notes_json_error(response)
+        if error:
+            print(f"Single-pass {error}")
+            return None
+
+        sections = json.loads(response)
+        return {key: sections[key].strip() for key in NOTES_JSON_SCHEMA["required"]}
+
+    async def process_meeting_transcript(self, transcript: str, mode: str = None,
+                                         use_cache: bool = True,
+                                         on_token: Callable[[str, str], None] = None) -> dict:
+        """Process transcript with only 3 sections: Summary, Action Items, Outline.
+
+        use_cache=False bypasses the LLM response cache (e.g. to regenerate notes).
+        on_token(section, text) is called with section text as it is generated.
+        """
+        mode = mode or NOTES_GENERATION_MODE
+        started = time.perf_counter()
+
+        # Long meetings are condensed first so the prompts fit the model context
+        transcript_context, chunk_count = await self.prepare_transcript_context(transcript, use_cache=use_cache)
+        context_seconds = time.perf_counter() - started
+
+        sections = None
+        if mode == "single_pass":
+            sections = await self.generate_sections_single_pass(transcript_context, use_cache=use_cache)
+            if sections is None:
+                print("Falling back to one prompt per section")
+            elif on_token:
+                # The JSON is only usable once complete, so emit whole sections
+                for key, text in sections.items():
+                    on_token(key, text)
+
+        used_mode = "single_pass" if sections is not None else "sections"
+        if sections is None:
+            sections = await self.generate_sections(transcript_context, use_cache=use_cache, on_token=on_token)
+
+        total_seconds = time.perf_counter() - started
+        print(f"Notes generated in {total_seconds:.1f}s (mode: {used_mode})")
+
+        return {
+            "transcript": transcript,
+            "executive_summary": sections["executive_summary"],
+            "action_items": sections["action_items"],
+            "meeting_outline": sections["meeting_outline"],
             "generated_at": datetime.now().isoformat(),
             "word_count": len(transcript.split()),
-            "analysis_depth": "comprehensive_factual"
+            "analysis_depth": "comprehensive_factual" if chunk_count == 1 else "map_reduce",
+            "chunk_count": chunk_count,
+            "generation_mode": used_mode,
+            "requested_mode": mode,
+            "timings": {
+                "context_seconds": round(context_seconds, 2),
+                "generation_seconds": round(total_seconds - context_seconds, 2),
+                "total_seconds": round(total_seconds, 2)
+            }
         }
 
 
@@ -320,6 +724,7 @@ processor = MeetingNotesProcessor()
 @app.on_event("startup")
 async def startup_event():
     """Check system requirements on startup"""
+    global job_available
     print("🚀 Starting Meeting Management System...")
     
     # Ensure directories exist
@@ -332,6 +737,38 @@ async def startup_event():
         print("⚠️  Warning: Ollama is not running. Please start it with 'ollama serve'")
     else:
         print("✅ Ollama connection verified")
+    
+    # Start the Whisper worker processes in the background so the API is
+    # available while the models load
+    if WHISPER_PRELOAD:
+        maintenance_tasks.append(asyncio.create_task(processor.whisper_models.preload()))
+    if WHISPER_IDLE_TIMEOUT > 0:
+        maintenance_tasks.append(asyncio.create_task(processor.whisper_models.unload_idle()))
+    
+    # Resume jobs interrupted by a restart and start the queue workers
+    job_available = asyncio.Event()
+    requeued = await asyncio.to_thread(db.requeue_running_jobs)
+    if requeued:
+        print(f"🔁 Re-queued {requeued} interrupted job(s)")
+    
+    for worker_number in range(JOB_WORKERS):
+        job_worker_tasks.append(asyncio.create_task(job_worker(worker_number + 1)))
+    print(f"✅ Started {JOB_WORKERS} job worker(s)")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the job queue workers and close pooled connections"""
+    # Interrupted jobs are left running and re-queued on next startup
+    tasks = job_worker_tasks + maintenance_tasks + list(bulk_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    job_worker_tasks.clear()
+    maintenance_tasks.clear()
+    
+    await processor.llm_client.close()
+    processor.whisper_models.shutdown()
+    db.close()
 
 # MAIN PAGE ROUTES
 @app.get("/")
@@ -353,11 +790,18 @@ async def serve_meeting_page(meeting_id: str):
 async def health_check():
     """Health check endpoint"""
     ollama_status = processor.check_ollama_connection()
-    whisper_status = whisper_model is not None
+    whisper_pool = processor.whisper_models.get()
+    # Models load on demand, so Whisper counts as up unless loading failed
+    whisper_status = whisper_pool.available
     
     return {
         "status": "healthy" if (ollama_status and whisper_status) else "degraded",
         "whisper_loaded": whisper_status,
+        "whisper_model": WHISPER_MODEL,
+        "whisper_workers": whisper_pool.pool_size,
+        "transcriptions_active": sum(pool.active for pool in processor.whisper_models.pools),
+        "transcriptions_waiting": sum(pool.waiting for pool in processor.whisper_models.pools),
+        "whisper_models": processor.whisper_models.status(),
         "ollama_connected": ollama_status,
         "timestamp": datetime.now().isoformat()
     }
@@ -365,7 +809,7 @@ async def health_check():
 # MEETING CRUD API
 
 @app.post("/api/meetings")
-async def create_meeting(meeting: MeetingCreate):
+def create_meeting(meeting: MeetingCreate):
     """Create a new meeting"""
     try:
         meeting_id = db.create_meeting(
@@ -381,37 +825,108 @@ async def create_meeting(meeting: MeetingCreate):
         raise HTTPException(status_code=500, detail=f"Failed to create meeting: {str(e)}")
 
 @app.get("/api/meetings")
-async def list_meetings(status: Optional[str] = None, limit: int = 50, offset: int = 0):
-    """List meetings"""
+def list_meetings(status: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None,
+                  offset: int = 0):
+    """List meeting summaries (no transcripts or notes), newest first.
+
+    Pass next_cursor from a response as cursor to get the next page;
+    total counts every meeting matching the filter.
+    """
+    limit = max(1, min(limit, 500))
     try:
-        meetings = db.list_meetings(status=status, limit=limit, offset=offset)
-        return {"meetings": meetings, "total": len(meetings)}
+        page = db.list_meetings(status=status, limit=limit, after=cursor, offset=offset)
+        return {
+            "meetings": page["meetings"],
+            "total": db.count_meetings(status),
+            "next_cursor": page["next_cursor"]
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list meetings: {str(e)}")
 
+@app.get("/api/stats")
+def get_stats(weeks: int = 12):
+    """Dashboard statistics: meetings by status, words and audio recorded,
+    and meetings per week (from counters maintained on every write)"""
+    return db.get_stats(weeks=max(1, min(weeks, 520)))
+
+def parse_meeting_fields(fields: Optional[str], meeting: Dict) -> List[str]:
+    """Fields asked for with ?fields=, all of them by default.
+
+    Takes a comma separated list of field names; "metadata" stands for
+    everything except the transcript and notes. The id is always included.
+    """
+    metadata = [field for field in meeting if field not in CONTENT_FIELDS]
+    if not fields:
+        return metadata + CONTENT_FIELDS
+
+    selected = ['id']
+    for field in (name.strip() for name in fields.split(',')):
+        if not field:
+            continue
+        names = metadata if field == 'metadata' else [field]
+        if field != 'metadata' and field not in metadata and field not in CONTENT_FIELDS:
+            raise HTTPException(status_code=400, detail=f"Unknown field: {field}")
+        selected.extend(name for name in names if name not in selected)
+    return selected
+
 @app.get("/api/meetings/{meeting_id}")
-async def get_meeting(meeting_id: str):
-    """Get a specific meeting"""
-    meeting = db.get_meeting(meeting_id)
+def get_meeting(meeting_id: str, request: Request, fields: Optional[str] = None):
+    """Get a specific meeting.
+
+    fields= limits the response (e.g. fields=metadata or
+    fields=title,executive_summary); only the note sections asked for are
+    read and decompressed. Responses carry an ETag derived from updated_at,
+    and a matching If-None-Match gets a 304 without loading any content.
+    """
+    meeting = db.get_meeting(meeting_id, include_content=False)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
-    return meeting
 
-# 1. FIXED: Update meeting function to handle participants properly
-@app.put("/api/meetings/{meeting_id}")
-async def update_meeting(meeting_id: str, meeting_data: dict):
-    """Update a meeting - FIXED VERSION with participants support"""
-    print(f"Updating meeting {meeting_id} with data: {meeting_data}")
-    
-    if not meeting_data:
-        raise HTTPException(status_code=400, detail="No data provided")
+    selected = parse_meeting_fields(fields, meeting)
+    etag = make_etag(meeting_id, meeting['updated_at'], ','.join(sorted(selected)))
+    last_modified = parse_timestamp(meeting['updated_at'])
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    content_fields = [field for field in selected if field in CONTENT_FIELDS]
+    if content_fields:
+        meeting.update(db.get_meeting_content(meeting_id, content_fields))
+    return JSONResponse(content={field: meeting[field] for field in selected}, headers=headers)
+
+@app.get("/api/meetings/{meeting_id}/transcript")
+def get_transcript_segments(meeting_id: str, start: float = 0, end: Optional[float] = None,
+                            limit: int = 200):
+    """A time range of a meeting's transcript as timestamped segments.
+
+    Returns up to limit segments from the one playing at start (seconds),
+    stopping at end if given; request the next page with start=next_start.
+    """
+    meeting = db.get_meeting(meeting_id, include_content=False)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
     
-    # Get current meeting to verify it exists
-    current_meeting = db.get_meeting(meeting_id)
-    if not current_meeting:
+    page = db.get_transcript_segments(meeting_id, start=max(0.0, start), end=end,
+                                      limit=max(1, min(limit, 1000)))
+    return {"meeting_id": meeting_id, "duration_seconds": meeting["duration_seconds"], **page}
+
+@app.get("/api/meetings/{meeting_id}/transcript/search")
+def search_transcript(meeting_id: str, q: str, limit: int = 50):
+    """Segments of a meeting's transcript containing every word of q.
+
+    Each match has the audio offset (start, in seconds) to seek the
+    recording to.
+    """
+    if not db.get_meeting(meeting_id, include_content=False):
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    # Map all possible fields that can be updated
+    matches = db.find_transcript_segments(meeting_id, q, limit=max(1, min(limit, 500)))
+    return {"meeting_id": meeting_id, "query": q, "matches": matches}
+
+def collect_update_fields(meeting_data: dict) -> dict:
+    """Meeting fields to update from a request body (None values are skipped)"""
     update_fields = {}
     
     # Basic meeting info
@@ -446,6 +961,24 @@ async def update_meeting(meeting_id: str, meeting_data: dict):
         # Auto-update word count when transcript changes
         update_fields['word_count'] = len(meeting_data['transcript'].split())
     
+    return update_fields
+
+# 1. FIXED: Update meeting function to handle participants properly
+@app.put("/api/meetings/{meeting_id}")
+def update_meeting(meeting_id: str, meeting_data: dict):
+    """Update a meeting - FIXED VERSION with participants support"""
+    print(f"Updating meeting {meeting_id} with data: {meeting_data}")
+    
+    if not meeting_data:
+        raise HTTPException(status_code=400, detail="No data provided")
+    
+    # Get current meeting to verify it exists
+    current_meeting = db.get_meeting(meeting_id, include_content=False)
+    if not current_meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    # Map all possible fields that can be updated
+    update_fields = collect_update_fields(meeting_data)
     print(f"Mapped update fields: {update_fields}")
     
     # Handle participants separately if provided
@@ -490,7 +1023,7 @@ async def update_meeting(meeting_id: str, meeting_data: dict):
 
 
 @app.delete("/api/meetings/{meeting_id}")
-async def delete_meeting(meeting_id: str):
+def delete_meeting(meeting_id: str):
     """Delete a meeting"""
     success = db.delete_meeting(meeting_id)
     if not success:
@@ -499,111 +1032,112 @@ async def delete_meeting(meeting_id: str):
     return {"status": "deleted"}
 
 @app.get("/api/meetings/search/{query}")
-async def search_meetings(query: str):
-    """Search meetings"""
+def search_meetings(query: str, limit: int = 20, offset: int = 0):
+    """Full-text search over meetings, best matches first.
+
+    Each result has a snippet of the best matching field with the hits
+    wrapped in <mark></mark>; total counts every match for pagination.
+    """
+    limit = max(1, min(limit, 100))
     try:
-        meetings = db.search_meetings(query)
-        return {"meetings": meetings, "total": len(meetings)}
+        results = db.search_meetings(query, limit=limit, offset=max(0, offset))
+        return {**results, "limit": limit, "offset": max(0, offset)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 # AUDIO PROCESSING ROUTES
 
-@app.post("/api/meetings/{meeting_id}/process-audio")
-async def process_meeting_audio(meeting_id: str, file: UploadFile = File(...)):
-    """Process audio for a specific meeting"""
-    
-    # Check if meeting exists
-    meeting = db.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    
-    # Validate file
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file provided")
-    
-    allowed_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4', '.webm'}
-    file_extension = Path(file.filename).suffix.lower()
-    
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Unsupported file format. Supported: {', '.join(allowed_extensions)}"
-        )
-    
-    # Check system requirements
-    if not processor.check_ollama_connection():
-        raise HTTPException(status_code=503, detail="Ollama service is not available")
-    
-    if whisper_model is None:
-        raise HTTPException(status_code=503, detail="Whisper model is not loaded")
-    
-    # Generate unique session ID for this processing
-    session_id = str(uuid.uuid4())
-    
-    # Create temporary file
-    temp_dir = Path("uploads")
-    temp_audio_path = temp_dir / f"{session_id}{file_extension}"
+ALLOWED_AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4', '.webm'}
+
+async def update_job_progress(job_id: str, stage: str, progress: int, message: str):
+    """Record job progress and tell anyone streaming the job's events"""
+    await asyncio.to_thread(db.update_job, job_id, stage=stage, progress=progress, message=message)
+    job_events.publish(job_id, "stage", {"stage": stage, "progress": progress, "message": message})
+
+async def run_audio_job(job: dict) -> dict:
+    """Run the decode/transcribe -> generate pipeline for a queued job"""
+    job_id = job["id"]
+    meeting_id = job["meeting_id"]
+    file_extension = job["file_extension"]
+    temp_audio_path = Path(job["audio_path"])
+    keep_upload = False
     
     try:
-        print(f"Processing audio for meeting: {meeting_id}")
+        meeting = await asyncio.to_thread(db.get_meeting, meeting_id, include_content=False)
+        if not meeting:
+            raise HTTPException(status_code=404, detail="Meeting not found")
         
-        # Save uploaded file
-        with open(temp_audio_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        print(f"Processing audio for meeting: {meeting_id} (job {job_id})")
         
-        print(f"Saved audio file: {temp_audio_path} ({len(content)} bytes)")
-        
-        # Convert to WAV if needed
-        final_audio_path = temp_audio_path
-        if file_extension != '.wav':
-            wav_path = temp_dir / f"{session_id}.wav"
-            try:
-                print(f"Converting {file_extension} to WAV...")
-                subprocess.run([
-                    'ffmpeg', '-i', str(temp_audio_path), 
-                    '-ar', '16000', '-ac', '1', '-c:a', 'pcm_s16le', 
-                    str(wav_path)
-                ], check=True, capture_output=True, text=True)
-                final_audio_path = wav_path
-                print("Audio conversion completed")
-            except subprocess.CalledProcessError as e:
-                print(f"FFmpeg error: {e}")
-                raise HTTPException(status_code=500, detail=f"Audio conversion failed: {e}")
+        options = job.get("options") or {}
+        use_cache = options.get("use_cache", True)
+        whisper_model = options.get("model") or WHISPER_MODEL
         
-        # Transcribe audio
-        print(f"Starting transcription of: {final_audio_path}")
-        transcript = await processor.transcribe_audio(str(final_audio_path))
+        # Re-uploads of the same recording reuse the earlier transcript, and
+        # bulk imports pick up the transcript of their batch
+        audio_hash = job.get("audio_hash")
+        transcription = None
+        if audio_hash and (use_cache or options.get("transcribed_in_batch")):
+            cache_options = transcript_cache_options(batched=bool(options.get("transcribed_in_batch")))
+            transcription = await asyncio.to_thread(db.get_cached_transcript, audio_hash, whisper_model,
+                                                    cache_options)
         
-        if not transcript.strip():
-            raise HTTPException(status_code=400, detail="No speech detected in audio file")
-        
-        print(f"Transcription completed: {len(transcript)} characters")
+        if transcription is not None:
+            print(f"Transcript cache hit for audio {audio_hash[:12]}, skipping transcription")
+            await update_job_progress(job_id, stage="transcribing", progress=55, message="Reusing previous transcript...")
+        else:
+            # Decode (once, in memory) and transcribe audio
+            await update_job_progress(job_id, stage="transcribing", progress=25, message="Transcribing speech...")
+            print(f"Starting transcription of: {temp_audio_path}")
+            transcription = await processor.transcribe_audio(str(temp_audio_path), model=whisper_model)
+            
+            if not transcription["text"].strip():
+                raise HTTPException(status_code=400, detail="No speech detected in audio file")
+            
+            print(f"Transcription completed: {len(transcription['text'])} characters, "
+                  f"{len(transcription['segments'])} segments")
+            if audio_hash:
+                await asyncio.to_thread(db.save_cached_transcript, audio_hash, whisper_model,
+                                        transcript_cache_options(), transcription)
+        transcript = transcription["text"]
         
         # Process transcript
+        await update_job_progress(job_id, stage="generating", progress=60, message="Generating notes...")
         print("Starting AI analysis...")
-        result = await processor.process_meeting_transcript(transcript)
+        result = await processor.process_meeting_transcript(
+            transcript,
+            mode=options.get("mode"),
+            use_cache=use_cache,
+            on_token=lambda section, text: job_events.publish(
+                job_id, "token", {"section": section, "text": text}
+            )
+        )
         print("AI analysis completed")
         
         # Save audio file permanently
+        await update_job_progress(job_id, stage="saving", progress=95, message="Saving results...")
         audio_dir = Path("audio_files")
         audio_dir.mkdir(exist_ok=True)
         permanent_audio_path = audio_dir / f"{meeting_id}{file_extension}"
-        shutil.copy2(temp_audio_path, permanent_audio_path)
+        # Move rather than copy: the upload is not needed in uploads/ any more
+        shutil.move(str(temp_audio_path), str(permanent_audio_path))
         print(f"Audio saved permanently: {permanent_audio_path}")
         
-        # REPLACE WITH:
-        update_success = db.update_meeting(
-        meeting_id,
-        status="completed",
-        audio_file_path=str(permanent_audio_path),
-        transcript=result["transcript"],
-        executive_summary=result["executive_summary"],
-        action_items=result["action_items"],
-        meeting_outline=result["meeting_outline"],
-         word_count=result["word_count"]
+        update_fields = dict(
+            status="completed",
+            audio_file_path=str(permanent_audio_path),
+            transcript=result["transcript"],
+            executive_summary=result["executive_summary"],
+            action_items=result["action_items"],
+            meeting_outline=result["meeting_outline"],
+            word_count=result["word_count"]
         )
+        # Transcripts cached by older versions have no duration
+        if transcription.get("duration"):
+            update_fields["duration_seconds"] = round(transcription["duration"])
+        # The transcript and its segments are written in one transaction
+        update_success = await asyncio.to_thread(db.update_meeting, meeting_id,
+                                                 segments=transcription["segments"], **update_fields)
        
         if not update_success:
             print("Warning: Could not update meeting in database")
@@ -619,38 +1153,228 @@ async def process_meeting_audio(meeting_id: str, file: UploadFile = File(...)):
         
         # Return result with meeting info
         result["meeting_id"] = meeting_id
-        result["session_id"] = session_id
+        result["session_id"] = job_id
         result["meeting_title"] = meeting["title"]
         
         print("Processing completed successfully!")
         return result
+    
+    except TranscriptionQueueFull:
+        # The job goes back on the queue, so its upload is still needed
+        keep_upload = True
+        raise
+    
+    finally:
+        # Cleanup the upload if it was not moved into audio_files/
+        if not keep_upload and temp_audio_path.exists():
+            try:
+                temp_audio_path.unlink()
+                print(f"Cleaned up temporary file: {temp_audio_path}")
+            except Exception as e:
+                print(f"Warning: Could not delete {temp_audio_path}: {e}")
+
+async def job_worker(worker_number: int):
+    """Drain the job queue, one job at a time"""
+    print(f"Job worker {worker_number} started")
+    while True:
+        job = await asyncio.to_thread(db.claim_next_job)
+        if job is None:
+            # Sleep until a new job is queued (or poll again as a safety net)
+            job_available.clear()
+            try:
+                await asyncio.wait_for(job_available.wait(), timeout=JOB_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            continue
         
-    except Exception as e:
-        print(f"Processing error: {e}")
-        if isinstance(e, HTTPException):
+        try:
+            result = await run_audio_job(job)
+            await asyncio.to_thread(
+                db.update_job,
+                job["id"],
+                status="completed",
+                stage="done",
+                progress=100,
+                message="Complete!",
+                result=result,
+                finished_at=datetime.now().isoformat()
+            )
+            job_events.publish(job["id"], "done", {"result": result})
+        except asyncio.CancelledError:
+            # Server is shutting down; the job is re-queued on next startup
             raise
-        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+        except TranscriptionQueueFull as e:
+            # Other callers (e.g. a bulk import) hold every Whisper slot: retry later
+            print(f"Job {job['id']} re-queued: {e}")
+            await asyncio.to_thread(db.update_job, job["id"], status="queued", stage="queued", progress=0,
+                                    message="Waiting for a free transcription slot")
+            await asyncio.sleep(JOB_POLL_INTERVAL)
+        except Exception as e:
+            await fail_job(job["id"], e.detail if isinstance(e, HTTPException) else str(e))
+
+async def fail_job(job_id: str, error: str):
+    """Mark a job as failed and tell anyone streaming its events"""
+    print(f"Job {job_id} failed: {error}")
+    await asyncio.to_thread(
+        db.update_job,
+        job_id,
+        status="failed",
+        message="Processing failed",
+        error=error,
+        finished_at=datetime.now().isoformat()
+    )
+    job_events.publish(job_id, "failed", {"error": error})
+
+async def wait_for_job(job_id: str) -> dict:
+    """Block until a job finishes and return its result (for legacy clients)"""
+    while True:
+        job = await asyncio.to_thread(db.get_job, job_id)
+        if job is None:
+            # Deleting the meeting deletes its jobs with it
+            raise HTTPException(status_code=404, detail="Meeting was deleted before processing finished")
+        if job["status"] == "completed":
+            return job["result"]
+        if job["status"] == "failed":
+            raise HTTPException(status_code=500, detail=f"Processing failed: {job['error']}")
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+
+async def save_upload(file: UploadFile, destination: Path) -> tuple:
+    """Stream an upload to disk chunk by chunk, returning its size and SHA-256.
+
+    The hash lets repeated uploads be recognised without reading the file again.
+    Disk writes and hashing run in a worker thread so a large upload doesn't
+    stall the event loop.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+
+    def write_chunk(buffer, chunk: bytes):
+        hasher.update(chunk)
+        buffer.write(chunk)
+
+    try:
+        buffer = await asyncio.to_thread(open, destination, "wb")
+        try:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+                    )
+                await asyncio.to_thread(write_chunk, buffer, chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+    except Exception:
+        destination.unlink(missing_ok=True)
+        raise
     
-    finally:
-        # Cleanup temporary files
-        for path in [temp_audio_path, temp_dir / f"{session_id}.wav"]:
-            if path.exists():
-                try:
-                    path.unlink()
-                    print(f"Cleaned up temporary file: {path}")
-                except Exception as e:
-                    print(f"Warning: Could not delete {path}: {e}")
+    return size, hasher.hexdigest()
+
+def check_audio_processing(filenames: List[str], mode: Optional[str] = None, model: Optional[str] = None):
+    """Reject unsupported files or modes, and uploads the system cannot process right now"""
+    
+    # Validate files
+    if not filenames or not all(filenames):
+        raise HTTPException(status_code=400, detail="No file provided")
+    
+    if mode is not None and mode not in NOTES_GENERATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported mode. Supported: {', '.join(sorted(NOTES_GENERATION_MODES))}"
+        )
+    
+    for filename in filenames:
+        if Path(filename).suffix.lower() not in ALLOWED_AUDIO_EXTENSIONS:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Unsupported file format: {filename}. Supported: {', '.join(ALLOWED_AUDIO_EXTENSIONS)}"
+            )
+    
+    try:
+        whisper_pool = processor.whisper_models.get(model)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Check system requirements
+    if not processor.check_ollama_connection():
+        raise HTTPException(status_code=503, detail="Ollama service is not available")
+    
+    if not whisper_pool.available:
+        raise HTTPException(status_code=503, detail="Whisper model is not loaded")
+    
+    if whisper_pool.full:
+        raise HTTPException(status_code=503, detail="Transcription queue is full, try again later")
+
+def new_upload_path(filename: str) -> Path:
+    """Unique path in uploads/ where a worker can pick the audio up"""
+    temp_dir = Path("uploads")
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"{uuid.uuid4()}{Path(filename).suffix.lower()}"
+
+async def enqueue_audio_job(meeting_id: str, file: UploadFile, mode: Optional[str] = None,
+                            use_cache: bool = True, model: Optional[str] = None) -> str:
+    """Validate and save an upload, then queue it for processing"""
+    check_audio_processing([file.filename], mode, model)
+    
+    file_extension = Path(file.filename).suffix.lower()
+    temp_audio_path = new_upload_path(file.filename)
+    
+    size, audio_hash = await save_upload(file, temp_audio_path)
+    print(f"Saved audio file: {temp_audio_path} ({size} bytes, sha256 {audio_hash[:12]})")
+    
+    job_id = await asyncio.to_thread(
+        db.create_job,
+        meeting_id,
+        str(temp_audio_path),
+        file_extension,
+        options={"mode": mode, "use_cache": use_cache, "model": model},
+        audio_hash=audio_hash
+    )
+    job_available.set()
+    print(f"Queued job {job_id} for meeting {meeting_id}")
+    return job_id
+
+@app.post("/api/meetings/{meeting_id}/process-audio", status_code=202)
+async def process_meeting_audio(meeting_id: str, file: UploadFile = File(...), mode: Optional[str] = None,
+                                use_cache: bool = True, model: Optional[str] = None):
+    """Queue audio for a specific meeting and return the job ID immediately.
+
+    mode selects how notes are generated ("sections" or "single_pass");
+    defaults to NOTES_GENERATION_MODE. use_cache=false transcribes and
+    generates again instead of reusing cached transcripts and LLM responses.
+    model picks one of the configured Whisper models (WHISPER_MODEL by default).
+    """
+    
+    # Check if meeting exists
+    meeting = await asyncio.to_thread(db.get_meeting, meeting_id, include_content=False)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    job_id = await enqueue_audio_job(meeting_id, file, mode=mode, use_cache=use_cache, model=model)
+    
+    return {
+        "job_id": job_id,
+        "meeting_id": meeting_id,
+        "status": "queued",
+        "status_url": f"/api/jobs/{job_id}",
+        "result_url": f"/api/jobs/{job_id}/result"
+    }
 
 @app.post("/process-audio")
-async def process_audio_legacy(file: UploadFile = File(...)):
+async def process_audio_legacy(file: UploadFile = File(...), mode: Optional[str] = None,
+                               use_cache: bool = True, model: Optional[str] = None):
     """Legacy audio processing endpoint for direct app usage"""
     
     # For backward compatibility, create a temporary meeting
-    temp_meeting_id = str(uuid.uuid4())
     now = datetime.now()
     
     # Create temporary meeting in database
-    db.create_meeting(
+    temp_meeting_id = await asyncio.to_thread(
+        db.create_meeting,
         title=f"Quick Recording - {now.strftime('%Y-%m-%d %H:%M')}",
         agenda="Auto-generated from file upload",
         scheduled_date=now.strftime('%Y-%m-%d'),
@@ -659,158 +1383,557 @@ async def process_audio_legacy(file: UploadFile = File(...)):
         tags=["quick-upload"]
     )
     
-    # Process using the meeting-specific endpoint logic
-    return await process_meeting_audio(temp_meeting_id, file)
+    # Legacy clients expect the notes in the response, so wait for the job
+    job_id = await enqueue_audio_job(temp_meeting_id, file, mode=mode, use_cache=use_cache, model=model)
+    return await wait_for_job(job_id)
 
-# DOWNLOAD ROUTES
+# BULK IMPORT
 
-# 3. FIXED: Download function for 3 sections
-@app.get("/api/meetings/{meeting_id}/download")
-async def download_meeting_notes(meeting_id: str, format: str = "txt"):
-    """Download meeting notes in specified format - UPDATED for 3 sections"""
+def copy_audio_file(source: Path, destination: Path) -> tuple:
+    """Copy a server-side recording into uploads/, returning its size and SHA-256"""
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            while True:
+                chunk = src.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                hasher.update(chunk)
+                dst.write(chunk)
+    except Exception:
+        destination.unlink(missing_ok=True)
+        raise
     
-    meeting = db.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+    return size, hasher.hexdigest()
+
+def create_import_meeting(filename: str) -> str:
+    """Create a meeting for an imported recording that was not mapped to one"""
+    now = datetime.now()
+    return db.create_meeting(
+        title=Path(filename).stem,
+        agenda="Imported in bulk",
+        scheduled_date=now.strftime('%Y-%m-%d'),
+        scheduled_time=now.strftime('%H:%M'),
+        participants=[],
+        tags=["bulk-import"]
+    )
+
+async def start_bulk_jobs(items: List[dict], mode: Optional[str], use_cache: bool,
+                          model: Optional[str] = None) -> List[dict]:
+    """Create a held job per saved recording and start transcribing them in batches.
+
+    Each item has filename, audio_path and audio_hash, plus an optional
+    meeting_id (a new meeting is created when it is missing).
+    """
+    jobs = []
+    for item in items:
+        meeting_id = item.get("meeting_id") or await asyncio.to_thread(create_import_meeting, item["filename"])
+        job_id = await asyncio.to_thread(
+            db.create_job,
+            meeting_id,
+            item["audio_path"],
+            Path(item["filename"]).suffix.lower(),
+            options={"mode": mode, "use_cache": use_cache, "model": model, "transcribed_in_batch": True},
+            audio_hash=item["audio_hash"],
+            held=True
+        )
+        jobs.append({**item, "job_id": job_id, "meeting_id": meeting_id})
     
-    if not meeting.get('transcript'):
-        raise HTTPException(status_code=400, detail="Meeting has not been processed yet")
+    task = asyncio.create_task(run_bulk_transcription(jobs, use_cache, model))
+    bulk_tasks.add(task)
+    task.add_done_callback(bulk_tasks.discard)
+    print(f"Started bulk import of {len(jobs)} recording(s)")
     
-    if format == "json":
-        # Return meeting data as JSON
-        return JSONResponse(content=meeting)
+    return [
+        {
+            "job_id": job["job_id"],
+            "meeting_id": job["meeting_id"],
+            "filename": job["filename"],
+            "status": "running",
+            "status_url": f"/api/jobs/{job['job_id']}",
+            "result_url": f"/api/jobs/{job['job_id']}/result"
+        }
+        for job in jobs
+    ]
+
+async def release_bulk_job(job_id: str):
+    """Hand a transcribed bulk job to the queue workers for note generation"""
+    await asyncio.to_thread(db.update_job, job_id, status="queued")
+    await update_job_progress(job_id, stage="queued", progress=55, message="Transcribed, waiting for a worker")
+    job_available.set()
+
+async def run_bulk_transcription(jobs: List[dict], use_cache: bool, model: Optional[str] = None):
+    """Transcribe bulk-imported recordings BULK_FILES_PER_BATCH files at a time"""
+    whisper_model = model or WHISPER_MODEL
+    for start in range(0, len(jobs), BULK_FILES_PER_BATCH):
+        pending = []
+        for job in jobs[start:start + BULK_FILES_PER_BATCH]:
+            cached = use_cache and await asyncio.to_thread(
+                db.get_cached_transcript, job["audio_hash"], whisper_model, transcript_cache_options(batched=True)
+            )
+            if cached:
+                await release_bulk_job(job["job_id"])
+            else:
+                pending.append(job)
+        
+        if not pending:
+            continue
+        
+        for job in pending:
+            await update_job_progress(
+                job["job_id"], stage="transcribing", progress=25,
+                message=f"Transcribing speech (batch of {len(pending)} files)..."
+            )
+        
+        while True:
+            try:
+                results = await processor.whisper_models.get(whisper_model).transcribe_batch(
+                    [job["audio_path"] for job in pending],
+                    batch_size=WHISPER_BATCH_SIZE,
+                    **WHISPER_DECODE_OPTIONS
+                )
+            except TranscriptionQueueFull:
+                # The files are already accepted; try the batch again once a slot frees up
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+                continue
+            except Exception as e:
+                results = [e] * len(pending)
+            break
+        
+        for job, result in zip(pending, results):
+            if isinstance(result, Exception):
+                prefix = "Audio conversion failed" if isinstance(result, AudioDecodeError) else "Transcription failed"
+                error = f"{prefix}: {result}"
+            elif not result["text"].strip():
+                error = "No speech detected in audio file"
+            else:
+                await asyncio.to_thread(db.save_cached_transcript, job["audio_hash"], whisper_model,
+                                        transcript_cache_options(batched=True), result)
+                await release_bulk_job(job["job_id"])
+                continue
+            
+            await fail_job(job["job_id"], error)
+            Path(job["audio_path"]).unlink(missing_ok=True)
+
+@app.post("/api/bulk/process-audio", status_code=202)
+async def process_audio_bulk(files: List[UploadFile] = File(...), meeting_ids: List[str] = Form([]),
+                             mode: Optional[str] = None, use_cache: bool = True,
+                             model: Optional[str] = None):
+    """Queue many recordings at once.
+
+    meeting_ids maps the files, in order, to existing meetings; files without
+    one (or with an empty ID) get a new meeting named after the file.
+    Whisper runs over the files in batches before notes are generated.
+    """
+    if meeting_ids and len(meeting_ids) != len(files):
+        raise HTTPException(status_code=400, detail="meeting_ids must have one entry per file")
+    
+    check_audio_processing([file.filename for file in files], mode, model)
+    
+    for meeting_id in meeting_ids:
+        if meeting_id and not await asyncio.to_thread(db.get_meeting, meeting_id, include_content=False):
+            raise HTTPException(status_code=404, detail=f"Meeting not found: {meeting_id}")
+    
+    items = []
+    try:
+        for index, file in enumerate(files):
+            temp_audio_path = new_upload_path(file.filename)
+            _, audio_hash = await save_upload(file, temp_audio_path)
+            items.append({
+                "filename": file.filename,
+                "audio_path": str(temp_audio_path),
+                "audio_hash": audio_hash,
+                "meeting_id": meeting_ids[index] if meeting_ids else None
+            })
+    except Exception:
+        for item in items:
+            Path(item["audio_path"]).unlink(missing_ok=True)
+        raise
+    
+    jobs = await start_bulk_jobs(items, mode, use_cache, model)
+    return {"count": len(jobs), "jobs": jobs}
+
+@app.post("/api/bulk/process-directory", status_code=202)
+async def process_directory_bulk(request: BulkDirectoryImport):
+    """Queue every recording in a directory under BULK_IMPORT_DIR.
+
+    meetings maps file names to existing meetings; other files get a new
+    meeting named after the file. The originals are copied, not moved.
+    """
+    if not BULK_IMPORT_DIR:
+        raise HTTPException(status_code=403, detail="Directory imports are disabled. Set BULK_IMPORT_DIR to enable them")
+    
+    root = Path(BULK_IMPORT_DIR).resolve()
+    directory = (root / request.directory).resolve()
+    if directory != root and root not in directory.parents:
+        raise HTTPException(status_code=400, detail="Directory must be inside BULK_IMPORT_DIR")
+    if not directory.is_dir():
+        raise HTTPException(status_code=404, detail="Directory not found")
+    
+    sources = sorted(
+        path for path in directory.iterdir()
+        if path.is_file() and path.suffix.lower() in ALLOWED_AUDIO_EXTENSIONS
+    )
+    if not sources:
+        raise HTTPException(status_code=400, detail="No audio files found in directory")
     
-    elif format == "txt":
+    unknown = set(request.meetings) - {path.name for path in sources}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Files not found in directory: {', '.join(sorted(unknown))}")
+    
+    check_audio_processing([path.name for path in sources], request.mode, request.model)
+    
+    for meeting_id in request.meetings.values():
+        if not await asyncio.to_thread(db.get_meeting, meeting_id, include_content=False):
+            raise HTTPException(status_code=404, detail=f"Meeting not found: {meeting_id}")
+    
+    items = []
+    try:
+        for source in sources:
+            temp_audio_path = new_upload_path(source.name)
+            _, audio_hash = await asyncio.to_thread(copy_audio_file, source, temp_audio_path)
+            items.append({
+                "filename": source.name,
+                "audio_path": str(temp_audio_path),
+                "audio_hash": audio_hash,
+                "meeting_id": request.meetings.get(source.name)
+            })
+    except Exception:
+        for item in items:
+            Path(item["audio_path"]).unlink(missing_ok=True)
+        raise
+    
+    jobs = await start_bulk_jobs(items, request.mode, request.use_cache, request.model)
+    return {"count": len(jobs), "jobs": jobs}
+
+def validation_message(error: ValidationError) -> str:
+    """One line per invalid field of a pydantic error"""
+    return "; ".join(f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+                     for item in error.errors())
+
+def check_bulk_size(items: list):
+    """Reject empty and oversized bulk requests"""
+    if not items:
+        raise HTTPException(status_code=400, detail="No meetings provided")
+    if len(items) > BULK_MEETINGS_MAX:
+        raise HTTPException(status_code=400,
+                            detail=f"At most {BULK_MEETINGS_MAX} meetings per request (got {len(items)})")
+
+@app.post("/api/bulk/meetings")
+async def bulk_create_meetings(request: BulkMeetings):
+    """Create many meetings (same fields as POST /api/meetings) in one transaction.
+
+    Invalid items are reported by index in results and skipped; the
+    valid ones are created together.
+    """
+    check_bulk_size(request.meetings)
+    
+    results = []
+    valid = []
+    for index, item in enumerate(request.meetings):
+        if not isinstance(item, dict):
+            results.append({"index": index, "error": "Item must be a JSON object"})
+            continue
+        try:
+            meeting = BulkMeetingCreate(**item)
+        except ValidationError as e:
+            results.append({"index": index, "error": validation_message(e)})
+            continue
+        valid.append((index, meeting))
+    
+    try:
+        meeting_ids = await asyncio.to_thread(db.create_meetings, [
+            {
+                "title": meeting.title,
+                "agenda": meeting.agenda,
+                "scheduled_date": meeting.scheduled_date,
+                "scheduled_time": meeting.scheduled_time,
+                "participants": participant_rows(meeting.participants),
+                "tags": meeting.tags
+            }
+            for _, meeting in valid
+        ]) if valid else []
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create meetings: {str(e)}")
+    
+    results.extend({"index": index, "meeting_id": meeting_id}
+                   for (index, _), meeting_id in zip(valid, meeting_ids))
+    results.sort(key=lambda result: result["index"])
+    return {"created": len(meeting_ids), "failed": len(results) - len(meeting_ids), "results": results}
+
+@app.put("/api/bulk/meetings")
+async def bulk_update_meetings(request: BulkMeetings):
+    """Update many meetings in one transaction.
+
+    Each item has the meeting "id" plus any fields PUT /api/meetings/{id}
+    accepts (including participants). Invalid items, items without
+    fields to update, and unknown meetings are reported in results.
+    """
+    check_bulk_size(request.meetings)
+    
+    results = [None] * len(request.meetings)
+    updates = []
+    for index, item in enumerate(request.meetings):
+        if not isinstance(item, dict):
+            results[index] = {"index": index, "error": "Item must be a JSON object"}
+            continue
+        try:
+            meeting = BulkMeetingUpdate(**item)
+        except ValidationError as e:
+            results[index] = {"index": index, "error": validation_message(e)}
+            if isinstance(item.get("id"), str):
+                results[index] = {"index": index, "meeting_id": item["id"], **results[index]}
+            continue
+        
+        update = collect_update_fields(meeting.model_dump(exclude={"id", "participants"}))
+        if meeting.participants is not None:
+            update["participants"] = participant_rows(meeting.participants)
+        if not update:
+            results[index] = {"index": index, "meeting_id": meeting.id, "error": "No valid fields to update"}
+            continue
+        updates.append((index, {"id": meeting.id, **update}))
+    
+    try:
+        found = await asyncio.to_thread(db.update_meetings, [update for _, update in updates]) if updates else []
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to update meetings: {str(e)}")
+    
+    for (index, update), exists in zip(updates, found):
+        results[index] = {"index": index, "meeting_id": update["id"]}
+        if not exists:
+            results[index]["error"] = "Meeting not found"
+    
+    updated = sum(1 for result in results if "error" not in result)
+    return {"updated": updated, "failed": len(results) - updated, "results": results}
+
+# JOB ROUTES
+
+@app.get("/api/jobs")
+def list_jobs(meeting_id: Optional[str] = None, status: Optional[str] = None, limit: int = 50):
+    """List processing jobs"""
+    jobs = db.list_jobs(meeting_id=meeting_id, status=status, limit=limit)
+    return {"jobs": jobs, "total": len(jobs)}
+
+@app.get("/api/jobs/{job_id}")
+def get_job_status(job_id: str):
+    """Get status and progress of a processing job"""
+    job = db.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    job.pop("result", None)
+    job.pop("audio_path", None)
+    return job
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Stream job progress and note tokens as server-sent events.
+
+    Events: status (current state on connect), snapshot (sections streamed
+    before connecting), stage, token ({section, text} to append), done
+    ({result}) and failed ({error}).
+    """
+    if not await asyncio.to_thread(db.get_job, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        # Subscribe and copy the streamed text without awaiting in between, so
+        # every later token is in the queue and none is in both
+        queue = job_events.subscribe(job_id)
+        partial = job_events.partial_sections(job_id)
         try:
-            # Create formatted text file with 3 sections
-            txt_content = f"""PROFESSIONAL MEETING NOTES
-═══════════════════════════════════════════════════════════════
-
-Meeting: {meeting['title']}
-Date: {meeting['scheduled_date']} at {meeting['scheduled_time']}
-Generated: {meeting['updated_at']}
-Word Count: {meeting['word_count']} words
-
-═══════════════════════════════════════════════════════════════
-AGENDA
-═══════════════════════════════════════════════════════════════
-{meeting['agenda'] or 'No agenda specified'}
-
-═══════════════════════════════════════════════════════════════
-EXECUTIVE SUMMARY
-═══════════════════════════════════════════════════════════════
-{meeting['executive_summary'] or 'No summary available'}
-
-═══════════════════════════════════════════════════════════════
-ACTION ITEMS & COMMITMENTS
-═══════════════════════════════════════════════════════════════
-{meeting['action_items'] or 'No action items identified'}
-
-═══════════════════════════════════════════════════════════════
-COMPLETE MEETING OUTLINE
-═══════════════════════════════════════════════════════════════
-{meeting['meeting_outline'] or 'No outline available'}
-
-═══════════════════════════════════════════════════════════════
-FULL TRANSCRIPT
-═══════════════════════════════════════════════════════════════
-{meeting['transcript'] or 'No transcript available'}
-
-═══════════════════════════════════════════════════════════════
-Generated by Local Meeting Notes AI
-Privacy-First | Completely Local Processing
-═══════════════════════════════════════════════════════════════
-"""
+            job = await asyncio.to_thread(db.get_job, job_id)
             
-            # Save to file
-            txt_file = Path("output") / f"meeting_notes_{meeting_id}.txt"
-            with open(txt_file, "w", encoding='utf-8') as f:
-                f.write(txt_content)
+            yield format_sse("status", {
+                key: job.get(key) for key in ("status", "stage", "progress", "message", "queue_position")
+            })
+            if partial:
+                yield format_sse("snapshot", {"sections": partial})
             
-            return FileResponse(
-                str(txt_file),
-                filename=f"{meeting['title'].replace(' ', '_')}_{meeting['scheduled_date']}.txt",
-                media_type="text/plain; charset=utf-8"
-            )
+            if job["status"] == "completed":
+                yield format_sse("done", {"result": job["result"]})
+                return
+            if job["status"] == "failed":
+                yield format_sse("failed", {"error": job["error"]})
+                return
             
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error creating text file: {str(e)}")
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                yield format_sse(event, data)
+                if event in ("done", "failed"):
+                    return
+        finally:
+            job_events.unsubscribe(job_id, queue)
     
-    else:
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/api/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+    """Get the generated notes of a finished processing job"""
+    job = db.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=f"Processing failed: {job['error']}")
+    
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is not finished yet (status: {job['status']})")
+    
+    return job["result"]
+
+# LLM CACHE ROUTES
+
+@app.get("/api/llm-cache")
+def get_llm_cache_stats():
+    """LLM response cache size and hit/miss counters"""
+    stats = processor.llm_cache.stats()
+    stats["enabled"] = LLM_CACHE_ENABLED
+    return stats
+
+@app.get("/api/storage")
+async def get_storage_report():
+    """Compressed size of stored transcripts and notes against their original size"""
+    return await asyncio.to_thread(db.storage_report)
+
+@app.delete("/api/llm-cache")
+def clear_llm_cache():
+    """Drop every cached LLM response"""
+    removed = processor.llm_cache.clear()
+    return {"status": "cleared", "removed": removed}
+
+# DOWNLOAD ROUTES
+
+@app.get("/api/export-cache")
+async def get_export_cache_stats():
+    """Rendered download cache size and hit/miss counters"""
+    return export_cache.stats()
+
+# 3. FIXED: Download function for 3 sections
+@app.get("/api/meetings/{meeting_id}/download")
+def download_meeting_notes(meeting_id: str, request: Request, format: str = "txt"):
+    """Download meeting notes in specified format - UPDATED for 3 sections
+
+    Renderings are served from memory and cached per updated_at; clients
+    revalidate with If-None-Match / If-Modified-Since and get a 304 when
+    nothing changed.
+    """
+    if format not in ("txt", "json"):
         raise HTTPException(status_code=400, detail="Unsupported format. Use 'txt' or 'json'")
 
+    # Cheap lookup first: a 304 or a cache hit never loads the content
+    meeting = db.get_meeting(meeting_id, include_content=False)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    def render() -> bytes:
+        full = db.get_meeting(meeting_id)
+        if not full or not full.get('transcript'):
+            raise HTTPException(status_code=400, detail="Meeting has not been processed yet")
+        if format == "json":
+            return json.dumps(full, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return render_meeting_txt(full).encode("utf-8")
+
+    if format == "json":
+        media_type, filename = "application/json", None
+    else:
+        media_type = "text/plain; charset=utf-8"
+        filename = f"{meeting['title'].replace(' ', '_')}_{meeting['scheduled_date']}.txt"
+
+    return export_response(
+        request, export_cache,
+        key=("meeting", meeting_id, meeting['updated_at'], format),
+        render=render,
+        media_type=media_type,
+        etag=make_etag(meeting_id, meeting['updated_at'], format),
+        last_modified=parse_timestamp(meeting['updated_at']),
+        filename=filename
+    )
+
 
 @app.get("/download/{session_id}")
-async def download_notes_legacy(session_id: str, format: str = "txt"):
+def download_notes_legacy(session_id: str, request: Request, format: str = "txt"):
     """Legacy download endpoint for backward compatibility"""
     
     # Try to find meeting by session ID first, then by meeting ID
-    meeting = db.get_meeting(session_id)
+    meeting = db.get_meeting(session_id, include_content=False)
     if meeting:
-        return await download_meeting_notes(session_id, format)
+        return download_meeting_notes(session_id, request, format)
     
     # Fall back to file-based download for old sessions
     output_file = Path("output") / f"meeting_notes_{session_id}.json"
     
     if not output_file.exists():
         raise HTTPException(status_code=404, detail="Meeting notes not found")
-    
-    if format == "json":
-        return FileResponse(str(output_file), filename=f"meeting_notes_{session_id}.json")
-    
-    elif format == "txt":
+
+    if format not in ("txt", "json"):
+        raise HTTPException(status_code=400, detail="Unsupported format. Use 'txt' or 'json'")
+
+    # The file's mtime and size version the cached rendering
+    stat = output_file.stat()
+
+    def render() -> bytes:
+        if format == "json":
+            return output_file.read_bytes()
         try:
-            # Load the JSON data
             with open(output_file, "r", encoding='utf-8') as f:
                 data = json.load(f)
-            
-            # Create formatted text
-            txt_content = f"""MEETING NOTES
-Session: {session_id}
-Generated: {data.get('generated_at', 'Unknown')}
-Word Count: {data.get('word_count', 0)} words
-
-===============================================
-EXECUTIVE SUMMARY
-===============================================
-{data.get('executive_summary', 'No summary available')}
-
-===============================================
-ACTION ITEMS
-===============================================
-{data.get('action_items', 'No action items identified')}
-
-===============================================
-MEETING OUTLINE
-===============================================
-{data.get('meeting_outline', 'No outline available')}
-
-===============================================
-FULL TRANSCRIPT
-===============================================
-{data.get('transcript', 'No transcript available')}
-
-===============================================
-Generated by Local Meeting Notes AI
-===============================================
-"""
-            
-            # Save to temporary file
-            txt_file = Path("output") / f"meeting_notes_{session_id}.txt"
-            with open(txt_file, "w", encoding='utf-8') as f:
-                f.write(txt_content)
-            
-            return FileResponse(
-                str(txt_file),
-                filename=f"meeting_notes_{session_id}.txt",
-                media_type="text/plain; charset=utf-8"
-            )
-            
-        except Exception as e:
+        except (OSError, ValueError) as e:
             raise HTTPException(status_code=500, detail=f"Error creating text file: {str(e)}")
-    
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported format. Use 'txt' or 'json'")
+        return render_session_txt(session_id, data).encode("utf-8")
+
+    return export_response(
+        request, export_cache,
+        key=("session", session_id, stat.st_mtime_ns, stat.st_size, format),
+        render=render,
+        media_type="application/json" if format == "json" else "text/plain; charset=utf-8",
+        etag=make_etag(session_id, stat.st_mtime_ns, stat.st_size, format),
+        last_modified=datetime.fromtimestamp(int(stat.st_mtime), timezone.utc),
+        filename=f"meeting_notes_{session_id}.{format}"
+    )
+
+@app.get("/api/export")
+async def export_meetings(format: str = "ndjson", status: Optional[str] = None,
+                          date_from: Optional[str] = None, date_to: Optional[str] = None):
+    """Stream every meeting (optionally by status / scheduled date range) as NDJSON or a zip.
+
+    The archive is produced while it is sent, from a single database
+    cursor, so exporting a large database takes no extra memory or disk.
+    """
+    if format not in ("ndjson", "zip"):
+        raise HTTPException(status_code=400, detail="Unsupported format. Use 'ndjson' or 'zip'")
+    for name, value in (("date_from", date_from), ("date_to", date_to)):
+        if value:
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"{name} must be a date (YYYY-MM-DD)")
+
+    meetings = db.iter_meetings(status=status, date_from=date_from, date_to=date_to)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if format == "ndjson":
+        return StreamingResponse(
+            iter_ndjson(meetings),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": content_disposition(f"meetings_{stamp}.ndjson")}
+        )
+    return StreamingResponse(
+        iter_zip(meetings),
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(f"meetings_{stamp}.zip")}
+    )
 
 if __name__ == "__main__":
     import uvicorn
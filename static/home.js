@@ -350,7 +350,7 @@ class MeetingManager {
         const statusClass = `status-${meeting.status}`;
         const statusText = meeting.status.charAt(0).toUpperCase() + meeting.status.slice(1).replace('-', ' ');
         
-        const hasNotes = meeting.transcript && meeting.transcript.trim().length > 0;
+        const hasNotes = meeting.has_notes ?? (meeting.transcript && meeting.transcript.trim().length > 0);
         const notesIcon = hasNotes ? '📝' : '⏳';
         const notesText = hasNotes ? 'Has notes' : 'No recording yet';
     
@@ -370,6 +370,7 @@ class MeetingManager {
                 </div>
                 
                 ${meeting.agenda ? `<div class="meeting-agenda">${this.escapeHtml(meeting.agenda)}</div>` : ''}
+                ${meeting.snippet ? `<div class="meeting-snippet">${this.renderSnippet(meeting.snippet)}</div>` : ''}
                 
                 <div class="meeting-meta">
                     <span>${notesIcon} ${notesText}</span>
@@ -379,18 +380,27 @@ class MeetingManager {
         `;
     }
 
-    updateStats() {
-        const totalMeetings = this.meetings.length;
-        const plannedMeetings = this.meetings.filter(m => m.status === 'planned').length;
-        const completedMeetings = this.meetings.filter(m => m.status === 'completed').length;
-        
-        // Calculate total hours (rough estimate based on completed meetings)
-        const totalHours = completedMeetings * 1; // Assume 1 hour per meeting on average
-        
-        document.getElementById('totalMeetings').textContent = totalMeetings;
-        document.getElementById('plannedMeetings').textContent = plannedMeetings;
-        document.getElementById('completedMeetings').textContent = completedMeetings;
-        document.getElementById('totalHours').textContent = totalHours;
+    async updateStats() {
+        // Counted by the server over every meeting, not just the loaded page
+        try {
+            const response = await fetch('/api/stats');
+            if (!response.ok) return;
+            const stats = await response.json();
+            
+            document.getElementById('totalMeetings').textContent = stats.total_meetings;
+            document.getElementById('plannedMeetings').textContent = stats.by_status.planned || 0;
+            document.getElementById('completedMeetings').textContent = stats.by_status.completed || 0;
+            document.getElementById('totalHours').textContent = stats.total_hours;
+        } catch (error) {
+            console.error('Error loading stats:', error);
+        }
+    }
+
+    renderSnippet(snippet) {
+        // Escape the text, then restore the <mark> tags the search added
+        return this.escapeHtml(snippet)
+            .replace(/&lt;mark&gt;/g, '<mark>')
+            .replace(/&lt;\/mark&gt;/g, '</mark>');
     }
 
     escapeHtml(text) {
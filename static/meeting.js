@@ -1231,30 +1231,25 @@ handleRecordingError(error) {
         formData.append('file', file);
 
         console.log('Uploading file to server...');
-        this.startRealisticProgress();
+        this.updateProgress(1, 'Uploading file...');
 
-        // Use meeting-specific endpoint
+        // Use meeting-specific endpoint; the server queues the job and answers immediately
         const response = await fetch(`/api/meetings/${this.meetingId}/process-audio`, {
             method: 'POST',
             body: formData
         });
 
-        this.stopProgressSimulation();
-
         if (!response.ok) {
-            const errorText = await response.text();
-            let errorMessage = 'Processing failed';
-            try {
-                const errorJson = JSON.parse(errorText);
-                errorMessage = errorJson.detail || errorMessage;
-            } catch {
-                errorMessage = errorText || errorMessage;
-            }
-            throw new Error(errorMessage);
+            throw new Error(await this.readErrorMessage(response));
         }
 
+        const { job_id } = await response.json();
+        console.log(`📥 Queued processing job: ${job_id}`);
+
+        const result = await this.waitForJob(job_id);
+        this.stopProgressSimulation();
+
         this.updateProgress(5, 'Complete!');
-        const result = await response.json();
         this.currentSessionId = result.meeting_id;
 
         console.log('🎉 Processing completed successfully');
@@ -1303,6 +1298,58 @@ handleRecordingError(error) {
     }
 }
 
+async readErrorMessage(response) {
+    const errorText = await response.text();
+    let errorMessage = 'Processing failed';
+    try {
+        const errorJson = JSON.parse(errorText);
+        errorMessage = errorJson.detail || errorMessage;
+    } catch {
+        errorMessage = errorText || errorMessage;
+    }
+    return errorMessage;
+}
+
+async waitForJob(jobId) {
+    // Map server-side job stages onto the progress steps
+    const stageSteps = {
+        queued: 1,
+        starting: 1,
+        converting: 2,
+        transcribing: 3,
+        generating: 4,
+        saving: 5,
+        done: 5
+    };
+
+    while (true) {
+        const response = await fetch(`/api/jobs/${jobId}`);
+        if (!response.ok) {
+            throw new Error(await this.readErrorMessage(response));
+        }
+
+        const job = await response.json();
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Processing failed');
+        }
+
+        if (job.status === 'completed') {
+            const resultResponse = await fetch(`/api/jobs/${jobId}/result`);
+            if (!resultResponse.ok) {
+                throw new Error(await this.readErrorMessage(resultResponse));
+            }
+            return resultResponse.json();
+        }
+
+        const message = job.status === 'queued' && job.queue_position
+            ? `Waiting in queue (position ${job.queue_position})...`
+            : job.message;
+        this.updateProgress(stageSteps[job.stage] || 1, message);
+
+        await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+}
+
 startRealisticProgress() {
     this.currentStep = 1;
     this.updateProgress(1, 'Uploading file...');
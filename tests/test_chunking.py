@@ -0,0 +1,78 @@
+"""Chunk sizes and overlap of the map-reduce transcript splitter."""
+
+import unittest
+
+from chunking import estimate_tokens, group_by_budget, split_sentences, split_transcript
+
+
+def transcript(sentences: int) -> str:
+    return ' '.join(f'Speaker {i % 3} raised point number {i} about the budget.' for i in range(sentences))
+
+
+class SplitTranscriptTest(unittest.TestCase):
+
+    def test_short_transcript_is_one_chunk(self):
+        text = transcript(10)
+        self.assertEqual(split_transcript(text, 1000, 100), [text])
+        self.assertEqual(split_transcript('   ', 1000, 100), [])
+
+    def test_chunks_stay_within_budget(self):
+        text = transcript(2000)
+        chunks = split_transcript(text, 500, 50)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 500)
+
+    def test_consecutive_chunks_overlap_by_whole_sentences(self):
+        chunks = split_transcript(transcript(2000), 500, 50)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            previous_sentences = split_sentences(previous)
+            current_sentences = split_sentences(current)
+            shared = [sentence for sentence in current_sentences if sentence in previous_sentences]
+
+            # The shared sentences are the tail of one chunk and the head of the next
+            self.assertTrue(shared)
+            self.assertEqual(previous_sentences[-len(shared):], shared)
+            self.assertEqual(current_sentences[:len(shared)], shared)
+            self.assertLessEqual(sum(estimate_tokens(sentence) + 1 for sentence in shared), 50)
+
+    def test_every_sentence_is_kept_in_order(self):
+        text = transcript(2000)
+        chunks = split_transcript(text, 500, 50)
+
+        seen = []
+        for chunk in chunks:
+            for sentence in split_sentences(chunk):
+                if not seen or sentence != seen[-1] and sentence not in seen[-20:]:
+                    seen.append(sentence)
+        self.assertEqual(seen, split_sentences(text))
+
+    def test_no_overlap_when_disabled(self):
+        chunks = split_transcript(transcript(2000), 500, 0)
+
+        self.assertEqual(sum(len(split_sentences(chunk)) for chunk in chunks), 2000)
+
+    def test_unpunctuated_speech_is_still_split(self):
+        text = ' '.join(f'word{i}' for i in range(5000))
+        chunks = split_transcript(text, 300, 30)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 300)
+
+
+class GroupByBudgetTest(unittest.TestCase):
+
+    def test_groups_fit_budget_and_keep_order(self):
+        parts = [f'notes {i} ' * (i % 7 + 1) for i in range(40)]
+        groups = group_by_budget(parts, 40)
+
+        self.assertEqual([part for group in groups for part in group], parts)
+        for group in groups:
+            self.assertTrue(len(group) == 1 or sum(estimate_tokens(part) for part in group) <= 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
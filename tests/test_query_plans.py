@@ -0,0 +1,122 @@
+"""EXPLAIN QUERY PLAN checks for the hot queries indexed by migration 4.
+
+The statements are captured from MeetingDatabase itself (with a trace
+callback), so a query that stops matching its index fails here instead
+of quietly turning into a full table scan.
+"""
+
+import os
+import re
+import sqlite3
+import tempfile
+import unittest
+
+from database import MeetingDatabase
+
+
+def query_plan(conn: sqlite3.Connection, sql: str) -> list:
+    """Detail lines of EXPLAIN QUERY PLAN for a statement"""
+    return [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}')]
+
+
+def full_scans(plan: list, table: str) -> list:
+    """Plan lines that read every row of table"""
+    return [line for line in plan if re.fullmatch(rf'SCAN {table}( AS \w+)?', line)]
+
+
+class QueryPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = MeetingDatabase(os.path.join(self.tmpdir.name, 'meetings.db'))
+        self.meeting_ids = self.db.create_meetings([
+            {
+                'title': f'Meeting {i}',
+                'scheduled_date': f'2024-01-{i % 28 + 1:02d}',
+                'scheduled_time': '10:00',
+                'participants': [{'name': f'Person {i}'}],
+                'tags': ['weekly']
+            }
+            for i in range(20)
+        ])
+        self.db.create_job(self.meeting_ids[0], 'audio_files/test.mp3', '.mp3')
+        # No ANALYZE, like a real database: plans come from the indexes alone
+        self.conn = self.db._connect()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def capture(self, call, *args, **kwargs) -> list:
+        """SQL statements (with their parameters inlined) run by a database call"""
+        statements = []
+        self.conn.set_trace_callback(statements.append)
+        try:
+            call(*args, **kwargs)
+        finally:
+            self.conn.set_trace_callback(None)
+        return statements
+
+    def plan_for(self, statements: list, pattern: str) -> list:
+        """Query plan of the single captured statement matching pattern"""
+        # Triggers and foreign key actions report their parent statement again
+        matching = list(dict.fromkeys(sql for sql in statements if re.search(pattern, sql, re.S)))
+        self.assertEqual(len(matching), 1, f'{pattern!r} in {statements}')
+        return query_plan(self.conn, matching[0])
+
+    def test_participant_and_tag_lookups_use_meeting_indexes(self):
+        statements = self.capture(self.db.get_meeting, self.meeting_ids[0], include_content=False)
+
+        participants = self.plan_for(statements, r'FROM participants WHERE meeting_id')
+        self.assertFalse(full_scans(participants, 'participants'), participants)
+        self.assertTrue(any('idx_participants_meeting' in line for line in participants), participants)
+
+        tags = self.plan_for(statements, r'FROM tags WHERE meeting_id')
+        self.assertFalse(full_scans(tags, 'tags'), tags)
+        self.assertTrue(any('idx_tags_meeting' in line for line in tags), tags)
+
+    def test_status_filtered_keyset_page_uses_status_schedule_index(self):
+        first_page = self.db.list_meetings(status='planned', limit=5)
+        statements = self.capture(self.db.list_meetings, status='planned', limit=5,
+                                  after=first_page['next_cursor'])
+
+        plan = self.plan_for(statements, r'FROM meetings WHERE status = .* ORDER BY')
+        self.assertFalse(full_scans(plan, 'meetings'), plan)
+        self.assertTrue(any('idx_meetings_status_schedule' in line for line in plan), plan)
+        self.assertFalse(any('TEMP B-TREE' in line for line in plan), plan)
+
+    def test_job_claim_uses_status_created_index(self):
+        statements = self.capture(self.db.claim_next_job)
+
+        plan = self.plan_for(statements, r"FROM jobs WHERE status = 'queued'")
+        self.assertFalse(full_scans(plan, 'jobs'), plan)
+        self.assertTrue(any('idx_jobs_status_created' in line for line in plan), plan)
+        self.assertFalse(any('TEMP B-TREE' in line for line in plan), plan)
+
+    def test_cascaded_delete_finds_child_rows_by_index(self):
+        tables = [row[0] for row in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")]
+        children = [
+            (table, fk[3])
+            for table in tables
+            for fk in self.conn.execute(f'PRAGMA foreign_key_list({table})')
+            if fk[2] == 'meetings' and fk[6] == 'CASCADE'
+        ]
+        self.assertEqual(
+            {table for table, _ in children},
+            {'participants', 'tags', 'meeting_content', 'jobs', 'transcript_segments'}
+        )
+
+        # The statements SQLite runs for ON DELETE CASCADE on each child table
+        for table, column in children:
+            plan = query_plan(self.conn, f"DELETE FROM {table} WHERE {column} = 'x'")
+            self.assertFalse(full_scans(plan, table), (table, plan))
+
+        statements = self.capture(self.db.delete_meeting, self.meeting_ids[0])
+        plan = self.plan_for(statements, r'DELETE FROM meetings WHERE id')
+        self.assertFalse(full_scans(plan, 'meetings'), plan)
+        self.assertIsNone(self.db.get_meeting(self.meeting_ids[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
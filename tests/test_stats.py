@@ -0,0 +1,138 @@
+"""Trigger-maintained dashboard counters of migration 6.
+
+get_stats reads meeting_stats and meeting_weekly_stats instead of the
+meetings table; these checks recount the meetings table directly after
+inserts, updates and deletes, and after the migration backfills an
+existing database.
+"""
+
+import os
+import tempfile
+import unittest
+
+from database import MeetingDatabase
+
+
+def new_meetings(count: int, start: int = 0) -> list:
+    return [
+        {
+            'title': f'Meeting {i}',
+            'scheduled_date': f'2024-{i % 3 + 1:02d}-{i % 28 + 1:02d}',
+            'scheduled_time': '10:00'
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class StatsCountersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'meetings.db')
+        self.db = MeetingDatabase(self.db_path)
+        self.meeting_ids = self.db.create_meetings(new_meetings(30))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def recount(self) -> dict:
+        """What get_stats should return, counted from the meetings table"""
+        conn = self.db._connect()
+        rows = conn.execute('''
+            SELECT IFNULL(status, 'planned'), COUNT(*), SUM(IFNULL(word_count, 0)),
+                   SUM(IFNULL(duration_seconds, 0))
+            FROM meetings GROUP BY 1
+        ''').fetchall()
+        weeks = conn.execute('''
+            SELECT date(scheduled_date, 'weekday 0', '-6 days') AS week, COUNT(*)
+            FROM meetings WHERE week IS NOT NULL GROUP BY week ORDER BY week
+        ''').fetchall()
+        duration = sum(row[3] for row in rows)
+        return {
+            'total_meetings': sum(row[1] for row in rows),
+            'by_status': {status: meetings for status, meetings, _, _ in rows},
+            'total_words': sum(row[2] for row in rows),
+            'total_duration_seconds': duration,
+            'total_hours': round(duration / 3600, 1),
+            'meetings_per_week': [{'week': week, 'meetings': meetings} for week, meetings in weeks]
+        }
+
+    def assertStatsMatch(self):
+        self.assertEqual(self.db.get_stats(weeks=1000), self.recount())
+
+    def test_counts_follow_inserts(self):
+        self.assertEqual(self.db.get_stats(weeks=1000)['total_meetings'], 30)
+        self.assertStatsMatch()
+
+        self.db.create_meetings(new_meetings(5, start=100))
+        self.assertStatsMatch()
+
+    def test_counts_follow_updates(self):
+        for n, meeting_id in enumerate(self.meeting_ids[:10]):
+            self.db.update_meeting(meeting_id, status='completed', word_count=100 * n,
+                                   duration_seconds=60 * n)
+        self.assertStatsMatch()
+
+        # Change words only, then move meetings to another status and week
+        self.db.update_meeting(self.meeting_ids[0], word_count=5000)
+        self.db.update_meeting(self.meeting_ids[1], status='processing', scheduled_date='2025-06-02')
+        self.db.update_meeting(self.meeting_ids[2], transcript='one two three', word_count=3)
+        self.db.update_meetings([
+            {'id': meeting_id, 'scheduled_date': '2025-06-04'} for meeting_id in self.meeting_ids[10:15]
+        ])
+        self.assertStatsMatch()
+        self.assertIn({'week': '2025-06-02', 'meetings': 6},
+                      self.db.get_stats(weeks=1000)['meetings_per_week'])
+
+    def test_counts_follow_deletes(self):
+        self.db.update_meeting(self.meeting_ids[0], status='completed', word_count=250, duration_seconds=900)
+        self.db.update_meeting(self.meeting_ids[1], scheduled_date='2030-01-01')
+        for meeting_id in self.meeting_ids[:12]:
+            self.assertTrue(self.db.delete_meeting(meeting_id))
+        self.assertStatsMatch()
+
+        stats = self.db.get_stats(weeks=1000)
+        self.assertNotIn('completed', stats['by_status'])
+        # A week whose last meeting was deleted is dropped, not left at zero
+        self.assertNotIn('2029-12-31', [week['week'] for week in stats['meetings_per_week']])
+
+        for meeting_id in self.meeting_ids[12:]:
+            self.db.delete_meeting(meeting_id)
+        self.assertEqual(self.db.get_stats(weeks=1000), self.recount())
+        self.assertEqual(self.db.get_stats()['total_meetings'], 0)
+
+    def test_weeks_limit_keeps_latest_weeks_oldest_first(self):
+        per_week = self.db.get_stats(weeks=3)['meetings_per_week']
+
+        self.assertEqual(per_week, self.recount()['meetings_per_week'][-3:])
+
+    def test_migration_backfills_existing_meetings(self):
+        for n, meeting_id in enumerate(self.meeting_ids[:6]):
+            self.db.update_meeting(meeting_id, status='completed', word_count=10 * n, duration_seconds=30 * n)
+
+        # Take the database back to before migration 6 and open it again
+        conn = self.db._connect()
+        conn.executescript('''
+            DROP TRIGGER meeting_stats_insert;
+            DROP TRIGGER meeting_stats_delete;
+            DROP TRIGGER meeting_stats_update;
+            DROP TABLE meeting_stats;
+            DROP TABLE meeting_weekly_stats;
+            PRAGMA user_version = 5;
+        ''')
+        self.db.close()
+        self.db = MeetingDatabase(self.db_path)
+
+        self.assertEqual(self.db._connect().execute('PRAGMA user_version').fetchone()[0], 6)
+        self.assertEqual(self.db.get_stats(weeks=1000)['total_meetings'], 30)
+        self.assertStatsMatch()
+
+        # The triggers keep the backfilled counters up to date
+        self.db.delete_meeting(self.meeting_ids[0])
+        self.db.update_meeting(self.meeting_ids[1], word_count=999)
+        self.assertStatsMatch()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,504 @@
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+# Whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Whisper's encoder works on fixed 30 second windows
+WINDOW_SECONDS = 30
+
+# Whisper model owned by this worker process (loaded once by the initializer)
+_worker_model = None
+_worker_load_seconds = 0.0
+
+
+class AudioDecodeError(RuntimeError):
+    """ffmpeg could not decode the uploaded file"""
+
+
+class TranscriptionQueueFull(RuntimeError):
+    """Every running and queued transcription slot of a pool is taken"""
+
+
+def decode_audio(audio_path: str, sample_rate: int = SAMPLE_RATE):
+    """Decode any ffmpeg-readable file straight into a float32 NumPy array.
+
+    ffmpeg writes 16-bit mono PCM to a pipe, so there is a single decode
+    pass and no intermediate WAV file on disk.
+    """
+    import numpy as np
+
+    try:
+        process = subprocess.run([
+            'ffmpeg', '-nostdin', '-threads', '0', '-i', audio_path,
+            '-f', 's16le', '-ac', '1', '-acodec', 'pcm_s16le', '-ar', str(sample_rate),
+            '-'
+        ], check=True, capture_output=True)
+    except FileNotFoundError:
+        raise AudioDecodeError("ffmpeg is not installed")
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode('utf-8', errors='replace').strip().splitlines()
+        raise AudioDecodeError(message[-1] if message else str(e))
+
+    return np.frombuffer(process.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def _init_worker(model_name: str, num_threads: int):
+    """Load the Whisper model once when a worker process starts"""
+    global _worker_model, _worker_load_seconds
+    started = time.perf_counter()
+    import torch
+    import whisper
+
+    # Split the cores between workers instead of every process using all of them
+    torch.set_num_threads(num_threads)
+    print(f"[whisper worker {os.getpid()}] Loading Whisper model '{model_name}'...")
+    _worker_model = whisper.load_model(model_name)
+    _worker_load_seconds = time.perf_counter() - started
+    print(f"[whisper worker {os.getpid()}] Whisper model loaded in {_worker_load_seconds:.1f}s")
+
+
+def _warm_up() -> Dict:
+    """Run one inference on a second of silence so the first real request is not slow"""
+    import numpy as np
+
+    started = time.perf_counter()
+    _worker_model.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    return {
+        "pid": os.getpid(),
+        "load_seconds": _worker_load_seconds,
+        "warm_up_seconds": time.perf_counter() - started
+    }
+
+
+def _run_whisper(audio, options: Dict, offset_seconds: float = 0.0) -> Dict:
+    """Transcribe samples, shifting segment timestamps by offset_seconds"""
+    result = _worker_model.transcribe(audio, **options)
+    return {
+        "text": result["text"].strip(),
+        "segments": [
+            {
+                "start": round(segment["start"] + offset_seconds, 2),
+                "end": round(segment["end"] + offset_seconds, 2),
+                "text": segment["text"].strip(),
+                "avg_logprob": segment.get("avg_logprob")
+            }
+            for segment in result.get("segments", [])
+        ]
+    }
+
+
+def _transcribe(audio_path: str, options: Dict) -> Dict:
+    """Decode and transcribe a whole file with this worker's model.
+
+    Decoding happens here rather than in the API process so the (large)
+    sample buffer never has to be pickled between processes.
+    """
+    audio = decode_audio(audio_path)
+    result = _run_whisper(audio, options)
+    result["duration"] = round(len(audio) / SAMPLE_RATE, 2)
+    return result
+
+
+def _transcribe_segment(shm_name: str, total_samples: int, start: int, end: int, options: Dict) -> Dict:
+    """Transcribe one slice of the audio the API process put in shared memory"""
+    import numpy as np
+
+    # The API process owns the block and unlinks it once every segment is done
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        samples = np.ndarray((total_samples,), dtype=np.float32, buffer=shm.buf)
+        audio = samples[start:end].copy()
+        del samples
+    finally:
+        shm.close()
+
+    return _run_whisper(audio, options, offset_seconds=start / SAMPLE_RATE)
+
+
+def _transcribe_windows(shm_name: str, total_samples: int, windows: List[tuple], options: Dict) -> List[Dict]:
+    """Decode a batch of windows (from any number of files) in one forward pass.
+
+    Each window is at most WINDOW_SECONDS long, so the log-mel spectrograms
+    stack into a single (batch, n_mels, frames) tensor.
+    """
+    import numpy as np
+    import torch
+    import whisper
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        samples = np.ndarray((total_samples,), dtype=np.float32, buffer=shm.buf)
+        audio = [samples[start:end].copy() for start, end in windows]
+        del samples
+    finally:
+        shm.close()
+
+    mel = torch.stack([
+        whisper.log_mel_spectrogram(whisper.pad_or_trim(window), n_mels=_worker_model.dims.n_mels)
+        for window in audio
+    ]).to(_worker_model.device)
+
+    decode_options = whisper.DecodingOptions(
+        task=options.get("task", "transcribe"),
+        language=options.get("language"),
+        without_timestamps=True,
+        fp16=_worker_model.device.type == "cuda"
+    )
+    return [
+        {
+            "text": result.text.strip(),
+            "avg_logprob": result.avg_logprob,
+            "no_speech_prob": result.no_speech_prob
+        }
+        for result in whisper.decode(_worker_model, mel, decode_options)
+    ]
+
+
+class TranscriptionPool:
+    """Pool of worker processes that each hold their own Whisper model"""
+
+    def __init__(self, model_name: str = "base", pool_size: int = 1, queue_size: int = 4,
+                 vad: bool = True, max_segment_seconds: float = 180):
+        self.model_name = model_name
+        self.pool_size = max(1, pool_size)
+        self.queue_size = max(0, queue_size)
+        self.vad = vad
+        self.max_segment_seconds = max_segment_seconds
+        self.num_threads = max(1, (os.cpu_count() or 1) // self.pool_size)
+        self.ready = False
+        self.loading = False
+        self.error: Optional[str] = None
+        self.active = 0
+        self.load_seconds: Optional[float] = None
+        self.warm_up_seconds: Optional[float] = None
+        self.last_used = time.monotonic()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    def start(self):
+        """Create the process pool (workers load their model on first task)"""
+        if self._executor is not None:
+            return
+        # torch does not survive fork() well, so always spawn fresh interpreters
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.pool_size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_name, self.num_threads)
+        )
+
+    async def warm_up(self):
+        """Start every worker, load its model and run a warm-up inference"""
+        # Counts as use: the idle unloader must not stop workers mid-load
+        self.loading = True
+        self.last_used = time.monotonic()
+        self.start()
+        loop = asyncio.get_running_loop()
+        try:
+            print(f"Starting {self.pool_size} Whisper worker process(es) for model '{self.model_name}'...")
+            timings = await asyncio.gather(*[
+                loop.run_in_executor(self._executor, _warm_up)
+                for _ in range(self.pool_size)
+            ])
+            self.load_seconds = round(max(timing["load_seconds"] for timing in timings), 2)
+            self.warm_up_seconds = round(max(timing["warm_up_seconds"] for timing in timings), 2)
+            self.ready = True
+            print(f"Whisper workers ready! (model '{self.model_name}' loaded in {self.load_seconds:.1f}s, "
+                  f"warm-up {self.warm_up_seconds:.1f}s)")
+        except Exception as e:
+            self.error = str(e) or e.__class__.__name__
+            print(f"Error starting Whisper workers: {self.error}")
+        finally:
+            self.loading = False
+            self.last_used = time.monotonic()
+
+    async def ensure_ready(self):
+        """Load the model on first use, once however many callers are waiting"""
+        # Created here rather than in __init__, which runs outside the event loop
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if not self.ready and self.error is None:
+                await self.warm_up()
+        if self.error is not None:
+            raise RuntimeError(self.error)
+
+    @property
+    def available(self) -> bool:
+        """False once the pool has failed (e.g. the model could not be loaded)"""
+        return self.error is None
+
+    @property
+    def waiting(self) -> int:
+        """Number of transcriptions queued behind the running ones"""
+        return max(0, self.active - self.pool_size)
+
+    @property
+    def full(self) -> bool:
+        """True when pool_size transcriptions run and queue_size more are queued"""
+        return self.active >= self.pool_size + self.queue_size
+
+    @property
+    def loaded(self) -> bool:
+        """True while the worker processes (and their models) are running"""
+        return self._executor is not None
+
+    @property
+    def idle_seconds(self) -> float:
+        """Time since the last transcription finished (or the model was loaded)"""
+        return 0.0 if self.active or self.loading else time.monotonic() - self.last_used
+
+    def status(self) -> Dict:
+        """State and timings reported on /health"""
+        return {
+            "loaded": self.loaded,
+            "ready": self.ready,
+            "loading": self.loading,
+            "workers": self.pool_size,
+            "active": self.active,
+            "waiting": self.waiting,
+            "queue_size": self.queue_size,
+            "load_seconds": self.load_seconds,
+            "warm_up_seconds": self.warm_up_seconds,
+            "idle_seconds": round(self.idle_seconds, 1),
+            "error": self.error
+        }
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Take a transcription slot, or raise TranscriptionQueueFull if none is left.
+
+        Callers never wait for a slot: pool_size transcriptions run and up
+        to queue_size more wait in the executor, so waiting is the whole
+        backlog.
+        """
+        if self.full:
+            raise TranscriptionQueueFull(
+                f"Transcription queue for model '{self.model_name}' is full "
+                f"({self.pool_size} running, {self.waiting} queued)"
+            )
+        self.start()
+        executor = self._executor
+        self.active += 1
+        try:
+            yield
+        except BrokenProcessPool as e:
+            self._discard_executor(executor, e)
+            raise
+        finally:
+            self.active -= 1
+            self.last_used = time.monotonic()
+
+    def _discard_executor(self, executor: ProcessPoolExecutor, error: Exception):
+        """Drop a pool whose worker died (e.g. killed for memory); the next call starts a new one"""
+        if self._executor is not executor:
+            return
+        print(f"Whisper worker pool for model '{self.model_name}' crashed ({error}), restarting it")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.ready = False
+
+    async def transcribe(self, audio_path: str, **options) -> Dict:
+        """Transcribe in worker processes without blocking the event loop.
+
+        Returns the text, the timestamped segments and the audio duration
+        in seconds.
+        """
+        await self.ensure_ready()
+        async with self._slot():
+            if self.vad:
+                return await self._transcribe_speech_segments(audio_path, options)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, _transcribe, audio_path, options)
+
+    async def transcribe_batch(self, audio_paths: List[str], batch_size: int = 8, **options) -> List:
+        """Transcribe several files together, batching windows across files.
+
+        Returns one entry per path: the text and segments, or the exception
+        that file raised (e.g. AudioDecodeError), so one bad file does not
+        fail the others.
+        """
+        await self.ensure_ready()
+        async with self._slot():
+            return await self._transcribe_batched_windows(audio_paths, max(1, batch_size), options)
+
+    async def _transcribe_speech_segments(self, audio_path: str, options: Dict) -> Dict:
+        """Drop silence, then transcribe the speech segments in parallel"""
+        import numpy as np
+        from vad import detect_speech, plan_segments
+
+        loop = asyncio.get_running_loop()
+        audio = await asyncio.to_thread(decode_audio, audio_path)
+        regions = await asyncio.to_thread(detect_speech, audio, SAMPLE_RATE)
+        segments = plan_segments(regions, SAMPLE_RATE, self.max_segment_seconds)
+
+        duration = round(len(audio) / SAMPLE_RATE, 2)
+        speech_seconds = sum(end - start for start, end in segments) / SAMPLE_RATE
+        print(f"VAD: {len(segments)} segment(s), {speech_seconds:.0f}s of speech "
+              f"in {duration:.0f}s of audio")
+        if not segments:
+            return {"text": "", "segments": [], "duration": duration}
+
+        # Workers read their slice straight from shared memory instead of
+        # receiving a pickled copy
+        shm = shared_memory.SharedMemory(create=True, size=audio.nbytes)
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+            total_samples = len(audio)
+            del audio
+
+            results: List[Dict] = await asyncio.gather(*[
+                loop.run_in_executor(
+                    self._executor, _transcribe_segment, shm.name, total_samples, start, end, options
+                )
+                for start, end in segments
+            ])
+        finally:
+            shm.close()
+            shm.unlink()
+
+        # gather keeps submission order, so the text is stitched chronologically
+        return {
+            "text": " ".join(result["text"] for result in results if result["text"]),
+            "segments": [segment for result in results for segment in result["segments"]],
+            "duration": duration
+        }
+
+    async def _transcribe_batched_windows(self, audio_paths: List[str], batch_size: int,
+                                          options: Dict) -> List:
+        """Cut every file into speech windows and decode them batch_size at a time"""
+        import numpy as np
+        from vad import detect_speech, plan_segments
+
+        loop = asyncio.get_running_loop()
+        decoded = await asyncio.gather(*[
+            asyncio.to_thread(decode_audio, path) for path in audio_paths
+        ], return_exceptions=True)
+
+        errors = [audio if isinstance(audio, Exception) else None for audio in decoded]
+        durations = [None if isinstance(audio, Exception) else round(len(audio) / SAMPLE_RATE, 2)
+                     for audio in decoded]
+
+        # Lay all files out in one shared buffer and collect (file, start, end)
+        # windows in buffer coordinates
+        offsets = []
+        windows = []
+        total_samples = 0
+        for index, audio in enumerate(decoded):
+            offsets.append(total_samples)
+            if isinstance(audio, Exception):
+                continue
+            regions = detect_speech(audio, SAMPLE_RATE) if self.vad else [(0, len(audio))]
+            for start, end in plan_segments(regions, SAMPLE_RATE, WINDOW_SECONDS):
+                windows.append((index, total_samples + start, total_samples + end))
+            total_samples += len(audio)
+
+        window_results = []
+        if windows:
+            shm = shared_memory.SharedMemory(create=True, size=total_samples * 4)
+            try:
+                buffer = np.ndarray((total_samples,), dtype=np.float32, buffer=shm.buf)
+                for index, audio in enumerate(decoded):
+                    if not isinstance(audio, Exception):
+                        buffer[offsets[index]:offsets[index] + len(audio)] = audio
+                del buffer, decoded
+
+                batches = [windows[i:i + batch_size] for i in range(0, len(windows), batch_size)]
+                print(f"Batch transcription: {len(audio_paths)} file(s), {len(windows)} window(s) "
+                      f"in {len(batches)} batch(es)")
+                batch_results = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        self._executor, _transcribe_windows, shm.name, total_samples,
+                        [(start, end) for _, start, end in batch], options
+                    )
+                    for batch in batches
+                ])
+                window_results = [result for batch in batch_results for result in batch]
+            finally:
+                shm.close()
+                shm.unlink()
+
+        results = [error or {"text": "", "segments": [], "duration": duration}
+                   for error, duration in zip(errors, durations)]
+        for (index, start, end), result in zip(windows, window_results):
+            # Same rule Whisper uses to drop text hallucinated over silence
+            if not result["text"] or (result["no_speech_prob"] > 0.6 and result["avg_logprob"] < -1):
+                continue
+            results[index]["segments"].append({
+                "start": round((start - offsets[index]) / SAMPLE_RATE, 2),
+                "end": round((end - offsets[index]) / SAMPLE_RATE, 2),
+                "text": result["text"],
+                "avg_logprob": result["avg_logprob"]
+            })
+        for result in results:
+            if not isinstance(result, Exception):
+                result["text"] = " ".join(segment["text"] for segment in result["segments"])
+        return results
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.ready = False
+
+
+class WhisperModelRegistry:
+    """Transcription pools per Whisper model, loaded on first use and unloaded when idle"""
+
+    def __init__(self, default_model: str = "base", models: Optional[List[str]] = None,
+                 idle_timeout: float = 0, **pool_options):
+        self.default_model = default_model
+        self.models = [default_model] + [name for name in (models or []) if name != default_model]
+        self.idle_timeout = idle_timeout
+        self.pool_options = pool_options
+        self._pools: Dict[str, TranscriptionPool] = {}
+
+    def get(self, model_name: Optional[str] = None) -> TranscriptionPool:
+        """Pool for a model (the default one when model_name is empty)"""
+        model_name = model_name or self.default_model
+        if model_name not in self.models:
+            raise ValueError(f"Unsupported Whisper model '{model_name}'. Available: {', '.join(self.models)}")
+        if model_name not in self._pools:
+            self._pools[model_name] = TranscriptionPool(model_name, **self.pool_options)
+        return self._pools[model_name]
+
+    @property
+    def pools(self) -> List[TranscriptionPool]:
+        return list(self._pools.values())
+
+    async def preload(self, model_name: Optional[str] = None):
+        """Load a model in the background; failures are kept on the pool for /health"""
+        try:
+            await self.get(model_name).ensure_ready()
+        except Exception:
+            pass
+
+    async def unload_idle(self):
+        """Stop the workers of models unused for idle_timeout seconds to free their RAM"""
+        while True:
+            await asyncio.sleep(min(60, self.idle_timeout / 2))
+            for pool in self.pools:
+                if (pool.loaded and not pool.loading and not pool.active
+                        and pool.idle_seconds > self.idle_timeout):
+                    print(f"Unloading Whisper model '{pool.model_name}' after "
+                          f"{pool.idle_seconds:.0f}s idle")
+                    pool.shutdown()
+
+    def status(self) -> Dict:
+        """Per-model state and timings for /health"""
+        return {name: pool.status() for name, pool in self._pools.items()}
+
+    def shutdown(self):
+        """Stop every model's workers"""
+        for pool in self.pools:
+            pool.shutdown()
@@ -0,0 +1,81 @@
+from typing import List, Tuple
+
+import numpy as np
+
+FRAME_SECONDS = 0.03
+
+
+def detect_speech(audio: np.ndarray, sample_rate: int, min_silence_seconds: float = 0.5,
+                  min_speech_seconds: float = 0.25, padding_seconds: float = 0.2) -> List[Tuple[int, int]]:
+    """Find speech regions with a simple energy-based voice activity detector.
+
+    The threshold adapts to the recording: frames well above the quietest
+    10% (the noise floor) count as speech. Returns (start, end) sample ranges.
+    """
+    frame = int(sample_rate * FRAME_SECONDS)
+    frame_count = len(audio) // frame
+    if frame_count == 0:
+        return []
+
+    frames = audio[:frame_count * frame].reshape(frame_count, frame)
+    rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    db = 20 * np.log10(rms + 1e-10)
+
+    noise_floor = np.percentile(db, 10)
+    threshold = min(max(noise_floor + 15, -55), -30)
+    is_speech = db > threshold
+
+    # Runs of speech frames -> [start_frame, end_frame)
+    edges = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # Bridge short pauses so words are not cut apart
+    max_gap = int(min_silence_seconds / FRAME_SECONDS)
+    regions: List[List[int]] = []
+    for start, end in zip(starts, ends):
+        if regions and start - regions[-1][1] <= max_gap:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    min_frames = int(min_speech_seconds / FRAME_SECONDS)
+    padding = int(padding_seconds * sample_rate)
+    return [
+        (max(0, int(start) * frame - padding), min(len(audio), int(end) * frame + padding))
+        for start, end in regions
+        if end - start >= min_frames
+    ]
+
+
+def plan_segments(regions: List[Tuple[int, int]], sample_rate: int, max_segment_seconds: float = 180,
+                  split_silence_seconds: float = 5) -> List[Tuple[int, int]]:
+    """Group speech regions into segments that are transcribed independently.
+
+    A new segment starts at any silence longer than split_silence_seconds
+    (that silence is dropped) or when a segment would exceed
+    max_segment_seconds, so cuts fall on pauses. Only a region that is
+    itself longer than max_segment_seconds (e.g. constant background
+    noise) is cut at fixed intervals.
+    """
+    max_length = int(max_segment_seconds * sample_rate)
+    split_gap = int(split_silence_seconds * sample_rate)
+    segments: List[List[int]] = []
+
+    pieces = []
+    for start, end in regions:
+        while end - start > max_length:
+            pieces.append((start, start + max_length))
+            start += max_length
+        pieces.append((start, end))
+
+    for start, end in pieces:
+        if segments:
+            current = segments[-1]
+            gap = start - current[1]
+            if gap <= split_gap and end - current[0] <= max_length:
+                current[1] = max(current[1], end)
+                continue
+        segments.append([start, end])
+
+    return [(start, end) for start, end in segments]